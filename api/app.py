@@ -4,20 +4,40 @@ LexiScan Auto — FastAPI REST API
 Production API for the automated extraction of legal entities from PDFs.
 """
 
+import asyncio
+import json
 import os
-import shutil
+import queue
 import uuid
-from typing import Dict, List
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 
 import uvicorn
-from fastapi import FastAPI, File, HTTPException, UploadFile
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, File, HTTPException, Query, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
+from utils.cache import ResultCache, make_cache_key
 from utils.logger import configure_logger
-from ocr.ocr_engine import extract_text_from_pdf, clean_ocr_text, evaluate_text_quality
+from utils.metrics import CACHE_EVENTS, DOCUMENT_BYTES, QUEUE_DEPTH, REGISTRY
 from ner.inference import NERInference
+from ocr.ocr_engine import (
+    AdaptiveDPI, discard_pdf_source, estimate_pdf_cost, get_ocr_backend, read_pdf_source,
+    spill_settings,
+)
+from api.jobs import JobStore, start_workers, stop_workers
+from api.worker_pool import (
+    CostLimitExceededError,
+    ExtractionPool,
+    PoolSaturatedError,
+    run_ner_on_ocr_results,
+    run_ocr,
+    run_pipeline,
+    run_pipeline_streaming,
+    run_text_pipeline,
+    set_worker_engine,
+)
 
 logger = configure_logger("LexiScanAuto.API")
 
@@ -38,20 +58,148 @@ app.add_middleware(
 # ── Global ML Engines ──────────────────────────────────────────────────────
 
 ner_engine = None
+models_warm = False
+pipeline_pool = None
+result_cache = None
+job_store = None
+job_workers = []
+
+_WARMUP_TEXT = (
+    "This Agreement is entered into on October 12, 2023 between Acme Corp "
+    "and John Doe for $50,000.00 under the laws of the State of New York."
+)
+
+
+def load_engine():
+    """Load and warm up the NER engine once per process tree.
+
+    Idempotent: when a pre-fork master (``python -m api.serve``) has already
+    loaded the engine, forked workers reuse it copy-on-write instead of
+    loading their own.
+    """
+    global ner_engine, models_warm
+    if ner_engine is not None:
+        return ner_engine
 
-@app.on_event("startup")
-def load_models():
-    """Load ML engines into memory on startup."""
-    global ner_engine
     try:
         logger.info("Initializing NER components...")
-        ner_engine = NERInference()
+        ner_engine = NERInference(
+            model_dir=os.environ.get("LEXISCAN_NER_MODEL_DIR") or None,
+            batch_size=int(os.environ.get("LEXISCAN_NER_BATCH_SIZE", "32")),
+            n_process=int(os.environ.get("LEXISCAN_NER_N_PROCESS", "1")),
+            profile=os.environ.get("LEXISCAN_NER_PROFILE", "ner"),
+            fallback_policy=os.environ.get("LEXISCAN_NER_FALLBACK", "always"),
+            chunk_chars=int(os.environ.get("LEXISCAN_NER_CHUNK_CHARS", "20000")),
+            chunk_overlap=int(os.environ.get("LEXISCAN_NER_CHUNK_OVERLAP", "400")),
+            use_matcher=os.environ.get("LEXISCAN_NER_MATCHER", "1") != "0",
+        )
         logger.info("Successfully loaded ML engines.")
     except Exception as exc:
         logger.error(f"Failed to load ML engines on startup: {exc}")
         logger.warning("API will load without an active NER model.")
+        return None
+
+    # One full inference pass allocates spaCy's lazy buffers up front, so
+    # that memory is shared too and the first real request is not slow.
+    try:
+        ner_engine.extract_grouped(_WARMUP_TEXT)
+        models_warm = True
+        logger.info("NER warmup inference complete.")
+    except Exception as exc:
+        logger.error(f"NER warmup inference failed: {exc}")
+    return ner_engine
+
+
+@app.on_event("startup")
+def load_models():
+    """Load ML engines into memory on startup."""
+    global pipeline_pool, result_cache, job_store, job_workers
+    load_engine()
+
+    # Register the engine before the pool starts so forked workers share it.
+    set_worker_engine(ner_engine)
+    pipeline_pool = ExtractionPool.from_env()
+    result_cache = ResultCache.from_env()
+
+    # Durable job queue + warm job workers (forked after the engine loads)
+    job_store = JobStore.from_env()
+    job_workers = start_workers(
+        int(os.environ.get("LEXISCAN_JOB_WORKERS", "1")), job_store.db_path,
+        pipeline_pool.cpu_budget,
+    )
 
-# ── Response Schema ───────────────────────────────────────────────────────
+
+@app.on_event("shutdown")
+def close_cache():
+    """Close the result cache database."""
+    if result_cache is not None:
+        result_cache.close()
+
+
+@app.on_event("shutdown")
+def stop_job_workers():
+    """Stop embedded job workers and re-queue the jobs they were running."""
+    stop_workers(job_workers, job_store.db_path if job_store is not None else None)
+    if job_store is not None:
+        job_store.close()
+
+
+@app.on_event("shutdown")
+def shutdown_pool():
+    """Stop the extraction pool workers."""
+    if pipeline_pool is not None:
+        pipeline_pool.shutdown()
+
+# ── Upload Handling ───────────────────────────────────────────────────────
+
+# Uploads are processed from memory; only payloads above this size are
+# spilled to a temporary file (works on read-only container filesystems
+# as long as LEXISCAN_SPILL_DIR, or the system temp dir, is writable).
+SPILL_THRESHOLD, SPILL_DIR = spill_settings()
+
+
+async def _read_upload(file: UploadFile) -> Union[str, bytes]:
+    """Read an upload as bytes, or as a temp path when above the threshold."""
+    source = await run_in_threadpool(read_pdf_source, file.file, SPILL_THRESHOLD, SPILL_DIR)
+    DOCUMENT_BYTES.observe(len(source) if isinstance(source, bytes) else os.path.getsize(source))
+    return source
+
+# Relative cost of a page that needs Tesseract vs. one with native text
+OCR_PAGE_COST = float(os.environ.get("LEXISCAN_OCR_PAGE_COST", "20"))
+OCR_PAGE_WORKERS = int(os.environ.get("LEXISCAN_OCR_PAGE_WORKERS", "1"))
+# Rasterisation DPI of scanned pages, and the optional cheaper first pass
+OCR_DPI = int(os.environ.get("LEXISCAN_OCR_DPI", "300"))
+OCR_ADAPTIVE_DPI = AdaptiveDPI.from_env()
+
+
+async def _estimate_cost(source: Union[str, bytes]) -> float:
+    """Cheap page-count / OCR-need probe used to schedule the upload.
+
+    Unreadable PDFs get the minimum cost so the pipeline reports the real
+    error instead of the probe.
+    """
+    try:
+        estimate = await run_in_threadpool(estimate_pdf_cost, source, OCR_PAGE_COST)
+    except Exception as exc:
+        logger.warning(f"Could not estimate document cost: {exc}")
+        return 1.0
+    return estimate.cost
+
+
+def _cost_limit_error(exc: CostLimitExceededError, pdf: bool = True) -> HTTPException:
+    hint = "Submit it through /jobs instead." if pdf else "Send smaller or fewer texts per request."
+    return HTTPException(status_code=413, detail=f"{exc} {hint}")
+
+# Plain-text inputs are scheduled as if every this-many characters were one
+# native PDF page
+TEXT_CHARS_PER_PAGE = 3000
+
+# ── Request / Response Schema ─────────────────────────────────────────────
+
+class TextExtractionRequest(BaseModel):
+    text: str
+    filename: str = "document.txt"
+    document_id: Optional[str] = None
 
 class ExtractionResponse(BaseModel):
     document_id: str
@@ -59,6 +207,16 @@ class ExtractionResponse(BaseModel):
     metrics: Dict[str, float]
     entities: Dict[str, List[str]]
 
+class JobStatusResponse(BaseModel):
+    job_id: str
+    status: str
+    filename: str
+    attempts: int
+    created_at: float
+    updated_at: float
+    result: Optional[ExtractionResponse] = None
+    error: Optional[str] = None
+
 # ── Endpoints ─────────────────────────────────────────────────────────────
 
 @app.get("/")
@@ -66,10 +224,43 @@ def health_check():
     return {
         "status": "ok",
         "service": "LexiScan Auto API",
-        "ner_model_loaded": ner_engine is not None
+        "ner_model_loaded": ner_engine is not None,
+        "pool": pipeline_pool.stats() if pipeline_pool else None,
+        "cache": result_cache.stats() if result_cache else None,
+        "jobs": job_store.counts() if job_store else None,
     }
 
 
+@app.get("/ready")
+def readiness_check():
+    """Readiness probe: 200 only once models are loaded and warmed up."""
+    ready = bool(ner_engine is not None and models_warm and pipeline_pool is not None)
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={"ready": ready, "ner_model_loaded": ner_engine is not None, "warm": models_warm},
+    )
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    """Prometheus metrics: per-stage latency, pages, OCR fallback, queues, cache."""
+    if pipeline_pool is not None:
+        QUEUE_DEPTH.set(pipeline_pool.inflight, queue="pool")
+        QUEUE_DEPTH.set(pipeline_pool.pending, queue="pool_pending")
+    if job_store is not None:
+        counts = job_store.counts()
+        QUEUE_DEPTH.set(counts["queued"], queue="jobs_queued")
+        QUEUE_DEPTH.set(counts["running"], queue="jobs_running")
+    if result_cache is not None:
+        stats = result_cache.stats()
+        for event in ("hits", "disk_hits", "misses", "evictions", "disk_evictions"):
+            CACHE_EVENTS.set(stats[event], event=event)
+
+    return PlainTextResponse(
+        REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
 @app.post("/extract", response_model=ExtractionResponse)
 async def extract_document(file: UploadFile = File(...)):
     """Process a PDF contract pipeline: OCR → NER → Rules → JSON."""
@@ -79,30 +270,48 @@ async def extract_document(file: UploadFile = File(...)):
             detail="Invalid file type. Only PDF files are supported."
         )
 
-    if not ner_engine:
+    if not ner_engine or not pipeline_pool:
         raise HTTPException(
             status_code=503,
             detail="NER model not loaded. Please train the model and restart the server."
         )
 
     doc_id = str(uuid.uuid4())
-    temp_dir = os.path.join("data", "raw")
-    os.makedirs(temp_dir, exist_ok=True)
-    
-    temp_path = os.path.join(temp_dir, f"temp_{doc_id}.pdf")
+    source: Union[str, bytes] = b""
 
     try:
-        # 1. Save uploaded file to disk explicitly
-        with open(temp_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        # 1. Read the upload (in memory unless it exceeds the spill threshold)
+        source = await _read_upload(file)
 
         logger.info(f"Processing uploaded document: {file.filename} (ID: {doc_id})")
 
-        # 2. OCR Pipeline
-        logger.info("Running OCR pipeline...")
-        raw_text = extract_text_from_pdf(temp_path, dpi=300)
-        clean_text = clean_ocr_text(raw_text)
-        metrics = evaluate_text_quality(clean_text)
+        # 2. Content-addressed cache: identical PDF + model + OCR settings
+        cache_key = None
+        cached = None
+        if result_cache is not None:
+            cache_key = await run_in_threadpool(
+                make_cache_key, source,
+                model=ner_engine.model_version, dpi=OCR_DPI, force_ocr=False,
+                adaptive_dpi=OCR_ADAPTIVE_DPI, backend=getattr(get_ocr_backend(), "name", None),
+            )
+            cached = await run_in_threadpool(result_cache.get, cache_key)
+
+        if cached is not None:
+            logger.info(f"Result cache hit for {file.filename}.")
+            metrics, structured_entities = cached["metrics"], cached["entities"]
+        else:
+            # 3. OCR → NER → Rules in the worker pool (keeps the event loop free)
+            # Small documents are scheduled ahead of large scans
+            cost = await _estimate_cost(source)
+            logger.info(f"Running OCR, NER inference and validation rules (cost {cost:.0f})...")
+            metrics, structured_entities = await pipeline_pool.run(
+                run_pipeline, source, OCR_DPI, OCR_PAGE_WORKERS, OCR_ADAPTIVE_DPI, cost=cost,
+            )
+            if result_cache is not None:
+                await run_in_threadpool(
+                    result_cache.put, cache_key,
+                    {"metrics": metrics, "entities": structured_entities},
+                )
 
         if metrics["noise_ratio"] > 0.5:
             logger.warning(
@@ -110,10 +319,6 @@ async def extract_document(file: UploadFile = File(...)):
                 f"for Document ID {doc_id}."
             )
 
-        # 3. NER + Rule-based validation + Grouping
-        logger.info("Running NER inference and validation rules...")
-        structured_entities = ner_engine.extract_grouped(clean_text)
-
         logger.info(f"Successfully processed {file.filename}.")
         
         return ExtractionResponse(
@@ -123,6 +328,18 @@ async def extract_document(file: UploadFile = File(...)):
             entities=structured_entities
         )
 
+    except CostLimitExceededError as exc:
+        logger.warning(f"Rejected {file.filename}: {exc}")
+        raise _cost_limit_error(exc)
+
+    except PoolSaturatedError as exc:
+        logger.warning(f"Rejected {file.filename}: extraction pool is saturated.")
+        raise HTTPException(
+            status_code=503,
+            detail="Server is busy processing other documents. Please retry later.",
+            headers={"Retry-After": str(exc.retry_after)},
+        )
+
     except Exception as exc:
         logger.error(f"Error processing document {file.filename}: {exc}")
         raise HTTPException(
@@ -131,9 +348,304 @@ async def extract_document(file: UploadFile = File(...)):
         )
 
     finally:
-        # Cleanup
-        if os.path.exists(temp_path):
-            os.remove(temp_path)
+        # Cleanup (only spilled uploads have a file behind them)
+        discard_pdf_source(source)
+
+
+def _ndjson(event: Dict[str, Any]) -> bytes:
+    return (json.dumps(event) + "\n").encode("utf-8")
+
+
+def _poll_events(events: "queue.Queue", timeout: float = 0.25) -> Optional[Dict[str, Any]]:
+    try:
+        return events.get(timeout=timeout)
+    except queue.Empty:
+        return None
+
+
+@app.post("/extract/stream")
+async def extract_document_stream(
+    file: UploadFile = File(...),
+    page_entities: bool = Query(False, description="Include per-page entities in page events"),
+):
+    """Streaming variant of ``/extract`` emitting NDJSON progress events.
+
+    One JSON object per line:
+
+    * ``{"event": "page", "page": n, "total_pages": N, "chars": …, "ocr": …}``
+      as each page finishes (plus ``"entities"`` if *page_entities*).
+    * ``{"event": "stage", "stage": "ner"}`` before whole-document NER.
+    * ``{"event": "result", ...ExtractionResponse}`` as the final record, or
+      ``{"event": "error", "detail": …}`` if the pipeline fails.
+    """
+    if not file.filename.lower().endswith(".pdf"):
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid file type. Only PDF files are supported."
+        )
+
+    if not ner_engine or not pipeline_pool:
+        raise HTTPException(
+            status_code=503,
+            detail="NER model not loaded. Please train the model and restart the server."
+        )
+
+    doc_id = str(uuid.uuid4())
+    source = await _read_upload(file)
+    cost = await _estimate_cost(source)
+    events = pipeline_pool.event_queue()
+
+    try:
+        # Admit before the 200 starts streaming so overload still gets a 503
+        # The pool task owns the source from here: it is discarded when
+        # the task stops reading it, even if the client disconnects first.
+        future = pipeline_pool.submit(
+            run_pipeline_streaming, source, OCR_DPI, events, page_entities,
+            OCR_PAGE_WORKERS, OCR_ADAPTIVE_DPI, cost=cost,
+            cleanup=lambda: discard_pdf_source(source),
+        )
+    except CostLimitExceededError as exc:
+        discard_pdf_source(source)
+        logger.warning(f"Rejected {file.filename}: {exc}")
+        raise _cost_limit_error(exc)
+    except PoolSaturatedError as exc:
+        discard_pdf_source(source)
+        logger.warning(f"Rejected {file.filename}: extraction pool is saturated.")
+        raise HTTPException(
+            status_code=503,
+            detail="Server is busy processing other documents. Please retry later.",
+            headers={"Retry-After": str(exc.retry_after)},
+        )
+
+    logger.info(f"Streaming extraction for {file.filename} (ID: {doc_id})")
+
+    async def event_stream() -> AsyncIterator[bytes]:
+        try:
+            while not future.done():
+                event = await run_in_threadpool(_poll_events, events)
+                if event is not None:
+                    yield _ndjson(event)
+            while True:
+                event = _poll_events(events, timeout=0)
+                if event is None:
+                    break
+                yield _ndjson(event)
+
+            metrics, entities = await future
+            result = ExtractionResponse(
+                document_id=doc_id,
+                filename=file.filename,
+                metrics=metrics,
+                entities=entities,
+            )
+            yield _ndjson({"event": "result", **result.model_dump()})
+        except Exception as exc:
+            logger.error(f"Error streaming document {file.filename}: {exc}")
+            yield _ndjson({
+                "event": "error",
+                "detail": f"Error executing extraction pipeline: {str(exc)}",
+            })
+
+    return StreamingResponse(event_stream(), media_type="application/x-ndjson")
+
+
+@app.post("/extract/batch", response_model=List[ExtractionResponse])
+async def extract_batch(files: List[UploadFile] = File(...)):
+    """Process many PDFs: parallel OCR, then one batched ``nlp.pipe`` NER pass."""
+    invalid = [f.filename for f in files if not f.filename.lower().endswith(".pdf")]
+    if invalid:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid file type for {invalid}. Only PDF files are supported."
+        )
+
+    if not ner_engine or not pipeline_pool:
+        raise HTTPException(
+            status_code=503,
+            detail="NER model not loaded. Please train the model and restart the server."
+        )
+
+    if len(files) > pipeline_pool.max_inflight:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Too many files in one batch (max {pipeline_pool.max_inflight})."
+        )
+
+    doc_ids = [str(uuid.uuid4()) for _ in files]
+    sources: List[Union[str, bytes]] = []
+
+    try:
+        for file in files:
+            sources.append(await _read_upload(file))
+
+        logger.info(f"Processing batch of {len(files)} documents...")
+
+        # 1. OCR every document in parallel, cheapest first, then
+        # 2. NER + Rules for the whole batch through nlp.pipe — admitted
+        #    together, so NER cannot be refused once OCR has run
+        costs = [await _estimate_cost(source) for source in sources]
+        ocr_results, grouped = await pipeline_pool.run_batch(
+            run_ocr,
+            [(source, OCR_DPI, OCR_PAGE_WORKERS, OCR_ADAPTIVE_DPI) for source in sources],
+            costs,
+            then=run_ner_on_ocr_results,
+        )
+
+        logger.info(f"Successfully processed batch of {len(files)} documents.")
+
+        return [
+            ExtractionResponse(
+                document_id=doc_id,
+                filename=file.filename,
+                metrics=metrics,
+                entities=entities,
+            )
+            for doc_id, file, (_, metrics), entities
+            in zip(doc_ids, files, ocr_results, grouped)
+        ]
+
+    except CostLimitExceededError as exc:
+        logger.warning(f"Rejected batch of {len(files)}: {exc}")
+        raise _cost_limit_error(exc)
+
+    except PoolSaturatedError as exc:
+        logger.warning(f"Rejected batch of {len(files)}: extraction pool is saturated.")
+        raise HTTPException(
+            status_code=503,
+            detail="Server is busy processing other documents. Please retry later.",
+            headers={"Retry-After": str(exc.retry_after)},
+        )
+
+    except Exception as exc:
+        logger.error(f"Error processing batch: {exc}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error executing extraction pipeline: {str(exc)}"
+        )
+
+    finally:
+        for source in sources:
+            discard_pdf_source(source)
+
+
+def _text_cache_key(text: str) -> str:
+    return make_cache_key(text.encode("utf-8"), model=ner_engine.model_version, input="text")
+
+
+async def _extract_texts(documents: List[TextExtractionRequest]) -> List[ExtractionResponse]:
+    """Cache lookup, then one pooled cleaning → NER → Rules pass for the misses."""
+    results: List[Optional[Dict[str, Any]]] = [None] * len(documents)
+    cache_keys: List[Optional[str]] = [None] * len(documents)
+
+    if result_cache is not None:
+        for idx, document in enumerate(documents):
+            cache_keys[idx] = _text_cache_key(document.text)
+            results[idx] = await run_in_threadpool(result_cache.get, cache_keys[idx])
+
+    misses = [idx for idx, cached in enumerate(results) if cached is None]
+    if misses:
+        texts = [documents[idx].text for idx in misses]
+        cost = max(1.0, sum(len(text) for text in texts) / TEXT_CHARS_PER_PAGE)
+        outputs = await pipeline_pool.run(run_text_pipeline, texts, cost=cost)
+        for idx, (metrics, entities) in zip(misses, outputs):
+            results[idx] = {"metrics": metrics, "entities": entities}
+            if result_cache is not None:
+                await run_in_threadpool(result_cache.put, cache_keys[idx], results[idx])
+
+    return [
+        ExtractionResponse(
+            document_id=document.document_id or str(uuid.uuid4()),
+            filename=document.filename,
+            metrics=result["metrics"],
+            entities=result["entities"],
+        )
+        for document, result in zip(documents, results)
+    ]
+
+
+@app.post("/extract/text", response_model=ExtractionResponse)
+async def extract_text_document(document: TextExtractionRequest):
+    """Run NER → Rules on text the caller already has, skipping PDF and OCR."""
+    responses = await extract_text_documents([document])
+    return responses[0]
+
+
+@app.post("/extract/text/batch", response_model=List[ExtractionResponse])
+async def extract_text_documents(documents: List[TextExtractionRequest]):
+    """Batched ``/extract/text``: one ``nlp.pipe`` pass over every text."""
+    if not ner_engine or not pipeline_pool:
+        raise HTTPException(
+            status_code=503,
+            detail="NER model not loaded. Please train the model and restart the server."
+        )
+
+    if len(documents) > pipeline_pool.max_inflight:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Too many documents in one batch (max {pipeline_pool.max_inflight})."
+        )
+
+    try:
+        logger.info(f"Processing {len(documents)} text document(s)...")
+        return await _extract_texts(documents)
+
+    except CostLimitExceededError as exc:
+        logger.warning(f"Rejected {len(documents)} text document(s): {exc}")
+        raise _cost_limit_error(exc, pdf=False)
+
+    except PoolSaturatedError as exc:
+        logger.warning(f"Rejected {len(documents)} text document(s): extraction pool is saturated.")
+        raise HTTPException(
+            status_code=503,
+            detail="Server is busy processing other documents. Please retry later.",
+            headers={"Retry-After": str(exc.retry_after)},
+        )
+
+    except Exception as exc:
+        logger.error(f"Error processing text documents: {exc}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error executing extraction pipeline: {str(exc)}"
+        )
+
+
+@app.post("/jobs", response_model=JobStatusResponse, status_code=202)
+async def submit_job(file: UploadFile = File(...)):
+    """Queue a PDF for background extraction and return its job id at once."""
+    if not file.filename.lower().endswith(".pdf"):
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid file type. Only PDF files are supported."
+        )
+
+    if not job_store:
+        raise HTTPException(status_code=503, detail="Job queue is not available.")
+
+    payload = await run_in_threadpool(file.file.read)
+    DOCUMENT_BYTES.observe(len(payload))
+    job_id = await run_in_threadpool(job_store.submit, file.filename, payload, OCR_DPI)
+    logger.info(f"Queued job {job_id} for {file.filename}.")
+    return await run_in_threadpool(job_store.get, job_id)
+
+
+@app.get("/jobs/{job_id}", response_model=JobStatusResponse)
+async def get_job(
+    job_id: str,
+    wait: float = Query(0.0, ge=0.0, le=60.0, description="Long-poll for up to this many seconds"),
+):
+    """Return job status and, once finished, the extraction result."""
+    if not job_store:
+        raise HTTPException(status_code=503, detail="Job queue is not available.")
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + wait
+    while True:
+        job = await run_in_threadpool(job_store.get, job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail=f"Job {job_id} not found.")
+        if job["status"] in ("done", "failed") or loop.time() >= deadline:
+            return job
+        await asyncio.sleep(0.5)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,403 @@
+"""
+LexiScan Auto — Asynchronous Extraction Jobs
+==============================================
+Durable job queue for documents that take longer than an HTTP timeout.
+
+* ``POST /jobs`` stores the PDF in a local SQLite queue and returns at once.
+* Warm worker processes — each holding one ``NERInference`` — claim queued
+  jobs, run the OCR → NER → Rules pipeline, and write the result back.
+* ``GET /jobs/{id}`` reports status and result, optionally long-polling.
+
+The queue lives on disk, so queued and finished jobs survive an API restart.
+Jobs of workers stopped by :func:`stop_workers` (shutdown, deploy) are
+re-queued at once.  A job whose worker stops heart-beating (crash, OOM
+kill) is re-queued after ``stale_after`` seconds, up to ``max_attempts``
+times.
+Any number of worker processes can share one queue file::
+
+    python -m api.jobs --workers 4
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+from utils.logger import configure_logger
+
+logger = configure_logger("LexiScanAuto.Jobs")
+
+JOB_STATUSES = ("queued", "running", "done", "failed")
+
+DEFAULT_JOBS_PATH = os.path.join("data", "jobs", "jobs.sqlite")
+
+
+# ───────────────────────────────────────────────────────────────────────────
+#  Durable queue
+# ───────────────────────────────────────────────────────────────────────────
+
+class JobStore:
+    """SQLite-backed job queue shared by the API and worker processes.
+
+    Open one ``JobStore`` per process — SQLite connections must not cross
+    a ``fork``.
+
+    Parameters
+    ----------
+    db_path : str
+        Queue database file (created if missing).
+    stale_after : float
+        Seconds without a heartbeat before a running job is re-queued.
+    max_attempts : int
+        Claims allowed per job before it is marked ``failed``.
+    """
+
+    def __init__(
+        self,
+        db_path: str = DEFAULT_JOBS_PATH,
+        stale_after: float = 600.0,
+        max_attempts: int = 3,
+    ):
+        self.db_path = db_path
+        self.stale_after = stale_after
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+
+        parent = os.path.dirname(db_path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+
+        self._conn = sqlite3.connect(
+            db_path, timeout=30, isolation_level=None, check_same_thread=False,
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " id TEXT PRIMARY KEY,"
+            " status TEXT NOT NULL,"
+            " filename TEXT NOT NULL,"
+            " dpi INTEGER NOT NULL,"
+            " payload BLOB,"
+            " result TEXT,"
+            " error TEXT,"
+            " attempts INTEGER NOT NULL DEFAULT 0,"
+            " worker TEXT,"
+            " created REAL NOT NULL,"
+            " updated REAL NOT NULL,"
+            " heartbeat REAL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, created)")
+
+    @classmethod
+    def from_env(cls) -> "JobStore":
+        """Build a store from ``LEXISCAN_JOBS_*`` environment variables."""
+        return cls(
+            db_path=os.environ.get("LEXISCAN_JOBS_PATH", DEFAULT_JOBS_PATH),
+            stale_after=float(os.environ.get("LEXISCAN_JOB_STALE_SECONDS", "600")),
+            max_attempts=int(os.environ.get("LEXISCAN_JOB_MAX_ATTEMPTS", "3")),
+        )
+
+    def submit(self, filename: str, payload: bytes, dpi: int = 300) -> str:
+        """Enqueue a PDF and return its job id."""
+        job_id = str(uuid.uuid4())
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (id, status, filename, dpi, payload, created, updated)"
+                " VALUES (?, 'queued', ?, ?, ?, ?, ?)",
+                (job_id, filename, dpi, payload, now, now),
+            )
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return the public view of a job (no payload), or ``None``."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id, status, filename, result, error, attempts, created, updated"
+                " FROM jobs WHERE id = ?",
+                (job_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "job_id": row["id"],
+            "status": row["status"],
+            "filename": row["filename"],
+            "attempts": row["attempts"],
+            "created_at": row["created"],
+            "updated_at": row["updated"],
+            "result": json.loads(row["result"]) if row["result"] else None,
+            "error": row["error"],
+        }
+
+    def claim(self, worker_id: str) -> Optional[Dict[str, Any]]:
+        """Atomically move the oldest queued job to ``running``.
+
+        Stale running jobs are recovered first, so a crashed worker's job
+        is picked up by whichever worker polls next.
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._recover_stale(now)
+                row = self._conn.execute(
+                    "SELECT id, filename, dpi, payload FROM jobs"
+                    " WHERE status = 'queued' ORDER BY created LIMIT 1"
+                ).fetchone()
+                if row is not None:
+                    self._conn.execute(
+                        "UPDATE jobs SET status = 'running', worker = ?,"
+                        " attempts = attempts + 1, updated = ?, heartbeat = ?"
+                        " WHERE id = ?",
+                        (worker_id, now, now, row["id"]),
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+        if row is None:
+            return None
+        return {
+            "job_id": row["id"],
+            "filename": row["filename"],
+            "dpi": row["dpi"],
+            "payload": row["payload"],
+        }
+
+    def _recover_stale(self, now: float) -> None:
+        cutoff = now - self.stale_after
+        self._conn.execute(
+            "UPDATE jobs SET status = 'failed', payload = NULL, updated = ?,"
+            " error = 'Worker stopped responding too many times.'"
+            " WHERE status = 'running' AND heartbeat < ? AND attempts >= ?",
+            (now, cutoff, self.max_attempts),
+        )
+        cur = self._conn.execute(
+            "UPDATE jobs SET status = 'queued', worker = NULL, updated = ?"
+            " WHERE status = 'running' AND heartbeat < ?",
+            (now, cutoff),
+        )
+        if cur.rowcount:
+            logger.warning(f"Re-queued {cur.rowcount} stale job(s).")
+
+    def requeue_worker(self, worker_id: str) -> int:
+        """Put the jobs *worker_id* was running back in the queue.
+
+        For workers stopped on purpose: the interrupted attempt is not
+        counted.  Returns the number of re-queued jobs.
+        """
+        with self._lock:
+            cur = self._conn.execute(
+                "UPDATE jobs SET status = 'queued', worker = NULL, attempts = MAX(attempts - 1, 0),"
+                " updated = ? WHERE status = 'running' AND worker = ?",
+                (time.time(), worker_id),
+            )
+        return cur.rowcount
+
+    def heartbeat(self, job_id: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET heartbeat = ? WHERE id = ? AND status = 'running'",
+                (time.time(), job_id),
+            )
+
+    def complete(self, job_id: str, result: Dict[str, Any]) -> None:
+        """Store the result and drop the payload."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = 'done', result = ?, payload = NULL,"
+                " updated = ? WHERE id = ?",
+                (json.dumps(result), time.time(), job_id),
+            )
+
+    def fail(self, job_id: str, error: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = 'failed', error = ?, payload = NULL,"
+                " updated = ? WHERE id = ?",
+                (error, time.time(), job_id),
+            )
+
+    def counts(self) -> Dict[str, int]:
+        """Number of jobs per status."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) FROM jobs GROUP BY status"
+            ).fetchall()
+        counts = {status: 0 for status in JOB_STATUSES}
+        counts.update({status: n for status, n in rows})
+        return counts
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# ───────────────────────────────────────────────────────────────────────────
+#  Workers
+# ───────────────────────────────────────────────────────────────────────────
+
+def _worker_id(pid: int) -> str:
+    return f"{socket.gethostname()}:{pid}"
+
+
+def process_next_job(store: JobStore, worker_id: str, heartbeat_interval: float = 15.0) -> bool:
+    """Claim and run one job.  Returns *False* if the queue was empty."""
+    from api.worker_pool import run_pipeline
+    from ocr.ocr_engine import AdaptiveDPI
+
+    job = store.claim(worker_id)
+    if job is None:
+        return False
+
+    job_id = job["job_id"]
+    logger.info(f"[{worker_id}] Processing job {job_id} ({job['filename']})")
+
+    stop = threading.Event()
+
+    def beat():
+        while not stop.wait(heartbeat_interval):
+            store.heartbeat(job_id)
+
+    beater = threading.Thread(target=beat, daemon=True)
+    beater.start()
+    try:
+        page_workers = int(os.environ.get("LEXISCAN_OCR_PAGE_WORKERS", "1"))
+        metrics, entities = run_pipeline(
+            job["payload"], job["dpi"], page_workers, AdaptiveDPI.from_env(),
+        )
+        store.complete(job_id, {
+            "document_id": job_id,
+            "filename": job["filename"],
+            "metrics": metrics,
+            "entities": entities,
+        })
+        logger.info(f"[{worker_id}] Job {job_id} done.")
+    except Exception as exc:
+        logger.error(f"[{worker_id}] Job {job_id} failed: {exc}")
+        store.fail(job_id, str(exc))
+    finally:
+        stop.set()
+        beater.join()
+    return True
+
+
+def run_worker(
+    db_path: str = DEFAULT_JOBS_PATH,
+    poll_interval: float = 1.0,
+    cpu_budget=None,
+) -> None:
+    """Worker loop: keep one warm NER engine and drain the queue forever.
+
+    *cpu_budget* is the OCR CPU semaphore shared with the extraction pool.
+    """
+    from api.worker_pool import _init_worker
+
+    worker_id = _worker_id(os.getpid())
+    _init_worker(cpu_budget)  # loads the engine unless inherited through fork
+    store = JobStore(
+        db_path,
+        stale_after=float(os.environ.get("LEXISCAN_JOB_STALE_SECONDS", "600")),
+        max_attempts=int(os.environ.get("LEXISCAN_JOB_MAX_ATTEMPTS", "3")),
+    )
+    logger.info(f"Job worker {worker_id} ready (queue: {db_path}).")
+
+    while True:
+        try:
+            if not process_next_job(store, worker_id):
+                time.sleep(poll_interval)
+        except sqlite3.Error as exc:
+            logger.error(f"[{worker_id}] Queue error: {exc}")
+            time.sleep(poll_interval)
+
+
+def start_worker_process(target, args: tuple = ()) -> multiprocessing.Process:
+    """Start a job worker process.
+
+    Not a daemon: daemon processes may not have children, and a job worker
+    needs them for parallel page OCR (``LEXISCAN_OCR_PAGE_WORKERS``).  The
+    owner must therefore stop it with :func:`stop_workers`.
+    """
+    proc = multiprocessing.Process(target=target, args=args, daemon=False)
+    proc.start()
+    return proc
+
+
+def start_workers(
+    count: int,
+    db_path: str = DEFAULT_JOBS_PATH,
+    cpu_budget=None,
+) -> List[multiprocessing.Process]:
+    """Launch *count* worker processes sharing *db_path* and *cpu_budget*."""
+    return [
+        start_worker_process(run_worker, (db_path, 1.0, cpu_budget))
+        for _ in range(count)
+    ]
+
+
+def stop_workers(
+    workers: List[multiprocessing.Process],
+    db_path: Optional[str] = None,
+    timeout: float = 10.0,
+) -> None:
+    """Terminate *workers*, wait for them, and re-queue the jobs they held.
+
+    With *db_path* (the queue the workers served) their running jobs go
+    straight back to ``queued`` instead of waiting ``stale_after`` seconds.
+    """
+    for proc in workers:
+        proc.terminate()
+    for proc in workers:
+        proc.join(timeout)
+        if proc.is_alive():
+            proc.kill()
+            proc.join()
+
+    if db_path is None or not workers:
+        return
+    store = JobStore(db_path)
+    try:
+        requeued = sum(store.requeue_worker(_worker_id(proc.pid)) for proc in workers)
+    finally:
+        store.close()
+    if requeued:
+        logger.info(f"Re-queued {requeued} job(s) of stopped workers.")
+
+
+# ───────────────────────────────────────────────────────────────────────────
+#  CLI entry point
+# ───────────────────────────────────────────────────────────────────────────
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="LexiScan Auto job workers")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes to run")
+    parser.add_argument(
+        "--db", type=str,
+        default=os.environ.get("LEXISCAN_JOBS_PATH", DEFAULT_JOBS_PATH),
+        help="Path to the job queue database",
+    )
+    args = parser.parse_args()
+
+    # Load the engine once so forked workers share it copy-on-write
+    from api.worker_pool import _init_worker
+    from ocr.ocr_engine import make_cpu_budget
+    _init_worker()
+
+    cpu_budget = os.environ.get("LEXISCAN_OCR_CPU_BUDGET")
+    procs = start_workers(
+        args.workers, args.db, make_cpu_budget(int(cpu_budget) if cpu_budget else None),
+    )
+    try:
+        for proc in procs:
+            proc.join()
+    except KeyboardInterrupt:
+        stop_workers(procs, args.db)
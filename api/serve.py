@@ -0,0 +1,174 @@
+"""
+LexiScan Auto — Pre-Fork Server
+=================================
+Serving mode in which a master process loads (and warms up) ``NERInference``
+exactly once, then forks the uvicorn workers.  The workers share the model
+memory copy-on-write instead of each paying for its own custom pipeline and
+``en_core_web_sm`` — RSS per additional worker drops to its private heap.
+
+The master:
+
+1. binds the listening socket,
+2. loads the NER engine and runs warmup inference,
+3. ``gc.freeze()``-s the heap so garbage-collector passes in the children do
+   not touch (and therefore copy) the shared model pages,
+4. starts the embedded job workers once, then forks ``--workers`` API
+   processes that all ``accept()`` on the shared socket, each with an
+   extraction pool of ``cpu_count / workers`` processes (unless
+   ``LEXISCAN_POOL_WORKERS`` is set),
+5. re-forks any API worker and restarts any job worker that dies, and
+   forwards ``SIGTERM``/``SIGINT``.
+
+Usage (POSIX only)::
+
+    python -m api.serve --workers 4 --port 8000
+"""
+
+import argparse
+import gc
+import os
+import signal
+import socket
+import sys
+import time
+from typing import Dict
+
+import uvicorn
+
+from utils.logger import configure_logger
+
+logger = configure_logger("LexiScanAuto.Serve")
+
+# Seconds between checks for dead API / job workers
+_SUPERVISE_INTERVAL = 1.0
+
+
+def _bind_socket(host: str, port: int, backlog: int = 2048) -> socket.socket:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _run_worker(sock: socket.socket, log_level: str) -> None:
+    """Child process body: serve the already-imported app on *sock*."""
+    from api.app import app
+
+    config = uvicorn.Config(app, log_level=log_level, lifespan="on")
+    server = uvicorn.Server(config)
+    server.run(sockets=[sock])
+
+
+def _fork_worker(sock: socket.socket, log_level: str) -> int:
+    pid = os.fork()
+    if pid == 0:
+        code = 0
+        try:
+            _run_worker(sock, log_level)
+        except BaseException as exc:
+            logger.error(f"Worker {os.getpid()} crashed: {exc}")
+            code = 1
+        finally:
+            os._exit(code)
+    return pid
+
+
+def serve(host: str, port: int, workers: int, log_level: str = "info") -> None:
+    """Load models once, then fork and supervise *workers* API processes."""
+    if not hasattr(os, "fork"):
+        raise RuntimeError("Pre-fork serving requires a POSIX platform; use uvicorn --workers.")
+
+    import api.app as app_module
+    from api.jobs import DEFAULT_JOBS_PATH, start_workers, stop_workers
+    from ocr.ocr_engine import make_cpu_budget, set_cpu_budget
+
+    sock = _bind_socket(host, port)
+    logger.info(f"Master {os.getpid()} listening on {host}:{port}")
+
+    app_module.load_engine()
+
+    # One OCR CPU budget for the whole machine: every forked API worker
+    # inherits it (``ExtractionPool.from_env`` shares it) and so do the job
+    # workers.
+    slots = os.environ.get("LEXISCAN_OCR_CPU_BUDGET")
+    cpu_budget = make_cpu_budget(int(slots) if slots else None)
+    set_cpu_budget(cpu_budget)
+
+    # Job workers are started once by the master (sharing the engine too)
+    # instead of once per API worker.
+    jobs_path = os.environ.get("LEXISCAN_JOBS_PATH", DEFAULT_JOBS_PATH)
+    job_workers = start_workers(
+        int(os.environ.get("LEXISCAN_JOB_WORKERS", "1")), jobs_path, cpu_budget,
+    )
+    os.environ["LEXISCAN_JOB_WORKERS"] = "0"
+    # Split the CPUs between the API workers' pools instead of giving each
+    # of them cpu_count processes.
+    os.environ.setdefault("LEXISCAN_POOL_WORKERS", str(max(1, (os.cpu_count() or 1) // workers)))
+
+    # Move everything loaded so far into the permanent generation so that
+    # GC passes in the children never write to the shared model pages.
+    gc.collect()
+    gc.freeze()
+
+    children: Dict[int, int] = {}
+    for slot in range(workers):
+        children[_fork_worker(sock, log_level)] = slot
+    logger.info(f"Forked {workers} API workers sharing one NER engine.")
+
+    stopping = False
+
+    def _stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, _stop)
+    signal.signal(signal.SIGINT, _stop)
+
+    # Wait on the known API worker pids only: ``waitpid(-1)`` would also
+    # reap job workers, whose deaths must be handled separately.
+    while children:
+        for pid in list(children):
+            try:
+                done, status = os.waitpid(pid, os.WNOHANG)
+            except ChildProcessError:
+                done, status = pid, -1
+            if done == 0:
+                continue
+            slot = children.pop(pid)
+            if not stopping:
+                logger.warning(f"Worker {pid} exited (status {status}); re-forking slot {slot}.")
+                children[_fork_worker(sock, log_level)] = slot
+
+        if not stopping:
+            for idx, proc in enumerate(job_workers):
+                if not proc.is_alive():
+                    logger.warning(f"Job worker {proc.pid} exited ({proc.exitcode}); restarting it.")
+                    job_workers[idx] = start_workers(1, jobs_path, cpu_budget)[0]
+
+        time.sleep(_SUPERVISE_INTERVAL)
+
+    stop_workers(job_workers, jobs_path)
+    sock.close()
+    logger.info("Master shut down.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="LexiScan Auto pre-fork API server")
+    parser.add_argument("--host", type=str, default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--log-level", type=str, default="info")
+    args = parser.parse_args()
+
+    try:
+        serve(args.host, args.port, args.workers, args.log_level)
+    except RuntimeError as exc:
+        logger.error(str(exc))
+        sys.exit(1)
@@ -0,0 +1,611 @@
+"""
+LexiScan Auto — Pipeline Worker Pool
+======================================
+Runs the blocking OCR → NER → Rules pipeline off the asyncio event loop so
+that a single long scan cannot stall every other request on the worker.
+
+* **Process mode** (default) — a ``ProcessPoolExecutor``.  PyMuPDF is not
+  thread-safe, and Tesseract / spaCy are CPU-bound, so processes are the only
+  way to scale with cores.  On platforms that ``fork`` the workers inherit the
+  already-loaded ``NERInference`` copy-on-write; elsewhere each worker loads
+  its own in the pool initializer.
+* **Thread mode** — a ``ThreadPoolExecutor`` sharing the API's engine.  Handy
+  for development and tests; not recommended for production OCR load.
+
+Admission is bounded: once ``max_inflight`` documents are running or queued
+the pool refuses new work with ``PoolSaturatedError`` and the API answers
+``503`` with a ``Retry-After`` header instead of letting latency grow without
+limit.
+
+Scheduling is cost-aware.  Each task carries a cost estimate (pages, with
+OCR pages weighted heavily — see ``ocr.ocr_engine.estimate_pdf_cost``) and
+waiting tasks are dispatched earliest *virtual deadline* first, where
+``deadline = arrival + cost × cost_weight``.  Small documents overtake big
+scans (shortest-job-first), yet a big scan is never starved: anything that
+arrives after its deadline queues behind it.  Tasks above ``max_cost`` are
+refused outright with ``CostLimitExceededError``.  Tasks costing
+``large_cost`` or more may hold at most ``workers - 1`` workers, so a small
+document always finds a free worker even while big scans fill the queue.
+
+If a worker process dies (OOM kill, segfault in a native library) the
+executor is rebuilt: only the tasks that were running on it fail, and
+everything queued afterwards runs on fresh workers.
+"""
+
+import asyncio
+import heapq
+import itertools
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
+
+from utils.logger import configure_logger
+from utils.metrics import REGISTRY
+
+if TYPE_CHECKING:
+    from ocr.ocr_engine import AdaptiveDPI
+
+logger = configure_logger("LexiScanAuto.WorkerPool")
+
+POOL_MODES = ("process", "thread")
+
+
+class PoolSaturatedError(RuntimeError):
+    """Raised when the pool's in-flight limit has been reached."""
+
+    def __init__(self, retry_after: int):
+        super().__init__("Extraction pool is saturated.")
+        self.retry_after = retry_after
+
+
+class CostLimitExceededError(ValueError):
+    """Raised when a single task's estimated cost exceeds the pool's limit."""
+
+    def __init__(self, cost: float, max_cost: float):
+        super().__init__(
+            f"Estimated document cost {cost:.0f} exceeds the limit of {max_cost:.0f}."
+        )
+        self.cost = cost
+        self.max_cost = max_cost
+
+
+# ───────────────────────────────────────────────────────────────────────────
+#  Worker-side pipeline
+# ───────────────────────────────────────────────────────────────────────────
+
+# The engine used inside each worker.  Set by the API before the pool forks
+# (shared copy-on-write) or lazily by ``_init_worker`` in spawned processes.
+_worker_engine = None
+
+
+def set_worker_engine(engine) -> None:
+    """Register the ``NERInference`` instance workers should use."""
+    global _worker_engine
+    _worker_engine = engine
+
+
+def _init_worker(cpu_budget=None) -> None:
+    """Pool initializer — make sure the worker owns a loaded NER engine.
+
+    *cpu_budget* is the pool's OCR CPU semaphore, shared by every worker.
+    """
+    global _worker_engine
+    # Forked workers inherit the parent's metric values; start from zero
+    # so only this worker's own increments are shipped back.
+    REGISTRY.reset()
+    if cpu_budget is not None:
+        from ocr.ocr_engine import set_cpu_budget
+        set_cpu_budget(cpu_budget)
+    if _worker_engine is None:
+        from ner.inference import NERInference
+        _worker_engine = NERInference()
+
+
+def _call_collecting_metrics(fn: Callable[..., Any], *args: Any) -> Tuple[Any, Dict[str, dict]]:
+    """Run *fn* in a worker process and return its metric increments too."""
+    result = fn(*args)
+    return result, REGISTRY.drain()
+
+
+def _require_engine():
+    if _worker_engine is None:
+        raise RuntimeError("NER engine is not initialised in this worker.")
+    return _worker_engine
+
+
+def run_ocr(
+    source: Union[str, bytes],
+    dpi: int = 300,
+    page_workers: int = 1,
+    adaptive: Optional["AdaptiveDPI"] = None,
+) -> Tuple[str, Dict[str, float]]:
+    """Execute OCR → cleaning for one PDF given as a path or raw bytes.
+
+    Returns
+    -------
+    tuple[str, dict]
+        ``(clean_text, quality_metrics)``
+    """
+    from ocr.ocr_engine import extract_text, clean_ocr_text, evaluate_text_quality
+
+    raw_text = extract_text(source, dpi=dpi, page_workers=page_workers, adaptive=adaptive)
+    clean_text = clean_ocr_text(raw_text)
+    return clean_text, evaluate_text_quality(clean_text)
+
+
+def run_pipeline(
+    source: Union[str, bytes],
+    dpi: int = 300,
+    page_workers: int = 1,
+    adaptive: Optional["AdaptiveDPI"] = None,
+) -> Tuple[Dict[str, float], Dict[str, List[str]]]:
+    """Execute OCR → cleaning → NER → rules for one PDF path or payload.
+
+    Returns
+    -------
+    tuple[dict, dict]
+        ``(quality_metrics, grouped_entities)``
+    """
+    engine = _require_engine()
+    clean_text, metrics = run_ocr(source, dpi, page_workers, adaptive)
+    return metrics, engine.extract_grouped(clean_text)
+
+
+def run_pipeline_streaming(
+    source: Union[str, bytes],
+    dpi: int,
+    events: "queue.Queue",
+    page_entities: bool = False,
+    page_workers: int = 1,
+    adaptive: Optional["AdaptiveDPI"] = None,
+) -> Tuple[Dict[str, float], Dict[str, List[str]]]:
+    """:func:`run_pipeline` that reports progress on *events* as it goes.
+
+    Emits one ``{"event": "page", ...}`` dict per finished page (with the
+    DPI and confidence of OCR'd pages, and that page's grouped entities
+    when *page_entities* is set) and a
+    ``{"event": "stage", "stage": "ner"}`` marker before the final
+    whole-document NER pass, whose result is returned as usual.
+    """
+    from ocr.ocr_engine import iter_pdf_pages, clean_ocr_text, evaluate_text_quality
+
+    engine = _require_engine()
+    pages: List[str] = []
+
+    for page in iter_pdf_pages(source, dpi=dpi, page_workers=page_workers, adaptive=adaptive):
+        pages.append(page.text)
+        event: Dict[str, Any] = {
+            "event": "page",
+            "page": page.page_index + 1,
+            "total_pages": page.page_count,
+            "chars": len(page.text),
+            "ocr": page.ocr_used,
+        }
+        if page.ocr_used:
+            event["dpi"] = page.dpi
+            event["confidence"] = page.confidence
+        if page_entities:
+            event["entities"] = engine.extract_grouped(clean_ocr_text(page.text))
+        events.put(event)
+
+    events.put({"event": "stage", "stage": "ner"})
+    clean_text = clean_ocr_text("\n".join(pages))
+    return evaluate_text_quality(clean_text), engine.extract_grouped(clean_text)
+
+
+def run_ner_batch(texts: List[str]) -> List[Dict[str, List[str]]]:
+    """Execute NER → rules for many cleaned texts via ``nlp.pipe``."""
+    return _require_engine().extract_grouped_many(texts)
+
+
+def run_ner_on_ocr_results(
+    ocr_results: List[Tuple[str, Dict[str, float]]],
+) -> List[Dict[str, List[str]]]:
+    """:func:`run_ner_batch` over the ``(clean_text, metrics)`` pairs of :func:`run_ocr`."""
+    return run_ner_batch([clean_text for clean_text, _ in ocr_results])
+
+
+def run_text_pipeline(
+    texts: List[str],
+) -> List[Tuple[Dict[str, float], Dict[str, List[str]]]]:
+    """Execute cleaning → NER → rules for plain texts, skipping OCR.
+
+    Returns
+    -------
+    list[tuple[dict, dict]]
+        ``(quality_metrics, grouped_entities)`` per input text.
+    """
+    from ocr.ocr_engine import clean_ocr_text, evaluate_text_quality
+
+    engine = _require_engine()
+    clean_texts = [clean_ocr_text(text) for text in texts]
+    grouped = engine.extract_grouped_many(clean_texts)
+    return [
+        (evaluate_text_quality(clean_text), entities)
+        for clean_text, entities in zip(clean_texts, grouped)
+    ]
+
+
+# ───────────────────────────────────────────────────────────────────────────
+#  Bounded pool
+# ───────────────────────────────────────────────────────────────────────────
+
+def _run_cleanup(cleanup: Optional[Callable[[], None]]) -> None:
+    if cleanup is None:
+        return
+    try:
+        cleanup()
+    except Exception as exc:
+        logger.warning(f"Task cleanup failed: {exc}")
+
+
+class ExtractionPool:
+    """Executor wrapper with a hard cap on in-flight work and cost-aware dispatch.
+
+    Parameters
+    ----------
+    mode : str
+        ``"process"`` or ``"thread"``.
+    workers : int, optional
+        Number of pool workers (default: CPU count).
+    max_inflight : int, optional
+        Running + queued documents admitted at once (default: 2 × workers).
+    retry_after : int
+        Seconds suggested to clients when the pool is saturated.
+    max_cost : float, optional
+        Largest single-task cost accepted (``None`` = unlimited).
+    cost_weight : float
+        Seconds of scheduling delay per unit of cost when ordering waiting
+        tasks; ``0`` degrades to plain FIFO.
+    large_cost : float, optional
+        Tasks at or above this cost are "large" and may occupy at most
+        ``workers - 1`` workers, keeping one free for small tasks
+        (``None`` = no reservation; has no effect with a single worker).
+    ocr_cpu_budget : int, optional
+        Tesseract calls allowed to run at once across all workers and their
+        page workers (default: CPU count).
+    cpu_budget : multiprocessing semaphore, optional
+        An existing budget to share instead (e.g. the one a pre-fork master
+        created for every API process); overrides *ocr_cpu_budget*.
+    """
+
+    def __init__(
+        self,
+        mode: str = "process",
+        workers: Optional[int] = None,
+        max_inflight: Optional[int] = None,
+        retry_after: int = 5,
+        max_cost: Optional[float] = None,
+        cost_weight: float = 0.05,
+        large_cost: Optional[float] = 100.0,
+        ocr_cpu_budget: Optional[int] = None,
+        cpu_budget=None,
+    ):
+        if mode not in POOL_MODES:
+            raise ValueError(f"Unknown pool mode {mode!r}; expected one of {POOL_MODES}.")
+
+        self.mode = mode
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        self.max_inflight = max(self.workers, max_inflight or 2 * self.workers)
+        self.retry_after = retry_after
+        self.max_cost = max_cost
+        self.cost_weight = cost_weight
+        self.large_cost = large_cost
+        self.max_large_running = max(1, self.workers - 1)
+
+        from ocr.ocr_engine import make_cpu_budget
+        self.cpu_budget = cpu_budget if cpu_budget is not None else make_cpu_budget(ocr_cpu_budget)
+
+        self._inflight = 0
+        self._running = 0
+        self._running_large = 0
+        self._pending: List[
+            Tuple[
+                float, int, bool, Callable[..., Any], Tuple[Any, ...], bool,
+                Optional[Callable[[], None]], "asyncio.Future",
+            ]
+        ] = []
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        self._manager = None
+        self._executor: Executor = self._create_executor()
+
+        logger.info(
+            f"Extraction pool ready: mode={self.mode}, workers={self.workers}, "
+            f"max_inflight={self.max_inflight}, max_cost={self.max_cost}"
+        )
+
+    def _create_executor(self) -> Executor:
+        if self.mode == "thread":
+            from ocr.ocr_engine import set_cpu_budget
+            set_cpu_budget(self.cpu_budget)
+            return ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="lexiscan-pipeline",
+            )
+        return ProcessPoolExecutor(
+            max_workers=self.workers, initializer=_init_worker, initargs=(self.cpu_budget,),
+        )
+
+    @classmethod
+    def from_env(cls) -> "ExtractionPool":
+        """Build a pool from ``LEXISCAN_POOL_*`` environment variables.
+
+        Shares the CPU budget already installed in this process, if any.
+        """
+        from ocr.ocr_engine import installed_cpu_budget
+
+        workers = os.environ.get("LEXISCAN_POOL_WORKERS")
+        max_inflight = os.environ.get("LEXISCAN_MAX_INFLIGHT")
+        max_cost = os.environ.get("LEXISCAN_MAX_DOCUMENT_COST")
+        large_cost = float(os.environ.get("LEXISCAN_LARGE_TASK_COST", "100"))
+        cpu_budget = os.environ.get("LEXISCAN_OCR_CPU_BUDGET")
+        return cls(
+            mode=os.environ.get("LEXISCAN_POOL_MODE", "process"),
+            workers=int(workers) if workers else None,
+            max_inflight=int(max_inflight) if max_inflight else None,
+            retry_after=int(os.environ.get("LEXISCAN_RETRY_AFTER", "5")),
+            max_cost=float(max_cost) if max_cost else None,
+            cost_weight=float(os.environ.get("LEXISCAN_COST_WEIGHT", "0.05")),
+            large_cost=large_cost if large_cost > 0 else None,
+            ocr_cpu_budget=int(cpu_budget) if cpu_budget else None,
+            cpu_budget=installed_cpu_budget(),
+        )
+
+    @property
+    def inflight(self) -> int:
+        """Documents currently running or waiting for a worker."""
+        return self._inflight
+
+    @property
+    def pending(self) -> int:
+        """Documents admitted but still waiting for a worker."""
+        return len(self._pending)
+
+    def _acquire(self, count: int = 1) -> None:
+        with self._lock:
+            if self._inflight + count > self.max_inflight:
+                raise PoolSaturatedError(self.retry_after)
+            self._inflight += count
+
+    def _release(self, count: int = 1) -> None:
+        with self._lock:
+            self._inflight -= count
+
+    def _check_cost(self, cost: float) -> None:
+        if self.max_cost is not None and cost > self.max_cost:
+            raise CostLimitExceededError(cost, self.max_cost)
+
+    def submit(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        cost: float = 1.0,
+        cleanup: Optional[Callable[[], None]] = None,
+    ) -> "asyncio.Future":
+        """Admit ``fn(*args)`` now and return a future for its result.
+
+        Must be called from the event loop.  Admission is decided before
+        this returns, so callers can reject a request before they start
+        streaming a response.
+
+        *cleanup* is called once the task has really stopped using its
+        arguments — it finished, or was cancelled before it started — even
+        if the returned future was cancelled earlier (e.g. the client went
+        away).
+
+        Raises
+        ------
+        CostLimitExceededError
+            If *cost* is above ``max_cost``.
+        PoolSaturatedError
+            Immediately, if ``max_inflight`` documents are already admitted.
+        """
+        self._check_cost(cost)
+        self._acquire()
+        return self._enqueue(fn, args, cost, cleanup=cleanup)
+
+    def _enqueue(
+        self,
+        fn: Callable[..., Any],
+        args: Tuple[Any, ...],
+        cost: float,
+        release: bool = True,
+        cleanup: Optional[Callable[[], None]] = None,
+    ) -> "asyncio.Future":
+        """Queue an already-admitted task by virtual deadline and pump.
+
+        With ``release=False`` the task's admission slot stays taken when it
+        finishes, for a follow-up task to reuse.
+        """
+        loop = asyncio.get_running_loop()
+        result = loop.create_future()
+        deadline = loop.time() + cost * self.cost_weight
+        large = self.large_cost is not None and cost >= self.large_cost
+        heapq.heappush(
+            self._pending,
+            (deadline, next(self._sequence), large, fn, args, release, cleanup, result),
+        )
+        self._pump()
+        return result
+
+    def _pump(self) -> None:
+        """Hand waiting tasks to the executor while workers are free.
+
+        Large tasks beyond ``max_large_running`` stay queued (keeping their
+        place) while smaller ones behind them are dispatched.
+        """
+        deferred = []
+        while self._running < self.workers and self._pending:
+            entry = heapq.heappop(self._pending)
+            _, _, large, fn, args, release, cleanup, result = entry
+            if result.cancelled():
+                if release:
+                    self._release()
+                _run_cleanup(cleanup)
+                continue
+            if large and self._running_large >= self.max_large_running:
+                deferred.append(entry)
+                continue
+            self._running += 1
+            self._running_large += large
+            inner = self._dispatch(fn, *args)
+            inner.add_done_callback(
+                lambda done, result=result, release=release, large=large, cleanup=cleanup:
+                    self._finish(done, result, release, large, cleanup)
+            )
+        for entry in deferred:
+            heapq.heappush(self._pending, entry)
+
+    def _finish(
+        self,
+        done: "asyncio.Future",
+        result: "asyncio.Future",
+        release: bool = True,
+        large: bool = False,
+        cleanup: Optional[Callable[[], None]] = None,
+    ) -> None:
+        self._running -= 1
+        self._running_large -= large
+        if release:
+            self._release()
+        _run_cleanup(cleanup)
+        if not result.done():
+            if done.cancelled():
+                result.cancel()
+            elif done.exception() is not None:
+                result.set_exception(done.exception())
+            else:
+                result.set_result(done.result())
+        self._pump()
+
+    def _dispatch(self, fn: Callable[..., Any], *args: Any) -> "asyncio.Future":
+        """Schedule ``fn(*args)`` on the executor (no admission check)."""
+        loop = asyncio.get_running_loop()
+        if self.mode == "thread":
+            return loop.run_in_executor(self._executor, fn, *args)
+
+        # Process workers record metrics in their own memory; fold the
+        # increments they send back into this process's registry.
+        executor = self._executor
+        try:
+            inner = loop.run_in_executor(executor, _call_collecting_metrics, fn, *args)
+        except BrokenProcessPool:
+            executor = self._replace_broken_executor(executor)
+            inner = loop.run_in_executor(executor, _call_collecting_metrics, fn, *args)
+        outer = loop.create_future()
+
+        def _unwrap(done: "asyncio.Future") -> None:
+            if outer.done():
+                return
+            if done.cancelled():
+                outer.cancel()
+            elif done.exception() is not None:
+                if isinstance(done.exception(), BrokenProcessPool):
+                    self._replace_broken_executor(executor)
+                outer.set_exception(done.exception())
+            else:
+                result, snapshot = done.result()
+                REGISTRY.merge(snapshot)
+                outer.set_result(result)
+
+        inner.add_done_callback(_unwrap)
+        return outer
+
+    def _replace_broken_executor(self, broken: Executor) -> Executor:
+        """Swap in a fresh process pool after a worker died (once per pool)."""
+        with self._lock:
+            if self._executor is broken:
+                logger.error("A pool worker died; restarting the process pool.")
+                broken.shutdown(wait=False, cancel_futures=True)
+                self._executor = self._create_executor()
+            return self._executor
+
+    async def run(self, fn: Callable[..., Any], *args: Any, cost: float = 1.0) -> Any:
+        """Run ``fn(*args)`` in the pool without blocking the event loop.
+
+        Raises
+        ------
+        CostLimitExceededError
+            If *cost* is above ``max_cost``.
+        PoolSaturatedError
+            Immediately, if ``max_inflight`` documents are already admitted.
+        """
+        return await self.submit(fn, *args, cost=cost)
+
+    def event_queue(self) -> "queue.Queue":
+        """A queue workers can ``put`` progress events on.
+
+        Thread mode uses a plain ``queue.Queue``; process mode needs a
+        manager-backed proxy that can cross the process boundary.
+        """
+        if self.mode == "thread":
+            return queue.Queue()
+        with self._lock:
+            if self._manager is None:
+                self._manager = multiprocessing.Manager()
+        return self._manager.Queue()
+
+    async def run_batch(
+        self,
+        fn: Callable[..., Any],
+        arg_tuples: List[Tuple[Any, ...]],
+        costs: Optional[List[float]] = None,
+        then: Optional[Callable[[List[Any]], Any]] = None,
+    ) -> Any:
+        """Run ``fn`` once per argument tuple, admitting the batch atomically.
+
+        Either every call gets a slot or none does, so a batch can never be
+        half-admitted and then starve behind single-document traffic.
+        Each call is scheduled individually by its own cost.
+
+        *then*, if given, runs in the pool on the list of results once they
+        are all in, on a slot held back from the batch — it can never be
+        refused after the batch's work is done.  Returns
+        ``(results, then(results))`` in that case.
+        """
+        count = len(arg_tuples)
+        if count > self.max_inflight:
+            raise ValueError(
+                f"Batch of {count} exceeds the pool limit of {self.max_inflight}."
+            )
+
+        costs = costs or [1.0] * count
+        for cost in costs:
+            self._check_cost(cost)
+
+        self._acquire(count)
+        futures = [
+            # The first call's slot is kept for *then*
+            self._enqueue(fn, args, cost, release=then is None or idx > 0)
+            for idx, (args, cost) in enumerate(zip(arg_tuples, costs))
+        ]
+        if then is None:
+            return await asyncio.gather(*futures)
+
+        try:
+            results = await asyncio.gather(*futures)
+        except BaseException:
+            self._release()
+            raise
+        return results, await self._enqueue(then, (results,), float(count))
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of the pool configuration and load."""
+        return {
+            "mode": self.mode,
+            "workers": self.workers,
+            "inflight": self._inflight,
+            "running": self._running,
+            "running_large": self._running_large,
+            "pending": len(self._pending),
+            "max_inflight": self.max_inflight,
+        }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._manager is not None:
+            self._manager.shutdown()
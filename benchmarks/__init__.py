@@ -0,0 +1 @@
+# LexiScan Auto — Benchmarks Package
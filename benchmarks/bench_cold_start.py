@@ -0,0 +1,87 @@
+"""
+LexiScan Auto — Import-Time / Cold-Start Benchmark
+====================================================
+Measures, each in a fresh interpreter (median of ``--runs``):
+
+* ``import api.app`` and ``import main`` — what every API worker and CLI
+  invocation pays before doing anything,
+* ``api.app.load_engine()`` — first model load, i.e. the cold start of an
+  autoscaled container before it can serve,
+
+and lists which heavy dependencies (spaCy, PyMuPDF, Tesseract, Pillow)
+each import dragged in.  Exits non-zero when an import exceeds
+``--budget-ms`` or pulls in a heavy dependency, so CI can enforce the
+budget.
+
+Usage::
+
+    python -m benchmarks.bench_cold_start
+    python -m benchmarks.bench_cold_start --budget-ms 800 --runs 7
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+
+HEAVY_MODULES = ("spacy", "thinc", "fitz", "pytesseract", "PIL", "pdf2image")
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+heavy = [m for m in {heavy!r} if m in sys.modules]
+print(json.dumps({{"seconds": elapsed, "heavy": heavy}}))
+"""
+
+SCENARIOS = {
+    "import api.app": "import api.app",
+    "import main": "import main",
+    "load_engine()": "import api.app; api.app.load_engine()",
+}
+
+
+def _probe(statement: str) -> Dict:
+    code = _PROBE.format(statement=statement, heavy=HEAVY_MODULES)
+    proc = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def measure(statement: str, runs: int) -> Dict:
+    samples: List[Dict] = [_probe(statement) for _ in range(runs)]
+    return {
+        "ms": statistics.median(s["seconds"] for s in samples) * 1000,
+        "heavy": samples[-1]["heavy"],
+    }
+
+
+def benchmark(runs: int, budget_ms: float) -> bool:
+    ok = True
+    for name, statement in SCENARIOS.items():
+        result = measure(statement, runs)
+        checked = name.startswith("import")
+        over = checked and (result["ms"] > budget_ms or result["heavy"])
+        ok = ok and not over
+        flag = "  OVER BUDGET" if over else ""
+        print(f"  {name:16s} {result['ms']:9.1f} ms  heavy={result['heavy']}{flag}")
+    return ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark import time and cold start")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--budget-ms", type=float, default=1000.0,
+        help="Maximum median import time for api.app / main",
+    )
+    args = parser.parse_args()
+
+    sys.exit(0 if benchmark(args.runs, args.budget_ms) else 1)
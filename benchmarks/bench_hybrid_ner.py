@@ -0,0 +1,69 @@
+"""
+LexiScan Auto — Hybrid NER Execution Benchmark
+================================================
+Times ``NERInference.extract_entities_raw`` / ``extract_entities_raw_many``
+with the custom and base models running on one shared Doc versus two
+separately tokenized Docs, and checks both paths return the same entities.
+
+Usage::
+
+    python -m benchmarks.bench_hybrid_ner
+    python -m benchmarks.bench_hybrid_ner --custom models/lexiscan_ner --base en_core_web_sm
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+import sys
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.bench_ner_profile import SAMPLE_TEXTS
+from ner.inference import DEFAULT_MODEL_DIR, NERInference, load_pipeline
+
+
+def _time(fn, repeats: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats
+
+
+def benchmark(custom: str, base: str, n_docs: int, profile: str) -> None:
+    engine = NERInference(model_dir="__missing_model__")
+    engine.custom_nlp = load_pipeline(custom, profile)
+    engine.base_nlp = load_pipeline(base, profile)
+    if not engine._enable_doc_sharing():
+        print("Models are not tokenization-compatible; nothing to compare.")
+        return
+
+    document = " ".join(SAMPLE_TEXTS * max(1, n_docs // len(SAMPLE_TEXTS)))
+    texts = [SAMPLE_TEXTS[i % len(SAMPLE_TEXTS)] for i in range(n_docs)]
+    engine.extract_entities_raw(document)  # warm up
+
+    results = {}
+    for shared in (False, True):
+        engine.share_doc = shared
+        single = _time(lambda: engine.extract_entities_raw(document), 5)
+        batched = _time(lambda: engine.extract_entities_raw_many(texts), 3)
+        results[shared] = (
+            engine.extract_entities_raw(document), engine.extract_entities_raw_many(texts),
+        )
+        label = "shared Doc" if shared else "two Docs  "
+        print(
+            f"  {label}  single {single * 1000:8.1f} ms/doc  "
+            f"batched {n_docs / batched:8.1f} docs/s"
+        )
+
+    print(f"  identical entities: {results[False] == results[True]}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark shared-Doc hybrid NER")
+    parser.add_argument("--custom", type=str, default=DEFAULT_MODEL_DIR)
+    parser.add_argument("--base", type=str, default="en_core_web_sm")
+    parser.add_argument("--docs", type=int, default=200)
+    parser.add_argument("--profile", type=str, default="ner")
+    args = parser.parse_args()
+
+    benchmark(args.custom, args.base, args.docs, args.profile)
@@ -0,0 +1,67 @@
+"""
+LexiScan Auto — Matcher Fast-Path Benchmark
+=============================================
+Compares entity extraction with and without the deterministic pre-NER
+matchers (``rules.matchers``):
+
+* throughput of the matcher scan on its own,
+* ``NERInference.extract_entities_raw_many`` docs/sec with ``use_matcher``
+  on and off (pair it with ``--fallback per-label-missing`` to see the base
+  model being skipped once the matchers cover DATE / AMOUNT / JURISDICTION),
+* entities found per label by each path.
+
+Usage::
+
+    python -m benchmarks.bench_matchers
+    python -m benchmarks.bench_matchers --fallback per-label-missing --docs 500
+"""
+
+import argparse
+import time
+from collections import Counter
+from pathlib import Path
+
+import sys
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.bench_ner_profile import SAMPLE_TEXTS
+from ner.inference import DEFAULT_MODEL_DIR, NERInference
+from rules.matchers import find_entities
+
+
+def _label_counts(results) -> dict:
+    return dict(Counter(ent["entity"] for entities in results for ent in entities))
+
+
+def benchmark(model_dir: str, n_docs: int, fallback: str) -> None:
+    texts = [SAMPLE_TEXTS[i % len(SAMPLE_TEXTS)] for i in range(n_docs)]
+
+    start = time.perf_counter()
+    matched = [find_entities(text) for text in texts]
+    elapsed = time.perf_counter() - start
+    print(f"  matcher only  {n_docs / elapsed:10.1f} docs/s  "
+          f"{dict(Counter(m.label_ for spans in matched for m in spans))}")
+
+    engine = NERInference(model_dir=model_dir, fallback_policy=fallback)
+    if engine.custom_nlp is None and engine.base_nlp is None:
+        print("  No NER model available; skipping the model comparison.")
+        return
+
+    engine.extract_entities_raw_many(texts[:8])  # warm up
+    for use_matcher in (False, True):
+        engine.use_matcher = use_matcher
+        start = time.perf_counter()
+        results = engine.extract_entities_raw_many(texts)
+        elapsed = time.perf_counter() - start
+        label = "matcher + NER" if use_matcher else "NER only     "
+        print(f"  {label} {n_docs / elapsed:10.1f} docs/s  {_label_counts(results)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the pre-NER matcher fast path")
+    parser.add_argument("--model", type=str, default=DEFAULT_MODEL_DIR)
+    parser.add_argument("--docs", type=int, default=200)
+    parser.add_argument("--fallback", type=str, default="always")
+    args = parser.parse_args()
+
+    benchmark(args.model, args.docs, args.fallback)
@@ -0,0 +1,132 @@
+"""
+LexiScan Auto — NER Pipeline Profile Benchmark
+================================================
+Compares the ``full`` and ``ner`` pipeline profiles of
+``ner.inference.load_pipeline`` for each model:
+
+* components loaded,
+* load time and resident memory added by the model,
+* ``nlp.pipe`` throughput (docs/sec),
+* whether both profiles predict exactly the same entities.
+
+Each (model, profile) pair runs in a fresh process so memory figures are not
+polluted by the other profile.
+
+Usage::
+
+    python -m benchmarks.bench_ner_profile
+    python -m benchmarks.bench_ner_profile --model en_core_web_sm --docs 500
+"""
+
+import argparse
+import multiprocessing
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import sys
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from ner.inference import DEFAULT_MODEL_DIR
+
+SAMPLE_TEXTS = [
+    "This Confidentiality Agreement is entered into on October 12, 2023, between "
+    "Acme Corp (the 'Disclosing Party') and John Doe (the 'Receiving Party').",
+    "The penalty amount for breach is $50,000.00 and falls within the jurisdiction "
+    "of the State of New York.",
+    "This Lease shall terminate on December 31, 2025 unless renewed by Globex "
+    "Industries LLC in writing no later than 90 days prior.",
+    "Tenant shall pay a monthly rent of USD 4,250.00 to Initech Holdings Inc. on "
+    "the first business day of each month, governed by the laws of California.",
+]
+
+
+def _rss_bytes() -> int:
+    """Current resident set size (Linux), or 0 where unavailable."""
+    try:
+        with open("/proc/self/statm", "r") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return 0
+
+
+def _measure(model: str, profile: str, n_docs: int, batch_size: int, results) -> None:
+    """Child process body: load *model* with *profile* and time ``nlp.pipe``."""
+    from ner.inference import load_pipeline
+
+    rss_before = _rss_bytes()
+    start = time.perf_counter()
+    try:
+        nlp = load_pipeline(model, profile)
+    except Exception as exc:
+        results.put({"error": str(exc)})
+        return
+    load_seconds = time.perf_counter() - start
+
+    # Warm up lazy allocations before timing
+    list(nlp.pipe(SAMPLE_TEXTS))
+    texts = [SAMPLE_TEXTS[i % len(SAMPLE_TEXTS)] for i in range(n_docs)]
+
+    start = time.perf_counter()
+    entities = [
+        [(ent.start_char, ent.end_char, ent.label_) for ent in doc.ents]
+        for doc in nlp.pipe(texts, batch_size=batch_size)
+    ]
+    elapsed = time.perf_counter() - start
+
+    results.put({
+        "pipeline": list(nlp.pipe_names),
+        "load_seconds": load_seconds,
+        "rss_mb": (_rss_bytes() - rss_before) / (1024 * 1024),
+        "docs_per_sec": n_docs / elapsed if elapsed else float("inf"),
+        "entities": entities[:len(SAMPLE_TEXTS)],
+    })
+
+
+def run_profile(model: str, profile: str, n_docs: int, batch_size: int) -> Dict[str, Any]:
+    ctx = multiprocessing.get_context("spawn")
+    results = ctx.Queue()
+    proc = ctx.Process(target=_measure, args=(model, profile, n_docs, batch_size, results))
+    proc.start()
+    result = results.get()
+    proc.join()
+    return result
+
+
+def benchmark(models: List[str], n_docs: int, batch_size: int) -> None:
+    for model in models:
+        print(f"\n=== {model} ===")
+        measured = {
+            profile: run_profile(model, profile, n_docs, batch_size)
+            for profile in ("full", "ner")
+        }
+        if any("error" in result for result in measured.values()):
+            error = next(r["error"] for r in measured.values() if "error" in r)
+            print(f"  skipped: {error}")
+            continue
+
+        for profile, result in measured.items():
+            print(
+                f"  {profile:5s} {result['docs_per_sec']:9.1f} docs/s  "
+                f"load {result['load_seconds']:6.2f}s  "
+                f"+{result['rss_mb']:7.1f} MB  {result['pipeline']}"
+            )
+
+        full, ner = measured["full"], measured["ner"]
+        speedup = ner["docs_per_sec"] / full["docs_per_sec"] if full["docs_per_sec"] else 0
+        print(f"  speedup x{speedup:.2f}, memory saved {full['rss_mb'] - ner['rss_mb']:.1f} MB")
+        print(f"  identical entities: {full['entities'] == ner['entities']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark NER pipeline profiles")
+    parser.add_argument(
+        "--model", action="append",
+        help="Model path or package (repeatable; default: custom model and en_core_web_sm)",
+    )
+    parser.add_argument("--docs", type=int, default=200, help="Documents per measurement")
+    parser.add_argument("--batch-size", type=int, default=32)
+    args = parser.parse_args()
+
+    benchmark(args.model or [DEFAULT_MODEL_DIR, "en_core_web_sm"], args.docs, args.batch_size)
@@ -0,0 +1,143 @@
+"""
+LexiScan Auto — Date / Amount Normaliser Microbenchmark
+=========================================================
+Times ``rules.validators.normalize_date`` / ``normalize_amount`` against the
+previous implementation (kept below as ``legacy_*``: seven uncompiled
+``re.search`` calls per date, ``dateutil`` imported on every miss, inline
+amount regexes, no memo) over a contract-like stream in which the same
+values repeat, and reports where the two disagree.
+
+Usage::
+
+    python -m benchmarks.bench_normalizers
+    python -m benchmarks.bench_normalizers --values 50000 --distinct 200
+"""
+
+import argparse
+import random
+import re
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List, Optional
+
+import sys
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from rules import validators
+
+DATE_SAMPLES = [
+    "October 12, 2023", "Oct 12 2023", "Oct 12, 2023", "10/12/2023", "2023-10-12",
+    "12-10-2023", "12.10.2023", "December 31st, 2025", "Sept 5 2024",
+    "12 October 2023", "effective as of January 1, 2024", "not a date",
+]
+AMOUNT_SAMPLES = [
+    "$50,000.00", "USD 1,234,567.89", "€ 2.500,00", "£ 750", "1,000,000", "INR 12,500.50",
+]
+
+
+# ───────────────────────────────────────────────────────────────────────────
+#  Previous implementation (for comparison only)
+# ───────────────────────────────────────────────────────────────────────────
+
+_LEGACY_DATE_PATTERNS = [
+    (r"(?:January|February|March|April|May|June|July|August|September|"
+     r"October|November|December)\s+\d{1,2},?\s+\d{4}", "%B %d, %Y"),
+    (r"(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},?\s+\d{4}", "%b %d %Y"),
+    (r"(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},\s+\d{4}", "%b %d, %Y"),
+    (r"\d{1,2}/\d{1,2}/\d{4}", "%m/%d/%Y"),
+    (r"\d{4}-\d{2}-\d{2}", "%Y-%m-%d"),
+    (r"\d{1,2}-\d{1,2}-\d{4}", "%d-%m-%Y"),
+    (r"\d{1,2}\.\d{1,2}\.\d{4}", "%d.%m.%Y"),
+]
+
+
+def _legacy_try_parse_date(raw: str) -> Optional[datetime]:
+    raw = raw.strip().replace(",", ", ").replace("  ", " ")
+    raw = re.sub(r"(\d+)(st|nd|rd|th)", r"\1", raw)
+    for pattern, fmt in _LEGACY_DATE_PATTERNS:
+        match = re.search(pattern, raw, re.IGNORECASE)
+        if match:
+            try:
+                return datetime.strptime(match.group(), fmt)
+            except ValueError:
+                continue
+    try:
+        from dateutil import parser as dateutil_parser
+        return dateutil_parser.parse(raw, dayfirst=False)
+    except Exception:
+        return None
+
+
+def legacy_normalize_date(raw: str) -> str:
+    dt = _legacy_try_parse_date(raw)
+    return dt.strftime("%Y-%m-%d") if dt else raw.strip()
+
+
+def legacy_normalize_amount(raw: str) -> str:
+    text = re.compile(r"[£€$¥₹₦]").sub("", raw.strip())
+    text = re.sub(r"\b(?:USD|EUR|GBP|INR|CAD|AUD|JPY)\b", "", text, flags=re.IGNORECASE).strip()
+    if re.search(r"\d\.\d{3},\d{2}$", text):
+        text = text.replace(".", "").replace(",", ".")
+    else:
+        text = re.compile(r"(?<=\d),(?=\d{3})").sub("", text)
+    text = re.sub(r"[^\d.]", "", text)
+    try:
+        value = float(text)
+        return f"{value:.2f}" if "." in text else str(int(value))
+    except ValueError:
+        return raw.strip()
+
+
+# ───────────────────────────────────────────────────────────────────────────
+#  Benchmark
+# ───────────────────────────────────────────────────────────────────────────
+
+def _stream(samples: List[str], n_values: int, n_distinct: int, seed: int = 0) -> List[str]:
+    """*n_values* strings drawn from *n_distinct* variants of *samples*."""
+    rng = random.Random(seed)
+    pool = [f"{samples[i % len(samples)]}{' ' * (i // len(samples))}" for i in range(n_distinct)]
+    return [rng.choice(pool) for _ in range(n_values)]
+
+
+def _time(fn: Callable[[str], str], values: List[str]) -> float:
+    start = time.perf_counter()
+    for value in values:
+        fn(value)
+    return time.perf_counter() - start
+
+
+def _compare(name: str, legacy, current, values: List[str], cold) -> None:
+    legacy_s = _time(legacy, values)
+    cold()
+    current_s = _time(current, values)
+    print(
+        f"  {name:7s} legacy {len(values) / legacy_s:12.0f}/s   "
+        f"current {len(values) / current_s:12.0f}/s   x{legacy_s / current_s:.1f}"
+    )
+    for value in sorted(set(values)):
+        if legacy(value) != current(value):
+            print(f"    differs: {value.strip()!r}: {legacy(value)!r} -> {current(value)!r}")
+
+
+def benchmark(n_values: int, n_distinct: int) -> None:
+    dates = _stream(DATE_SAMPLES, n_values, n_distinct)
+    amounts = _stream(AMOUNT_SAMPLES, n_values, n_distinct)
+
+    _compare(
+        "dates", legacy_normalize_date, validators.normalize_date, dates,
+        validators._try_parse_date.cache_clear,
+    )
+    _compare(
+        "amounts", legacy_normalize_amount, validators.normalize_amount, amounts,
+        validators.normalize_amount.cache_clear,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the date / amount normalisers")
+    parser.add_argument("--values", type=int, default=20000, help="Values normalised per run")
+    parser.add_argument("--distinct", type=int, default=100, help="Distinct raw strings")
+    args = parser.parse_args()
+
+    benchmark(args.values, args.distinct)
@@ -0,0 +1,95 @@
+"""
+LexiScan Auto — OCR Backend Latency Benchmark
+===============================================
+Runs every installed OCR backend (``ocr_engine.OCR_BACKENDS``) over the
+same rendered pages and reports per-page latency (mean / p50 / p95) and the
+first-page cost, which for ``tesserocr`` includes loading the model once.
+
+Pages come from every PDF in ``--pdf-dir`` (a local corpus of scans), or a
+generated contract-like page when none is given.  Rendering happens before
+the clock starts, so only the Tesseract hand-off and recognition are timed.
+
+Usage::
+
+    python -m benchmarks.bench_ocr_backends
+    python -m benchmarks.bench_ocr_backends --pdf-dir data/scans --dpi 300 --pages 20
+"""
+
+import argparse
+import statistics
+import time
+from pathlib import Path
+from typing import List, Optional
+
+import sys
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.bench_ocr_render import _sample_pdf
+from ocr import ocr_engine
+
+
+def _render_corpus(pdf_dir: Optional[str], dpi: int, max_pages: int) -> List:
+    import fitz
+
+    if pdf_dir:
+        docs = [fitz.open(path) for path in sorted(Path(pdf_dir).glob("*.pdf"))]
+        pages = [page for doc in docs for page in doc][:max_pages]
+    else:
+        docs = [fitz.open(stream=_sample_pdf(), filetype="pdf")]
+        pages = [docs[0].load_page(0) for _ in range(max_pages)]
+
+    images = []
+    for page in pages:
+        img = ocr_engine.render_page_image(page, dpi)
+        img.load()
+        images.append(img)
+    return images
+
+
+def measure(backend: "ocr_engine.OCRBackend", images: List) -> dict:
+    latencies = []
+    for img in images:
+        start = time.perf_counter()
+        backend.image_to_string(img)
+        latencies.append(time.perf_counter() - start)
+
+    steady = sorted(latencies[1:] or latencies)
+    return {
+        "first_ms": latencies[0] * 1000,
+        "mean_ms": statistics.fmean(steady) * 1000,
+        "p50_ms": steady[len(steady) // 2] * 1000,
+        "p95_ms": steady[min(len(steady) - 1, int(len(steady) * 0.95))] * 1000,
+    }
+
+
+def benchmark(pdf_dir: Optional[str], dpi: int, max_pages: int) -> None:
+    images = _render_corpus(pdf_dir, dpi, max_pages)
+    if not images:
+        sys.exit(f"No pages found under {pdf_dir}")
+    print(f"  {len(images)} page(s) at {dpi} dpi")
+
+    for name, cls in ocr_engine.OCR_BACKENDS.items():
+        if not cls.available():
+            print(f"  {name:12s} not installed — skipped")
+            continue
+        try:
+            result = measure(cls(), images)
+        except Exception as exc:
+            print(f"  {name:12s} failed: {exc}")
+            continue
+        print(
+            f"  {name:12s} first {result['first_ms']:8.1f} ms   mean {result['mean_ms']:8.1f} ms   "
+            f"p50 {result['p50_ms']:8.1f} ms   p95 {result['p95_ms']:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark per-page latency of the OCR backends")
+    parser.add_argument("--pdf-dir", type=str, default=None, help="Directory of PDFs (default: generated page)")
+    parser.add_argument("--dpi", type=int, default=300)
+    parser.add_argument("--pages", type=int, default=10, help="Maximum pages to OCR")
+    args = parser.parse_args()
+
+    if args.pdf_dir and not Path(args.pdf_dir).is_dir():
+        sys.exit(f"Directory not found: {args.pdf_dir}")
+    benchmark(args.pdf_dir, args.dpi, args.pages)
@@ -0,0 +1,113 @@
+"""
+LexiScan Auto — OCR Page Rendering Benchmark
+==============================================
+Compares the hand-off of a rendered page to Tesseract:
+
+* ``png``  — the previous path: RGB pixmap → ``pix.tobytes("png")`` →
+  ``Image.open`` → pytesseract re-encodes a PNG temp file,
+* ``gray`` — ``ocr_engine.render_page_image``: grayscale pixmap wrapped by
+  ``Image.frombuffer`` (no copy) → raw PGM temp file,
+
+stopping just before the ``tesseract`` binary would run.  Reports per-page
+time and the peak resident memory each path adds, measured in a fresh
+process per mode.
+
+Usage::
+
+    python -m benchmarks.bench_ocr_render
+    python -m benchmarks.bench_ocr_render --pdf scan.pdf --dpi 300 --pages 10
+"""
+
+import argparse
+import multiprocessing
+import os
+import resource
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+import sys
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+
+def _sample_pdf() -> bytes:
+    """A contract-like page of dense text, standing in for a scan."""
+    import fitz
+
+    doc = fitz.open()
+    page = doc.new_page()
+    line = "The Receiving Party shall hold all Confidential Information in strict confidence."
+    for i in range(60):
+        page.insert_text((36, 40 + i * 12), f"{i + 1}. {line}", fontsize=9)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def _handoff(img) -> None:
+    """What pytesseract does before spawning tesseract: write the temp file."""
+    fmt = img.format or "PNG"
+    with tempfile.NamedTemporaryFile(suffix=f".{fmt.lower()}") as tmp:
+        img.save(tmp.name, format=fmt)
+
+
+def _render_png(page, dpi: int):
+    import io
+    from PIL import Image
+
+    pix = page.get_pixmap(dpi=dpi)
+    return Image.open(io.BytesIO(pix.tobytes("png")))
+
+
+def _measure(mode: str, pdf: Optional[str], dpi: int, n_pages: int, results) -> None:
+    import fitz
+    from ocr.ocr_engine import render_page_image
+
+    doc = fitz.open(pdf) if pdf else fitz.open(stream=_sample_pdf(), filetype="pdf")
+    render = render_page_image if mode == "gray" else _render_png
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    start = time.perf_counter()
+    for i in range(n_pages):
+        img = render(doc.load_page(i % len(doc)), dpi)
+        img.load()
+        _handoff(img)
+        del img
+    elapsed = time.perf_counter() - start
+
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline
+    results.put({"ms_per_page": elapsed * 1000 / n_pages, "peak_mb": peak_kb / 1024})
+
+
+def run_mode(mode: str, pdf: Optional[str], dpi: int, n_pages: int) -> dict:
+    ctx = multiprocessing.get_context("spawn")
+    results = ctx.Queue()
+    proc = ctx.Process(target=_measure, args=(mode, pdf, dpi, n_pages, results))
+    proc.start()
+    result = results.get()
+    proc.join()
+    return result
+
+
+def benchmark(pdf: Optional[str], dpi: int, n_pages: int) -> None:
+    measured = {mode: run_mode(mode, pdf, dpi, n_pages) for mode in ("png", "gray")}
+    for mode, result in measured.items():
+        print(f"  {mode:4s} {result['ms_per_page']:8.1f} ms/page   +{result['peak_mb']:7.1f} MB peak")
+    png, gray = measured["png"], measured["gray"]
+    print(
+        f"  saved {png['ms_per_page'] - gray['ms_per_page']:.1f} ms/page, "
+        f"{png['peak_mb'] - gray['peak_mb']:.1f} MB peak"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark page rendering for OCR")
+    parser.add_argument("--pdf", type=str, default=None, help="PDF to render (default: generated page)")
+    parser.add_argument("--dpi", type=int, default=300)
+    parser.add_argument("--pages", type=int, default=10)
+    args = parser.parse_args()
+
+    if args.pdf and not os.path.exists(args.pdf):
+        sys.exit(f"PDF not found: {args.pdf}")
+    benchmark(args.pdf, args.dpi, args.pages)
@@ -23,11 +23,18 @@ interface APIResponse {
   entities: Entities;
 }
 
+type StreamEvent =
+  | { event: 'page'; page: number; total_pages: number; chars: number; ocr: boolean }
+  | { event: 'stage'; stage: string }
+  | ({ event: 'result' } & APIResponse)
+  | { event: 'error'; detail: string };
+
 function App() {
   const [file, setFile] = useState<File | null>(null);
   const [isDragging, setIsDragging] = useState(false);
   const [isExtracting, setIsExtracting] = useState(false);
   const [progress, setProgress] = useState(0);
+  const [statusText, setStatusText] = useState('Uploading document...');
   const [result, setResult] = useState<APIResponse | null>(null);
   const [error, setError] = useState<string | null>(null);
   
@@ -68,42 +75,75 @@ function App() {
     if (!file) return;
     
     setIsExtracting(true);
-    setProgress(15);
+    setProgress(5);
+    setStatusText('Uploading document...');
     setError(null);
     setResult(null);
     
     const formData = new FormData();
     formData.append('file', file);
-    
-    // Simulate initial progress while uploading
-    const progressInterval = setInterval(() => {
-      setProgress(p => p < 85 ? p + 2 : p);
-    }, 200);
 
     try {
-      const response = await fetch('http://localhost:8000/extract', {
+      const response = await fetch('http://localhost:8000/extract/stream', {
         method: 'POST',
         body: formData,
       });
 
-      clearInterval(progressInterval);
-      setProgress(100);
-
-      if (!response.ok) {
+      if (!response.ok || !response.body) {
         const errorData = await response.json();
         throw new Error(errorData.detail || "Failed to extract entities");
       }
 
-      const data: APIResponse = await response.json();
+      // Read NDJSON progress events as each page finishes
+      const reader = response.body.getReader();
+      const decoder = new TextDecoder();
+      let buffer = '';
+      let data: APIResponse | null = null;
+
+      while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+
+        const lines = buffer.split('\n');
+        buffer = lines.pop() ?? '';
+        for (const line of lines) {
+          if (!line.trim()) continue;
+          const evt: StreamEvent = JSON.parse(line);
+
+          if (evt.event === 'page') {
+            setProgress(5 + Math.round((evt.page / evt.total_pages) * 80));
+            setStatusText(`Reading page ${evt.page} of ${evt.total_pages}${evt.ocr ? ' (OCR)' : ''}...`);
+          } else if (evt.event === 'stage') {
+            setProgress(90);
+            setStatusText('Extracting legal entities...');
+          } else if (evt.event === 'error') {
+            throw new Error(evt.detail);
+          } else if (evt.event === 'result') {
+            data = {
+              document_id: evt.document_id,
+              filename: evt.filename,
+              metrics: evt.metrics,
+              entities: evt.entities,
+            };
+          }
+        }
+      }
+
+      if (!data) {
+        throw new Error("Extraction stream ended without a result.");
+      }
+
+      setProgress(100);
+      const finalResult = data;
       
       // Artificial delay to make the 100% progress visible and feel smooth
       setTimeout(() => {
-        setResult(data);
+        setResult(finalResult);
         setIsExtracting(false);
       }, 500);
       
     } catch (err: any) {
-      clearInterval(progressInterval);
       setError(err.message || "An unexpected error occurred.");
       setIsExtracting(false);
       setProgress(0);
@@ -231,7 +271,7 @@ function App() {
               {isExtracting && (
                 <div className="progress-container animate-fade-in">
                   <div className="progress-header">
-                    <span className="text-sm font-medium">Running deep learning pipeline...</span>
+                    <span className="text-sm font-medium">{statusText}</span>
                     <span className="text-sm font-bold text-brand-primary">{progress}%</span>
                   </div>
                   <div className="progress-bar-bg">
@@ -3,14 +3,50 @@ import json
 import uuid
 from datetime import datetime, timezone
 import argparse
+from functools import lru_cache
 
-from ocr.ocr_engine import OCRProcessor
+# Only lightweight modules at import time: spaCy, PyMuPDF and Tesseract are
+# imported on first use, so ``--help`` and cache hits never pay for them.
+from ocr.ocr_engine import AdaptiveDPI, OCRProcessor, get_ocr_backend
 from ner.inference import NERInference
+from utils.cache import ResultCache, make_cache_key
 from utils.logger import configure_logger
 
 logger = configure_logger("LexiScanAuto.Main")
 
-def run_prediction(pdf_path: str):
+
+@lru_cache(maxsize=None)
+def _get_cache() -> ResultCache:
+    return ResultCache.from_env()
+
+
+@lru_cache(maxsize=None)
+def _get_processor(
+    cache: ResultCache = None,
+    page_workers: int = 1,
+    ocr_backend: str = None,
+    dpi: int = 300,
+    adaptive: AdaptiveDPI = None,
+) -> OCRProcessor:
+    return OCRProcessor(
+        dpi=dpi, cache=cache, page_workers=page_workers, backend=ocr_backend, adaptive=adaptive,
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_inference() -> NERInference:
+    """Load the NER models once per process and reuse them across calls."""
+    return NERInference()
+
+
+def run_prediction(
+    pdf_path: str,
+    use_cache: bool = True,
+    page_workers: int = 1,
+    ocr_backend: str = None,
+    dpi: int = 300,
+    adaptive: AdaptiveDPI = None,
+):
     logger.info("=== Starting LexiScan Auto CLI ===")
     
     if not os.path.exists(pdf_path):
@@ -18,15 +54,35 @@ def run_prediction(pdf_path: str):
         return
 
     try:
-        # OCR
-        logger.info("Extracting text via OCR...")
-        processor = OCRProcessor(dpi=300)
-        clean_text, metrics = processor.process_pdf(pdf_path)
-        
-        # NER + Rules
-        logger.info("Extracting entities...")
-        inference = NERInference()
-        grouped_entities = inference.extract_grouped(clean_text)
+        cache = _get_cache() if use_cache else None
+        cache_key = None
+        cached = None
+        if cache is not None:
+            # Same version string as the engine _get_inference() loads
+            # (fallback / chunking / matcher settings included), computed
+            # without loading the models.
+            cache_key = make_cache_key(
+                pdf_path, model=NERInference.version_for(), dpi=dpi, force_ocr=False,
+                adaptive_dpi=adaptive, backend=getattr(get_ocr_backend(ocr_backend), "name", None),
+            )
+            cached = cache.get(cache_key)
+
+        if cached is not None:
+            logger.info("Result cache hit — skipping OCR and NER.")
+            metrics, grouped_entities = cached["metrics"], cached["entities"]
+        else:
+            # OCR
+            logger.info("Extracting text via OCR...")
+            processor = _get_processor(cache, page_workers, ocr_backend, dpi, adaptive)
+            clean_text, metrics = processor.process_pdf(pdf_path)
+
+            # NER + Rules
+            logger.info("Extracting entities...")
+            inference = _get_inference()
+            grouped_entities = inference.extract_grouped(clean_text)
+
+            if cache is not None:
+                cache.put(cache_key, {"metrics": metrics, "entities": grouped_entities})
         
         # Output
         output_record = {
@@ -49,6 +105,28 @@ def run_prediction(pdf_path: str):
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="LexiScan Auto CLI Extraction")
     parser.add_argument("--pdf", type=str, help="Path to the PDF file", required=True)
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the extraction result cache")
+    parser.add_argument(
+        "--page-workers", type=int, default=1, help="Processes OCR'ing scanned pages in parallel",
+    )
+    parser.add_argument(
+        "--ocr-backend", choices=["auto", "pytesseract", "tesserocr"], default=None,
+        help="Tesseract binding (default: $LEXISCAN_OCR_BACKEND or auto)",
+    )
+    parser.add_argument("--dpi", type=int, default=300, help="Rasterisation DPI of scanned pages")
+    parser.add_argument(
+        "--adaptive-dpi", type=int, default=0, metavar="FIRST_DPI",
+        help="OCR scanned pages at FIRST_DPI first and re-OCR at --dpi only when confidence is low",
+    )
+    parser.add_argument(
+        "--min-confidence", type=float, default=AdaptiveDPI().min_confidence,
+        help="Mean word confidence (0-100) below which --adaptive-dpi escalates",
+    )
     args = parser.parse_args()
-    
-    run_prediction(args.pdf)
\ No newline at end of file
+
+    adaptive = AdaptiveDPI(args.adaptive_dpi, args.min_confidence) if args.adaptive_dpi > 0 else None
+    run_prediction(
+        args.pdf, use_cache=not args.no_cache,
+        page_workers=args.page_workers, ocr_backend=args.ocr_backend,
+        dpi=args.dpi, adaptive=adaptive,
+    )
\ No newline at end of file
@@ -0,0 +1,214 @@
+"""
+LexiScan Auto — Serving Model Export
+======================================
+Packages a trained pipeline as a minimal serving artefact: the tokenizer,
+the ``ner`` component and whatever embedding layer it listens to — no
+tagger, parser, lemmatizer or attribute ruler.  Optionally prunes the
+string store down to the labels, since token strings are re-interned at
+tokenisation time.
+
+Next to the artefact an ``export_report.json`` records, for the source and
+the exported model alike:
+
+* load time and on-disk size,
+* ``nlp.pipe`` throughput (docs/sec),
+* accuracy (P / R / F1) on held-out data when available, and whether the
+  exported model predicts exactly the same entities.
+
+Usage::
+
+    python -m ner.export --model models/lexiscan_ner --output models/lexiscan_ner_serving
+"""
+
+import argparse
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import spacy
+
+import sys
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from utils.logger import configure_logger
+from ner.inference import DEFAULT_MODEL_DIR, load_pipeline
+
+logger = configure_logger("LexiScanAuto.NER.Export")
+
+REPORT_NAME = "export_report.json"
+
+_SAMPLE_TEXTS = [
+    "This Confidentiality Agreement is entered into on October 12, 2023, between "
+    "Acme Corp (the 'Disclosing Party') and John Doe (the 'Receiving Party').",
+    "The penalty amount for breach is $50,000.00 and falls within the jurisdiction "
+    "of the State of New York.",
+]
+
+
+# ───────────────────────────────────────────────────────────────────────────
+#  Helpers
+# ───────────────────────────────────────────────────────────────────────────
+
+def _dir_size(path: Path) -> int:
+    return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+
+
+def _timed_load(model_dir: str) -> Tuple[Any, float]:
+    start = time.perf_counter()
+    nlp = spacy.load(model_dir)
+    return nlp, time.perf_counter() - start
+
+
+def _throughput(nlp, texts: List[str], repeats: int = 20) -> float:
+    batch = texts * repeats
+    list(nlp.pipe(texts))  # warm up
+    start = time.perf_counter()
+    for _ in nlp.pipe(batch):
+        pass
+    elapsed = time.perf_counter() - start
+    return round(len(batch) / elapsed, 1) if elapsed else float("inf")
+
+
+def _entities(nlp, texts: List[str]) -> List[List[Tuple[int, int, str]]]:
+    return [
+        [(ent.start_char, ent.end_char, ent.label_) for ent in doc.ents]
+        for doc in nlp.pipe(texts)
+    ]
+
+
+def _accuracy(model_dir: str, eval_data) -> Optional[Dict[str, float]]:
+    if not eval_data:
+        return None
+    from ner.evaluate import evaluate_model
+
+    scores = evaluate_model(model_dir, eval_data)
+    if not scores:
+        return None
+    return {
+        "precision": round(scores.get("ents_p") or 0.0, 4),
+        "recall": round(scores.get("ents_r") or 0.0, 4),
+        "f1": round(scores.get("ents_f") or 0.0, 4),
+    }
+
+
+def _prune_strings(nlp, output_dir: Path) -> int:
+    """Rewrite ``vocab/strings.json`` with only the component labels."""
+    keep = set()
+    for _, component in nlp.pipeline:
+        keep.update(getattr(component, "labels", ()))
+
+    strings_path = output_dir / "vocab" / "strings.json"
+    with open(strings_path, "r", encoding="utf-8") as fh:
+        original = json.load(fh)
+    pruned = [s for s in original if s in keep]
+    with open(strings_path, "w", encoding="utf-8") as fh:
+        json.dump(pruned, fh)
+    return len(original) - len(pruned)
+
+
+# ───────────────────────────────────────────────────────────────────────────
+#  Export
+# ───────────────────────────────────────────────────────────────────────────
+
+def export_serving_model(
+    model_dir: str,
+    output_dir: str,
+    prune_strings: bool = True,
+    eval_data: Optional[List[Tuple[str, Dict[str, Any]]]] = None,
+    sample_texts: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """Export a NER-only serving copy of *model_dir* and report on it.
+
+    Parameters
+    ----------
+    model_dir : str
+        Trained pipeline (e.g. the output of ``train_ner``).
+    output_dir : str
+        Destination of the slim artefact (overwritten).
+    prune_strings : bool
+        Keep only label strings in the string store.
+    eval_data : list, optional
+        SpaCy-format examples for the accuracy comparison.
+    sample_texts : list[str], optional
+        Texts used for throughput and output-equality checks.
+
+    Returns
+    -------
+    dict
+        The report also written to ``<output_dir>/export_report.json``.
+    """
+    texts = (sample_texts or [text for text, _ in (eval_data or [])[:50]]) or _SAMPLE_TEXTS
+    output = Path(output_dir)
+
+    slim = load_pipeline(model_dir, "ner")
+    output.mkdir(parents=True, exist_ok=True)
+    slim.to_disk(output)
+    pruned = _prune_strings(slim, output) if prune_strings else 0
+    logger.info(f"Serving model {slim.pipe_names} written → {output} ({pruned} strings pruned)")
+
+    source_nlp, source_load = _timed_load(model_dir)
+    export_nlp, export_load = _timed_load(str(output))
+
+    report = {
+        "source": {
+            "path": str(model_dir),
+            "pipeline": list(source_nlp.pipe_names),
+            "size_bytes": _dir_size(Path(model_dir)),
+            "load_seconds": round(source_load, 3),
+            "docs_per_sec": _throughput(source_nlp, texts),
+            "accuracy": _accuracy(model_dir, eval_data),
+        },
+        "export": {
+            "path": str(output),
+            "pipeline": list(export_nlp.pipe_names),
+            "size_bytes": _dir_size(output),
+            "load_seconds": round(export_load, 3),
+            "docs_per_sec": _throughput(export_nlp, texts),
+            "accuracy": _accuracy(str(output), eval_data),
+            "pruned_strings": pruned,
+        },
+        "identical_entities": _entities(source_nlp, texts) == _entities(export_nlp, texts),
+    }
+
+    if not report["identical_entities"]:
+        logger.warning("Exported model predictions differ from the source model!")
+
+    with open(output / REPORT_NAME, "w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=2)
+    logger.info(
+        f"Export: {report['export']['size_bytes'] / 1e6:.1f} MB "
+        f"(source {report['source']['size_bytes'] / 1e6:.1f} MB), "
+        f"load {export_load:.2f}s (source {source_load:.2f}s), "
+        f"{report['export']['docs_per_sec']} docs/s (source {report['source']['docs_per_sec']})"
+    )
+    return report
+
+
+# ───────────────────────────────────────────────────────────────────────────
+#  CLI entry point
+# ───────────────────────────────────────────────────────────────────────────
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export a slim NER serving model")
+    parser.add_argument("--model", type=str, default=DEFAULT_MODEL_DIR)
+    parser.add_argument("--output", type=str, default=f"{DEFAULT_MODEL_DIR}_serving")
+    parser.add_argument("--keep-strings", action="store_true", help="Do not prune the string store")
+    args = parser.parse_args()
+
+    eval_data = None
+    annotations_dir = Path(__file__).resolve().parent.parent / "data" / "annotations"
+    if annotations_dir.exists():
+        from ner.train import get_train_val_split
+        _, eval_data = get_train_val_split(annotations_dir)
+
+    if not os.path.exists(args.model):
+        logger.error(f"Model directory {args.model} does not exist. Please run training first.")
+        sys.exit(1)
+
+    try:
+        export_serving_model(args.model, args.output, not args.keep_strings, eval_data)
+    except (OSError, ValueError) as exc:
+        logger.error(f"Export failed: {exc}")
+        sys.exit(1)
@@ -4,29 +4,342 @@ LexiScan Auto — NER Inference Engine
 Performs production inference on extracted OCR text using a trained SpaCy
 NER model.  Integrates the rule-based post-processing layer from
 ``rules.validators`` to return clean, validated entities.
+
+spaCy is imported on the first model load rather than at module import, so
+callers that only need ``get_model_version`` or
+``NERInference.version_for`` (cache lookups) stay cheap.
 """
 
+import json
 import os
 import string
+import time
+from bisect import bisect_left
+from itertools import repeat
 from pathlib import Path
-from typing import Any, Dict, List
-
-import spacy
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
 
 from utils.logger import configure_logger
-from rules.validators import apply_all_rules, group_entities
+from utils.metrics import NER_FALLBACK, STAGE_SECONDS, time_stage
+from rules.entity import Entity
+from rules.matchers import find_entities
+from rules.validators import apply_rules_to_records, group_entities
 
 logger = configure_logger("LexiScanAuto.NER.Inference")
 
 
+def _timed(docs: Iterable, stage: str) -> Iterable:
+    """Record the time spent producing each item of a lazy ``nlp.pipe``."""
+    iterator = iter(docs)
+    while True:
+        start = time.perf_counter()
+        try:
+            doc = next(iterator)
+        except StopIteration:
+            return
+        STAGE_SECONDS.observe(time.perf_counter() - start, stage=stage)
+        yield doc
+
+
+def _observe_batch(start: float, count: int, stage: str) -> None:
+    """Record a batch's elapsed time as an equal share per document."""
+    if count:
+        share = (time.perf_counter() - start) / count
+        for _ in range(count):
+            STAGE_SECONDS.observe(share, stage=stage)
+
+
+def _chunk_bounds(text: str, max_chars: int) -> List[Tuple[int, int]]:
+    """Split *text* into consecutive ``(start, end)`` windows of at most
+    *max_chars*, cut after a line break where one is available."""
+    bounds: List[Tuple[int, int]] = []
+    start = 0
+    while start < len(text):
+        end = min(start + max_chars, len(text))
+        if end < len(text):
+            cut = text.rfind("\n", start, end)
+            if cut > start:
+                end = cut + 1
+        bounds.append((start, end))
+        start = end
+    return bounds
+
+
+def _window_end(text: str, start: int, limit: int) -> int:
+    """Best cut point in ``text[start:limit]``: after a line break, else a
+    sentence end, else a space — searched in the second half of the window."""
+    low = start + (limit - start) // 2
+    cut = text.rfind("\n", low, limit)
+    if cut >= 0:
+        return cut + 1
+    cut = max(text.rfind(mark, low, limit) for mark in (". ", "? ", "! ", "; "))
+    if cut >= 0:
+        return cut + 2
+    cut = text.rfind(" ", low, limit)
+    return cut + 1 if cut >= 0 else limit
+
+
+def _window_bounds(text: str, size: int, overlap: int) -> List[Tuple[int, int, int, int]]:
+    """Split *text* into overlapping windows aligned to lines / sentences.
+
+    Returns ``(start, end, own_start, own_end)`` per window.  Consecutive
+    windows overlap by about *overlap* characters; the owned ranges split
+    each overlap at its midpoint and tile the text exactly, so every
+    position belongs to one window.
+    """
+    if len(text) <= size:
+        return [(0, len(text), 0, len(text))]
+
+    spans: List[Tuple[int, int]] = []
+    start = 0
+    while True:
+        if start + size >= len(text):
+            spans.append((start, len(text)))
+            break
+        end = _window_end(text, start, start + size)
+        spans.append((start, end))
+        # Next window starts *overlap* chars back, at a word boundary
+        next_start = max(end - overlap, start + 1)
+        space = text.find(" ", next_start, end)
+        newline = text.find("\n", next_start, end)
+        boundary = min((pos for pos in (space, newline) if pos >= 0), default=-1)
+        start = boundary + 1 if boundary >= 0 else next_start
+
+    windows = []
+    own_start = 0
+    for idx, (start, end) in enumerate(spans):
+        own_end = (end + spans[idx + 1][0]) // 2 if idx + 1 < len(spans) else end
+        windows.append((start, end, own_start, own_end))
+        own_start = own_end
+    return windows
+
+
+class SpanIndex:
+    """Sorted, non-overlapping character spans with ``O(log n)`` overlap tests."""
+
+    def __init__(self):
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+
+    def overlaps(self, start: int, end: int) -> bool:
+        """Whether ``[start, end)`` intersects any indexed span."""
+        idx = bisect_left(self._starts, end)
+        # Spans are disjoint, so only the last one starting before *end*
+        # can reach past *start*.
+        return idx > 0 and self._ends[idx - 1] > start
+
+    def add(self, start: int, end: int) -> bool:
+        """Index ``[start, end)`` unless it overlaps; returns whether it was added."""
+        if self.overlaps(start, end):
+            return False
+        idx = bisect_left(self._starts, start)
+        self._starts.insert(idx, start)
+        self._ends.insert(idx, end)
+        return True
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+
+DEFAULT_MODEL_DIR = str(Path(__file__).resolve().parent.parent / "models" / "lexiscan_ner")
+
+# Labels the API reports
+TARGET_LABELS = frozenset({"DATE", "PARTY", "AMOUNT", "JURISDICTION"})
+
+# When the base model runs in addition to the custom one (see NERInference)
+FALLBACK_POLICIES = ("always", "per-label-missing", "per-chunk-empty")
+
+# Pipeline profiles: which components to keep when loading a model.
+# ``None`` keeps the full pipeline as trained / packaged.
+PIPELINE_PROFILES: Dict[str, Optional[Set[str]]] = {
+    "ner": {"ner"},
+    "full": None,
+}
+
+# Components that can feed others through listener layers
+_EMBEDDING_FACTORIES = {"tok2vec", "transformer", "curated_transformer"}
+
+
+# ──────────────────────────────────────────────────────────────────────────
+#  Pipeline profiles
+# ──────────────────────────────────────────────────────────────────────────
+
+def _resolve_model_path(name_or_path: Union[str, Path]) -> Optional[Path]:
+    """Directory holding ``config.cfg`` for a model path or installed package."""
+    path = Path(name_or_path)
+    if (path / "config.cfg").exists():
+        return path
+    import spacy
+
+    if spacy.util.is_package(str(name_or_path)):
+        package_dir = spacy.util.get_package_path(str(name_or_path))
+        meta = spacy.util.load_meta(package_dir / "meta.json")
+        data_dir = package_dir / f"{meta['lang']}_{meta['name']}-{meta['version']}"
+        if (data_dir / "config.cfg").exists():
+            return data_dir
+    return None
+
+
+def _listener_upstreams(node: Any) -> Set[str]:
+    """Names of the embedding components a component config listens to."""
+    found: Set[str] = set()
+    if isinstance(node, dict):
+        architecture = str(node.get("@architectures", ""))
+        if "Listener" in architecture and "upstream" in node:
+            found.add(node["upstream"])
+        for value in node.values():
+            found |= _listener_upstreams(value)
+    return found
+
+
+def pipeline_excludes(config: Dict[str, Any], keep: Set[str]) -> List[str]:
+    """Components of *config* that can be excluded while keeping *keep* working.
+
+    Anything a kept component listens to (a shared ``tok2vec`` or
+    ``transformer``) is kept as well; everything else is excluded, so its
+    weights are never even deserialised.
+    """
+    pipeline = list(config["nlp"]["pipeline"])
+    components = config.get("components", {})
+    needed = {name for name in pipeline if name in keep}
+
+    for name in list(needed):
+        for upstream in _listener_upstreams(components.get(name, {})):
+            if upstream == "*":
+                needed |= {
+                    other for other in pipeline
+                    if components.get(other, {}).get("factory") in _EMBEDDING_FACTORIES
+                }
+            else:
+                needed.add(upstream)
+
+    return [name for name in pipeline if name not in needed]
+
+
+def load_pipeline(name_or_path: Union[str, Path], profile: str = "ner"):
+    """``spacy.load`` restricted to the components the *profile* needs.
+
+    The exclusion list is derived from each model's own ``config.cfg``, so a
+    model whose NER listens to a shared ``tok2vec`` keeps it.  If the config
+    cannot be inspected the full pipeline is loaded.
+    """
+    if profile not in PIPELINE_PROFILES:
+        raise ValueError(
+            f"Unknown pipeline profile {profile!r}; expected one of {sorted(PIPELINE_PROFILES)}."
+        )
+
+    import spacy
+
+    keep = PIPELINE_PROFILES[profile]
+    exclude: List[str] = []
+    if keep is not None:
+        model_path = _resolve_model_path(name_or_path)
+        if model_path is None:
+            logger.warning(f"Cannot inspect {name_or_path}; loading the full pipeline.")
+        else:
+            config = spacy.util.load_config(model_path / "config.cfg", interpolate=False)
+            exclude = pipeline_excludes(config, keep)
+
+    nlp = spacy.load(name_or_path, exclude=exclude)
+    logger.info(f"Loaded {name_or_path} with pipeline {nlp.pipe_names} (profile '{profile}').")
+    return nlp
+
+
+def get_model_version(model_dir: str = None) -> str:
+    """Identify the model artefact for cache keys without loading spaCy.
+
+    Combines ``name``/``version`` from ``meta.json`` with the size and
+    mtime of the NER weights, so a retrain (which keeps the base model's
+    meta) still produces a new version string.
+    """
+    model_dir = model_dir or DEFAULT_MODEL_DIR
+    try:
+        with open(os.path.join(model_dir, "meta.json"), "r", encoding="utf-8") as fh:
+            meta = json.load(fh)
+        version = f"{meta.get('name', 'unknown')}-{meta.get('version', '0')}"
+    except (OSError, ValueError):
+        return "none"
+
+    weights = os.path.join(model_dir, "ner", "model")
+    if os.path.exists(weights):
+        stat = os.stat(weights)
+        version += f"+{stat.st_size:x}.{stat.st_mtime_ns:x}"
+    return version
+
+
 class NERInference:
     """Wraps SpaCy models for production entity extraction."""
 
-    def __init__(self, model_dir: str = None):
-        """Load the serialised NER model and a general English fallback."""
+    def __init__(
+        self,
+        model_dir: str = None,
+        batch_size: int = 32,
+        n_process: int = 1,
+        profile: str = "ner",
+        fallback_policy: str = "always",
+        fallback_chunk_chars: int = 1000,
+        chunk_chars: Optional[int] = 20000,
+        chunk_overlap: int = 400,
+        use_matcher: bool = True,
+    ):
+        """Load the serialised NER model and a general English fallback.
+
+        Parameters
+        ----------
+        model_dir : str, optional
+            Path to the custom model (default ``models/lexiscan_ner``).
+        batch_size : int
+            Default ``nlp.pipe`` batch size for the ``*_many`` methods.
+        n_process : int
+            Default ``nlp.pipe`` process count for the ``*_many`` methods.
+        profile : str
+            Pipeline profile (see ``PIPELINE_PROFILES``).  ``"ner"`` drops
+            tagger, parser, lemmatizer etc. at load time since only
+            ``doc.ents`` is read; ``"full"`` loads every component.
+        fallback_policy : str
+            When ``en_core_web_sm`` runs after the custom model:
+            ``"always"`` on every document; ``"per-label-missing"`` only if
+            the custom model found no entity of some target label (and only
+            those labels are taken from it); ``"per-chunk-empty"`` only on
+            the text chunks where the custom model found nothing.
+        fallback_chunk_chars : int
+            Chunk size for ``"per-chunk-empty"``.
+        chunk_chars : int, optional
+            Longer texts are split into line- / sentence-aligned windows of
+            at most this many characters that are processed as separate
+            ``nlp.pipe`` items, which bounds ``Doc`` memory and stays under
+            ``nlp.max_length``.  ``None`` or ``0`` disables windowing.
+        chunk_overlap : int
+            Characters shared by consecutive windows, so entities crossing
+            a cut are still seen whole by one of them.
+        use_matcher : bool
+            Run the deterministic DATE / AMOUNT / JURISDICTION matchers
+            (``rules.matchers``) first.  Their spans are pre-set on the
+            custom model's ``Doc`` so NER predicts around them, take
+            priority over model predictions, and count as custom-model
+            coverage for the cascade fallback policies.
+        """
+        if fallback_policy not in FALLBACK_POLICIES:
+            raise ValueError(
+                f"Unknown fallback policy {fallback_policy!r}; expected one of {FALLBACK_POLICIES}."
+            )
+        if chunk_chars and not 0 <= chunk_overlap < chunk_chars // 2:
+            raise ValueError("chunk_overlap must be smaller than half of chunk_chars.")
+
+        self.batch_size = batch_size
+        self.n_process = n_process
+        self.profile = profile
+        self.fallback_policy = fallback_policy
+        self.fallback_chunk_chars = fallback_chunk_chars
+        self.chunk_chars = chunk_chars or None
+        self.chunk_overlap = chunk_overlap
+        self.use_matcher = use_matcher
+
         if model_dir is None:
-            base_dir = Path(__file__).resolve().parent.parent
-            model_dir = str(base_dir / "models" / "lexiscan_ner")
+            model_dir = DEFAULT_MODEL_DIR
+        self.model_version = self.version_for(
+            model_dir, fallback_policy, chunk_chars, chunk_overlap, use_matcher,
+        )
 
         logger.info("Initializing Hybrid NER Engines...")
         
@@ -34,19 +347,75 @@ class NERInference:
         self.custom_nlp = None
         if os.path.exists(model_dir):
             try:
-                self.custom_nlp = spacy.load(model_dir)
+                self.custom_nlp = load_pipeline(model_dir, profile)
                 logger.info(f"Custom LexiScan model loaded from {model_dir}")
             except Exception as e:
                 logger.warning(f"Could not load custom model: {e}")
 
         # 2. Always load the base English model for Zero-Shot/Out-Of-Box mapping
         try:
-            self.base_nlp = spacy.load("en_core_web_sm")
+            self.base_nlp = load_pipeline("en_core_web_sm", profile)
             logger.info("Base English model (en_core_web_sm) loaded successfully.")
         except OSError:
             logger.error("en_core_web_sm is not installed. Pipeline will be severely degraded.")
             self.base_nlp = None
 
+        # 3. Tokenize once and run both models over the same Doc when possible
+        self._enable_doc_sharing()
+
+    @staticmethod
+    def version_for(
+        model_dir: str = None,
+        fallback_policy: str = "always",
+        chunk_chars: Optional[int] = 20000,
+        chunk_overlap: int = 400,
+        use_matcher: bool = True,
+    ) -> str:
+        """The ``model_version`` an engine built with these settings reports.
+
+        Identifies everything that changes the output (used in cache keys)
+        without loading spaCy or the models.
+        """
+        version = get_model_version(model_dir)
+        if fallback_policy != "always":
+            version += f"|fallback={fallback_policy}"
+        if chunk_chars:
+            version += f"|chunk={chunk_chars}:{chunk_overlap}"
+        if use_matcher:
+            version += "|matcher"
+        return version
+
+    def _enable_doc_sharing(self) -> bool:
+        """Check that the base model can run on Docs made by the custom model.
+
+        Requires identical tokenizer rules and lexeme norm tables (so the
+        base NER sees exactly the features it was trained on) and no static
+        vectors in the base model.  Registers the base labels in the custom
+        vocab so ``ent.label_`` resolves on shared Docs.  Sets and returns
+        ``self.share_doc``; call again after swapping either model.
+        """
+        self.share_doc = False
+        if self.custom_nlp is None or self.base_nlp is None:
+            return False
+
+        custom, base = self.custom_nlp, self.base_nlp
+        compatible = (
+            custom.lang == base.lang
+            and len(base.vocab.vectors) == 0
+            and custom.tokenizer.to_bytes(exclude=["vocab"]) == base.tokenizer.to_bytes(exclude=["vocab"])
+            and custom.vocab.lookups.to_bytes() == base.vocab.lookups.to_bytes()
+        )
+        if not compatible:
+            logger.info("Custom and base tokenization differ; running models on separate Docs.")
+            return False
+
+        for _, component in base.pipeline:
+            for label in getattr(component, "labels", ()):
+                custom.vocab.strings.add(label)
+        logger.info("Custom and base models share one tokenization per document.")
+        self.share_doc = True
+        return True
+
     def _is_valid_entity(self, text: str, ent_label: str) -> bool:
         """Validates a predicted span to reject noise and punctuation entities."""
         text = text.strip()
@@ -56,64 +425,349 @@ class NERInference:
             return False
         return True
 
-    def extract_entities_raw(self, text: str) -> List[Dict[str, Any]]:
-        """Run NER and return raw entity dicts mapping base entities to target ontology."""
-        entities: List[Dict[str, Any]] = []
-        found_spans = set()
+    def _collect_entities(
+        self,
+        custom_ents: Optional[Sequence],
+        base_ents: Optional[Sequence],
+        base_segments: Sequence[Tuple[int, Sequence]] = (),
+        base_labels: Optional[Set[str]] = None,
+    ) -> List[Entity]:
+        """Merge custom and base entity spans for one document.
+
+        *base_segments* holds extra ``(char_offset, ents)`` base predictions
+        made on slices of the document; *base_labels* restricts which mapped
+        labels are taken from the base model.
+        """
+        entities: List[Entity] = []
+        found_spans = SpanIndex()
 
         # Target valid entities
-        valid_custom_labels = {"DATE", "PARTY", "AMOUNT", "JURISDICTION"}
+        valid_custom_labels = TARGET_LABELS
 
         # Custom Model Priority
-        if self.custom_nlp:
-            doc_custom = self.custom_nlp(text)
-            for ent in doc_custom.ents:
+        if custom_ents is not None:
+            for ent in custom_ents:
                 val = ent.text.strip()
                 if self._is_valid_entity(val, ent.label_) and ent.label_ in valid_custom_labels:
-                    entities.append({
-                        "entity": ent.label_,
-                        "value": val,
-                        "start_char": ent.start_char,
-                        "end_char": ent.end_char,
-                    })
-                    found_spans.add((ent.start_char, ent.end_char))
+                    entities.append(Entity(ent.label_, val, ent.start_char, ent.end_char))
+                    found_spans.add(ent.start_char, ent.end_char)
 
         # Base Model Fallback with Ontology Mapping
-        if self.base_nlp:
-            doc_base = self.base_nlp(text)
-            
-            # Map SpaCy's default ontology to our legal constraints
-            label_map = {
-                "ORG": "PARTY",
-                "PERSON": "PARTY",
-                "MONEY": "AMOUNT",
-                "DATE": "DATE",
-                "GPE": "JURISDICTION"
-            }
-            
-            for ent in doc_base.ents:
+        if base_ents is not None:
+            base_segments = [(0, base_ents), *base_segments]
+
+        # Map SpaCy's default ontology to our legal constraints
+        label_map = {
+            "ORG": "PARTY",
+            "PERSON": "PARTY",
+            "MONEY": "AMOUNT",
+            "DATE": "DATE",
+            "GPE": "JURISDICTION"
+        }
+
+        for offset, ents in base_segments:
+            for ent in ents:
                 mapped_label = label_map.get(ent.label_)
-                if mapped_label:
+                if mapped_label and (base_labels is None or mapped_label in base_labels):
                     val = ent.text.strip()
-                    # Only add if we haven't already extracted something at this exact location
-                    if self._is_valid_entity(val, mapped_label) and (ent.start_char, ent.end_char) not in found_spans:
-                        entities.append({
-                            "entity": mapped_label,
-                            "value": val,
-                            "start_char": ent.start_char,
-                            "end_char": ent.end_char,
-                        })
+                    start, end = ent.start_char + offset, ent.end_char + offset
+                    # Only add if no custom entity already covers any part of this span
+                    if self._is_valid_entity(val, mapped_label) and not found_spans.overlaps(start, end):
+                        entities.append(Entity(mapped_label, val, start, end))
 
         return entities
 
+    # ── Deterministic matchers ───────────────────────────────────────
+
+    def _find_matches(self, texts: List[str]) -> List[Sequence]:
+        if not self.use_matcher:
+            return [()] * len(texts)
+        return [find_entities(text) for text in texts]
+
+    def _custom_inputs(self, texts: List[str], matches: List[Sequence]) -> Iterable:
+        """Texts for the custom model, as Docs with matcher spans pre-set.
+
+        The NER component keeps pre-set entities and only predicts the
+        remaining tokens, so it cannot contradict a matcher span.
+        """
+        for text, matched in zip(texts, matches):
+            if not matched:
+                yield text
+                continue
+            doc = self.custom_nlp.make_doc(text)
+            spans = [
+                doc.char_span(m.start_char, m.end_char, label=m.label_, alignment_mode="contract")
+                for m in matched
+            ]
+            doc.set_ents([span for span in spans if span], default="unmodified")
+            yield doc
+
+    @staticmethod
+    def _merge_matches(matched: Sequence, custom_ents: Optional[Sequence]) -> Sequence:
+        """Matcher spans plus the custom entities that do not overlap them."""
+        if not matched:
+            return custom_ents
+        index = SpanIndex()
+        for span in matched:
+            index.add(span.start_char, span.end_char)
+        merged = list(matched) + [
+            ent for ent in custom_ents or ()
+            if not index.overlaps(ent.start_char, ent.end_char)
+        ]
+        return sorted(merged, key=lambda ent: ent.start_char)
+
+    # ── Cascade fallback ─────────────────────────────────────────────
+
+    def _plan_fallback(
+        self,
+        text: str,
+        custom_ents: Sequence,
+    ) -> Tuple[List[Tuple[int, int]], Optional[Set[str]]]:
+        """Decide where (char ranges) and for which labels the base model runs."""
+        valid = [
+            ent for ent in custom_ents
+            if ent.label_ in TARGET_LABELS and self._is_valid_entity(ent.text, ent.label_)
+        ]
+
+        if self.fallback_policy == "per-label-missing":
+            missing = set(TARGET_LABELS - {ent.label_ for ent in valid})
+            fired = bool(missing) and bool(text)
+            NER_FALLBACK.inc(policy=self.fallback_policy, outcome="fired" if fired else "skipped")
+            return ([(0, len(text))] if fired else []), missing
+
+        # per-chunk-empty
+        covered = SpanIndex()
+        for ent in valid:
+            covered.add(ent.start_char, ent.end_char)
+        ranges = []
+        for start, end in _chunk_bounds(text, self.fallback_chunk_chars):
+            if covered.overlaps(start, end):
+                NER_FALLBACK.inc(policy=self.fallback_policy, outcome="skipped")
+            else:
+                NER_FALLBACK.inc(policy=self.fallback_policy, outcome="fired")
+                ranges.append((start, end))
+        return ranges, None
+
+    def _extract_cascade_many(
+        self,
+        texts: List[str],
+        batch_size: int,
+        n_process: Optional[int],
+    ) -> List[List[Entity]]:
+        """Custom model everywhere, base model only where the policy fires."""
+        results: List[List[Entity]] = []
+        matches = self._find_matches(texts)
+        custom_docs = self._pipe(
+            self.custom_nlp, texts, batch_size, n_process, "ner_custom", matches,
+        )
+
+        from spacy.util import minibatch
+
+        for batch in minibatch(zip(texts, custom_docs, matches), size=batch_size):
+            custom_ents = [
+                self._merge_matches(matched, doc.ents if doc is not None else ())
+                for _, doc, matched in batch
+            ]
+            plans = [
+                self._plan_fallback(text, ents)
+                for (text, _, _), ents in zip(batch, custom_ents)
+            ]
+
+            # One base-model pass over every slice that needs it
+            slices = [
+                (doc_idx, start, text[start:end])
+                for doc_idx, ((text, _, _), (ranges, _)) in enumerate(zip(batch, plans))
+                for start, end in ranges
+            ]
+            segments: List[List[Tuple[int, Sequence]]] = [[] for _ in batch]
+            if slices and self.base_nlp is not None:
+                start_time = time.perf_counter()
+                base_docs = self.base_nlp.pipe((piece for _, _, piece in slices), batch_size=batch_size)
+                for (doc_idx, offset, _), doc in zip(slices, base_docs):
+                    segments[doc_idx].append((offset, doc.ents))
+                _observe_batch(start_time, len(slices), "ner_base")
+
+            results.extend(
+                self._collect_entities(ents, None, segs, labels)
+                for ents, segs, (_, labels) in zip(custom_ents, segments, plans)
+            )
+        return results
+
+    @staticmethod
+    def _hand_over(doc) -> Tuple:
+        """Take the custom entities off a shared Doc before the base model runs."""
+        custom_ents = tuple(doc.ents)
+        doc.set_ents([], default="missing")
+        return custom_ents
+
+    def extract_entities_raw(self, text: str) -> List[Dict[str, Any]]:
+        """Run NER and return raw entity dicts mapping base entities to target ontology."""
+        return [ent.to_dict() for ent in self._raw_entities(text)]
+
+    def _raw_entities(self, text: str) -> List[Entity]:
+        """:meth:`extract_entities_raw` as ``Entity`` records, for the rule layer."""
+        if self.chunk_chars and len(text) > self.chunk_chars:
+            return self._raw_entities_many([text], n_process=1)[0]
+        if self.fallback_policy != "always":
+            return self._extract_cascade_many([text], 1, 1)[0]
+        if self.base_nlp:
+            NER_FALLBACK.inc(policy="always", outcome="fired")
+
+        matched = self._find_matches([text])[0]
+
+        if self.share_doc and self.custom_nlp and self.base_nlp:
+            with time_stage("ner_custom"):
+                doc = self.custom_nlp(next(self._custom_inputs([text], [matched])))
+            custom_ents = self._merge_matches(matched, self._hand_over(doc))
+            with time_stage("ner_base"):
+                doc = self.base_nlp(doc)
+            return self._collect_entities(custom_ents, doc.ents)
+
+        custom_ents = base_ents = None
+        if self.custom_nlp:
+            with time_stage("ner_custom"):
+                custom_ents = self.custom_nlp(next(self._custom_inputs([text], [matched]))).ents
+        if self.base_nlp:
+            with time_stage("ner_base"):
+                base_ents = self.base_nlp(text).ents
+        return self._collect_entities(self._merge_matches(matched, custom_ents), base_ents)
+
+    def _pipe(
+        self,
+        nlp,
+        texts: List[str],
+        batch_size: Optional[int],
+        n_process: Optional[int],
+        stage: str,
+        matches: Optional[List[Sequence]] = None,
+    ) -> Iterable:
+        """Stream *texts* through ``nlp.pipe`` (or yield ``None`` if no model).
+
+        With *matches*, the custom model receives Docs with matcher spans
+        pre-set (see :meth:`_custom_inputs`).
+        """
+        if nlp is None:
+            return repeat(None, len(texts))
+        docs = nlp.pipe(
+            self._custom_inputs(texts, matches) if matches is not None else texts,
+            batch_size=batch_size or self.batch_size,
+            n_process=n_process or self.n_process,
+        )
+        return _timed(docs, stage)
+
+    def extract_entities_raw_many(
+        self,
+        texts: List[str],
+        batch_size: Optional[int] = None,
+        n_process: Optional[int] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """Batched :meth:`extract_entities_raw` backed by ``nlp.pipe``.
+
+        Both models stream their docs lazily, so only one batch of ``Doc``
+        objects per model is alive at a time.  Long texts are first split
+        into overlapping windows (see ``chunk_chars``); windows, not
+        documents, are the unit of batching, and their entities are mapped
+        back to document offsets.
+        """
+        return [
+            [ent.to_dict() for ent in entities]
+            for entities in self._raw_entities_many(texts, batch_size, n_process)
+        ]
+
+    def _raw_entities_many(
+        self,
+        texts: List[str],
+        batch_size: Optional[int] = None,
+        n_process: Optional[int] = None,
+    ) -> List[List[Entity]]:
+        """:meth:`extract_entities_raw_many` as ``Entity`` records, for the rule layer."""
+        texts = list(texts)
+        if not self.chunk_chars or all(len(text) <= self.chunk_chars for text in texts):
+            return self._extract_raw_batch(texts, batch_size, n_process)
+
+        windows = [
+            (doc_idx, bounds)
+            for doc_idx, text in enumerate(texts)
+            for bounds in _window_bounds(text, self.chunk_chars, self.chunk_overlap)
+        ]
+        window_results = self._extract_raw_batch(
+            [texts[doc_idx][start:end] for doc_idx, (start, end, _, _) in windows],
+            batch_size, n_process,
+        )
+
+        results: List[List[Entity]] = [[] for _ in texts]
+        seen = [SpanIndex() for _ in texts]
+        for (doc_idx, (start, _, own_start, own_end)), entities in zip(windows, window_results):
+            for entity in entities:
+                begin, end = entity.start_char + start, entity.end_char + start
+                # Each overlap region is owned by one window; entities that
+                # start there are kept from that window only.
+                if own_start <= begin < own_end and seen[doc_idx].add(begin, end):
+                    entity.start_char, entity.end_char = begin, end
+                    results[doc_idx].append(entity)
+        return results
+
+    def _extract_raw_batch(
+        self,
+        texts: List[str],
+        batch_size: Optional[int],
+        n_process: Optional[int],
+    ) -> List[List[Entity]]:
+        """Run the custom / base models over *texts* as independent items."""
+        if self.fallback_policy != "always":
+            return self._extract_cascade_many(texts, batch_size or self.batch_size, n_process)
+        if self.base_nlp:
+            NER_FALLBACK.inc(len(texts), policy="always", outcome="fired")
+
+        if self.share_doc and self.custom_nlp and self.base_nlp and (n_process or self.n_process) == 1:
+            return self._extract_shared_many(texts, batch_size or self.batch_size)
+
+        matches = self._find_matches(texts)
+        custom_docs = self._pipe(
+            self.custom_nlp, texts, batch_size, n_process, "ner_custom", matches,
+        )
+        base_docs = self._pipe(self.base_nlp, texts, batch_size, n_process, "ner_base")
+        return [
+            self._collect_entities(
+                self._merge_matches(matched, doc_custom.ents if doc_custom is not None else None),
+                doc_base.ents if doc_base is not None else None,
+            )
+            for doc_custom, doc_base, matched in zip(custom_docs, base_docs, matches)
+        ]
+
+    def _extract_shared_many(self, texts: List[str], batch_size: int) -> List[List[Entity]]:
+        """Shared-Doc batched path: each batch is tokenized once, then both models run."""
+        from spacy.util import minibatch
+
+        results: List[List[Entity]] = []
+        for batch in minibatch(texts, size=batch_size):
+            matches = self._find_matches(batch)
+            start = time.perf_counter()
+            docs = list(self.custom_nlp.pipe(self._custom_inputs(batch, matches), batch_size=batch_size))
+            _observe_batch(start, len(docs), "ner_custom")
+
+            custom_ents = [
+                self._merge_matches(matched, self._hand_over(doc))
+                for matched, doc in zip(matches, docs)
+            ]
+
+            start = time.perf_counter()
+            docs = list(self.base_nlp.pipe(docs, batch_size=batch_size))
+            _observe_batch(start, len(docs), "ner_base")
+
+            results.extend(
+                self._collect_entities(ents, doc.ents)
+                for ents, doc in zip(custom_ents, docs)
+            )
+        return results
+
     def extract_entities(self, text: str) -> List[Dict[str, Any]]:
         """Run NER **and** rule-based post-processing.
 
         This is the primary method consumed by the API layer.
         """
-        raw = self.extract_entities_raw(text)
-        validated = apply_all_rules(raw)
-        return validated
+        validated = apply_rules_to_records(self._raw_entities(text))
+        return [ent.to_dict() for ent in validated]
 
     def extract_grouped(self, text: str) -> Dict[str, List[str]]:
         """Run NER + rules and return grouped output.
@@ -123,9 +777,29 @@ class NERInference:
         dict
             ``{"DATE": [...], "PARTY": [...], "AMOUNT": [...], "JURISDICTION": [...]}``
         """
-        validated = self.extract_entities(text)
+        validated = apply_rules_to_records(self._raw_entities(text))
         return group_entities(validated)
 
+    def extract_grouped_many(
+        self,
+        texts: List[str],
+        batch_size: Optional[int] = None,
+        n_process: Optional[int] = None,
+    ) -> List[Dict[str, List[str]]]:
+        """Batched :meth:`extract_grouped` — one grouped dict per input text.
+
+        Parameters
+        ----------
+        texts : list[str]
+            Cleaned document texts.
+        batch_size : int, optional
+            ``nlp.pipe`` batch size (defaults to the instance setting).
+        n_process : int, optional
+            ``nlp.pipe`` worker processes (defaults to the instance setting).
+        """
+        raw_many = self._raw_entities_many(texts, batch_size, n_process)
+        return [group_entities(apply_rules_to_records(raw)) for raw in raw_many]
+
 
 # ──────────────────────────────────────────────────────────────────────────
 #  CLI quick-test
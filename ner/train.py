@@ -10,7 +10,8 @@ The module supports:
 * Automatic train / validation split (80 / 20).
 * Token-level alignment validation to avoid misaligned spans.
 * Configurable epoch count, dropout, and batch sizing.
-* Model serialisation to ``models/lexiscan_ner/``.
+* Model serialisation to ``models/lexiscan_ner/``, plus a slim NER-only
+  serving export to ``models/lexiscan_ner_serving/`` (see ``ner.export``).
 """
 
 import json
@@ -248,6 +249,7 @@ def run_training():
     base_dir = Path(__file__).resolve().parent.parent
     annotations_dir = base_dir / "data" / "annotations"
     model_output_dir = base_dir / "models" / "lexiscan_ner"
+    serving_output_dir = base_dir / "models" / "lexiscan_ner_serving"
 
     if not annotations_dir.exists():
         logger.error(f"Annotations directory not found: {annotations_dir}")
@@ -264,6 +266,9 @@ def run_training():
     )
     train_ner(train_data, val_data, str(model_output_dir), n_iter=20)
 
+    from ner.export import export_serving_model
+    export_serving_model(str(model_output_dir), str(serving_output_dir), eval_data=val_data)
+
 
 if __name__ == "__main__":
     run_training()
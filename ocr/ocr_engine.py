@@ -6,89 +6,328 @@ text using a two-tier strategy:
 
 1. **Native text extraction** via PyMuPDF (``fitz``) — fast, lossless for
    digitally-born PDFs.
-2. **OCR fallback** via ``pdf2image`` + ``pytesseract`` — handles scanned
-   documents where embedded text is absent.
+2. **OCR fallback** via ``pytesseract`` on PyMuPDF-rendered pages —
+   handles scanned documents where embedded text is absent.
+
+Scanned pages can be OCR'd in parallel (``page_workers``): worker processes
+each open the document themselves, and pages are reassembled in order.
+Every Tesseract call takes a slot from a CPU budget shared by all
+processes, so concurrent requests do not oversubscribe the machine.
+
+Tesseract is reached through a pluggable :class:`OCRBackend`:
+``pytesseract`` (one ``tesseract`` process per page) or ``tesserocr``, an
+in-process binding that keeps the language model loaded between pages.
+With :class:`AdaptiveDPI`, scanned pages are OCR'd at a low resolution
+first and re-rendered at the full DPI only when Tesseract is unsure.
+
+OCR'd pages are cached by :func:`page_fingerprint` (what the page draws,
+not which file it is in), so exhibits and signature pages repeated across
+contracts skip Tesseract after the first time.
 
 The engine also provides text-cleaning and quality-evaluation utilities that
 feed directly into the NER training pipeline.
 """
 
+import hashlib
+import io
+import math
+import multiprocessing
 import os
 import re
+import shutil
 import string
-from typing import Dict, List, Tuple
-
-import fitz  # PyMuPDF
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import TYPE_CHECKING, BinaryIO, Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
 
+from utils.cache import ResultCache, make_cache_key
 from utils.logger import configure_logger
+from utils.metrics import (
+    DOCUMENT_PAGES, OCR_FALLBACK_PAGES, OCR_PAGE_CONFIDENCE, OCR_PAGE_DPI, PAGE_CACHE_EVENTS,
+    PAGES_PROCESSED, STAGE_SECONDS, time_stage,
+)
+
+if TYPE_CHECKING:
+    import fitz  # PyMuPDF
+    from PIL import Image
 
 logger = configure_logger("LexiScanAuto.OCR")
 
 # ---------------------------------------------------------------------------
-# Lazy imports — Tesseract + pdf2image are optional on dev machines but
-# required in the Docker container.  We import them lazily so the module
-# loads even when they are absent (tests, annotation review, etc.).
+# Lazy imports — PyMuPDF and Tesseract are imported on first use so that
+# importing this module (the API, the CLI, tests) stays fast.  Tesseract is
+# optional on dev machines but required in the Docker container.
 # ---------------------------------------------------------------------------
-_TESSERACT_AVAILABLE = False
-_PDF2IMAGE_AVAILABLE = False
+_pytesseract = None
+
+
+def _load_pytesseract():
+    """Import ``pytesseract`` once; ``None`` when it is not installed."""
+    global _pytesseract
+    if _pytesseract is None:
+        try:
+            import pytesseract
+            _pytesseract = pytesseract
+        except ImportError:
+            _pytesseract = False
+    return _pytesseract or None
+
+
+# Pages with fewer native characters than this are treated as scanned
+_MIN_NATIVE_CHARS = 30
+
+# Indirect object reference in a PDF dictionary, e.g. ``12 0 R``
+_XREF_RE = re.compile(rb"\d+ \d+ R")
+
+# PyMuPDF is not thread-safe; serialise the cost probe, which runs on the
+# API's request threads rather than inside pool workers.
+_PROBE_LOCK = threading.Lock()
+
+# Parallel OCR: page-worker pools per worker count, and the start method of
+# their processes (``spawn`` is safe to use from threaded callers).
+_PAGE_POOL_CONTEXT = "spawn"
+_page_pools: Dict[int, ProcessPoolExecutor] = {}
+_PAGE_POOL_LOCK = threading.Lock()
+
+# Semaphore bounding concurrent Tesseract calls; see ``set_cpu_budget``
+_cpu_budget = None
+
+# Page-level OCR cache of this process; ``False`` when disabled
+_page_cache = None
+
+
+class PageText(NamedTuple):
+    """Text of one page as produced by :func:`iter_pdf_pages`."""
+
+    page_index: int
+    page_count: int
+    text: str
+    ocr_used: bool
+    dpi: Optional[int] = None           # resolution the OCR text came from
+    confidence: Optional[float] = None  # mean word confidence (adaptive DPI)
 
-try:
-    import pytesseract
-    _TESSERACT_AVAILABLE = True
-except ImportError:
-    pass
 
-try:
-    from pdf2image import convert_from_path
-    _PDF2IMAGE_AVAILABLE = True
-except ImportError:
-    pass
+class PageOCR(NamedTuple):
+    """Result of OCR'ing one page."""
+
+    text: str
+    dpi: int
+    confidence: Optional[float] = None
+    cached: Optional[bool] = None  # page-cache hit / miss; None when disabled
+
+
+class AdaptiveDPI(NamedTuple):
+    """Settings of adaptive-resolution OCR.
+
+    Scanned pages are first OCR'd at *first_dpi*; only pages whose mean
+    Tesseract word confidence is below *min_confidence* (or that yield no
+    words) are rendered and OCR'd again at the full ``dpi``.
+    """
+
+    first_dpi: int = 150
+    min_confidence: float = 75.0
+
+    @classmethod
+    def from_env(cls) -> Optional["AdaptiveDPI"]:
+        """``LEXISCAN_OCR_ADAPTIVE_DPI`` / ``LEXISCAN_OCR_MIN_CONFIDENCE``; ``None`` when off."""
+        first_dpi = int(os.environ.get("LEXISCAN_OCR_ADAPTIVE_DPI", "0"))
+        if first_dpi <= 0:
+            return None
+        min_confidence = os.environ.get("LEXISCAN_OCR_MIN_CONFIDENCE", cls().min_confidence)
+        return cls(first_dpi, float(min_confidence))
 
 
 # ───────────────────────────────────────────────────────────────────────────
 #  Public helper functions (Week 1 deliverables)
 # ───────────────────────────────────────────────────────────────────────────
 
-def extract_text_from_pdf(
-    pdf_path: str,
+def extract_text(
+    source: Union[str, bytes],
     dpi: int = 300,
     force_ocr: bool = False,
+    page_workers: int = 1,
+    backend: Optional[str] = None,
+    adaptive: Optional[AdaptiveDPI] = None,
 ) -> str:
-    """Extract text from a PDF file.
+    """Extract text from a PDF given either as a path or as raw bytes.
 
     Parameters
     ----------
-    pdf_path : str
-        Absolute or relative path to a ``.pdf`` file.
+    source : str | bytes
+        Path to a ``.pdf`` file, or the PDF itself (opened with PyMuPDF's
+        stream interface, without touching the filesystem).
     dpi : int
         Resolution for rasterising pages before OCR (default 300).
     force_ocr : bool
         If *True*, always use Tesseract even when embedded text exists.
+    page_workers : int
+        Processes OCR'ing scanned pages in parallel (1 = in this process).
+    backend : str, optional
+        OCR backend (see :func:`get_ocr_backend`).
+    adaptive : AdaptiveDPI, optional
+        OCR scanned pages at a lower resolution first and go up to *dpi*
+        only where Tesseract's confidence is low.
 
     Returns
     -------
     str
         Raw concatenated text from all pages.
     """
-    if not os.path.isfile(pdf_path):
-        raise FileNotFoundError(f"PDF not found: {pdf_path}")
+    pages = iter_pdf_pages(
+        source, dpi=dpi, force_ocr=force_ocr, page_workers=page_workers,
+        backend=backend, adaptive=adaptive,
+    )
+    return "\n".join(page.text for page in pages)
+
+
+def extract_text_from_pdf(
+    pdf_path: str,
+    dpi: int = 300,
+    force_ocr: bool = False,
+    page_workers: int = 1,
+    backend: Optional[str] = None,
+    adaptive: Optional[AdaptiveDPI] = None,
+) -> str:
+    """Extract text from a PDF file (see :func:`extract_text`)."""
+    return extract_text(pdf_path, dpi, force_ocr, page_workers, backend, adaptive)
+
+
+def extract_text_from_bytes(
+    data: bytes,
+    dpi: int = 300,
+    force_ocr: bool = False,
+    page_workers: int = 1,
+    backend: Optional[str] = None,
+    adaptive: Optional[AdaptiveDPI] = None,
+) -> str:
+    """Extract text from an in-memory PDF (see :func:`extract_text`)."""
+    return extract_text(data, dpi, force_ocr, page_workers, backend, adaptive)
+
+
+def iter_pdf_pages(
+    source: Union[str, bytes],
+    dpi: int = 300,
+    force_ocr: bool = False,
+    page_workers: int = 1,
+    backend: Optional[str] = None,
+    adaptive: Optional[AdaptiveDPI] = None,
+) -> Iterator[PageText]:
+    """Yield each page's text as soon as it is extracted.
+
+    The document is opened eagerly (so a missing file or empty payload
+    raises here), then pages are produced lazily in order — this is what
+    the streaming endpoint uses to report progress page by page.
+
+    With ``page_workers > 1`` the native text of every page is read first
+    and the scanned pages are OCR'd by a pool of worker processes; pages
+    are still yielded in order, each as soon as it and its predecessors
+    are done.
+    """
+    doc = _open_document(source)
+    if page_workers > 1:
+        return _iter_pages_parallel(doc, source, dpi, force_ocr, page_workers, backend, adaptive)
+    return _iter_document_pages(doc, dpi, force_ocr, backend, adaptive)
+
 
-    doc = fitz.open(pdf_path)
-    raw_pages: List[str] = []
+class DocumentCost(NamedTuple):
+    """Cheap pre-pipeline workload estimate from :func:`estimate_pdf_cost`."""
 
-    for page_idx in range(len(doc)):
-        page = doc.load_page(page_idx)
-        page_text = page.get_text("text") if not force_ocr else ""
+    pages: int
+    scanned_pages: int
+    cost: float
 
-        # If page yielded < 30 characters of text, treat as scanned
-        if len(page_text.strip()) < 30 or force_ocr:
-            page_text = _ocr_page(page, dpi) or page_text
 
-        raw_pages.append(page_text)
-        logger.debug(f"Page {page_idx + 1}/{len(doc)}: {len(page_text)} chars")
+def estimate_pdf_cost(
+    source: Union[str, bytes],
+    ocr_page_cost: float = 20.0,
+    max_sampled_pages: int = 50,
+) -> DocumentCost:
+    """Estimate how expensive a PDF will be to process, without OCR.
 
-    doc.close()
-    return "\n".join(raw_pages)
+    Opens the document, counts pages and applies the same native-text
+    heuristic as the extractor to decide which pages will need Tesseract.
+    Documents longer than *max_sampled_pages* are checked on an evenly
+    spaced sample and extrapolated.
+
+    Returns
+    -------
+    DocumentCost
+        ``cost`` is in native-page units: each native page costs 1 and each
+        page expected to need OCR costs *ocr_page_cost*.
+    """
+    with _PROBE_LOCK:
+        doc = _open_document(source)
+        try:
+            page_count = len(doc)
+            if page_count <= max_sampled_pages:
+                sample = range(page_count)
+            else:
+                step = page_count / max_sampled_pages
+                sample = sorted({int(i * step) for i in range(max_sampled_pages)})
+
+            scanned = sum(
+                1 for idx in sample
+                if _needs_ocr(doc.load_page(idx).get_text("text"))
+            )
+        finally:
+            doc.close()
+
+    sampled = len(sample)
+    scanned_pages = round(scanned * page_count / sampled) if sampled else 0
+    cost = (page_count - scanned_pages) + scanned_pages * ocr_page_cost
+    return DocumentCost(page_count, scanned_pages, float(cost))
+
+
+def read_pdf_source(
+    fileobj: BinaryIO,
+    spill_threshold: Optional[int] = None,
+    spill_dir: Optional[str] = None,
+) -> Union[str, bytes]:
+    """Read an uploaded PDF for :func:`extract_text`.
+
+    Parameters
+    ----------
+    fileobj : file-like
+        Binary stream positioned at the start of the PDF.
+    spill_threshold : int, optional
+        Payloads larger than this many bytes are copied to a temporary file
+        instead of being held in memory.  ``None`` never spills.
+    spill_dir : str, optional
+        Directory for spilled files (default: the system temp dir).
+
+    Returns
+    -------
+    bytes | str
+        The PDF bytes, or the path of the spilled temporary file.  Callers
+        should hand the result to :func:`discard_pdf_source` when done.
+    """
+    if spill_threshold is not None:
+        fileobj.seek(0, os.SEEK_END)
+        size = fileobj.tell()
+        fileobj.seek(0)
+        if size > spill_threshold:
+            fd, path = tempfile.mkstemp(suffix=".pdf", dir=spill_dir)
+            with os.fdopen(fd, "wb") as out:
+                shutil.copyfileobj(fileobj, out)
+            logger.debug(f"Spilled {size} byte upload to {path}")
+            return path
+
+    return fileobj.read()
+
+
+def spill_settings() -> Tuple[Optional[int], Optional[str]]:
+    """``(spill_threshold, spill_dir)`` for :func:`read_pdf_source` from
+    ``LEXISCAN_SPILL_THRESHOLD_MB`` (default 64) and ``LEXISCAN_SPILL_DIR``."""
+    threshold = int(float(os.environ.get("LEXISCAN_SPILL_THRESHOLD_MB", "64")) * 1024 * 1024)
+    return threshold, os.environ.get("LEXISCAN_SPILL_DIR") or None
+
+
+def discard_pdf_source(source: Union[str, bytes]) -> None:
+    """Remove the temporary file behind a spilled source, if any."""
+    if isinstance(source, str) and os.path.exists(source):
+        os.remove(source)
 
 
 def clean_ocr_text(text: str) -> str:
@@ -99,16 +338,17 @@ def clean_ocr_text(text: str) -> str:
     * Normalises line endings.
     * Strips leading / trailing whitespace.
     """
-    # Remove non-printable control characters (keep newlines, tabs)
-    text = re.sub(r"[^\S \n\t]+", "", text)
-    # Collapse horizontal whitespace
-    text = re.sub(r"[ \t]+", " ", text)
-    # Collapse vertical whitespace
-    text = re.sub(r"\n{3,}", "\n\n", text)
-    # Remove lines that are purely whitespace
-    lines = [line.strip() for line in text.splitlines()]
-    text = "\n".join(line for line in lines if line)
-    return text.strip()
+    with time_stage("clean_text"):
+        # Remove non-printable control characters (keep newlines, tabs)
+        text = re.sub(r"[^\S \n\t]+", "", text)
+        # Collapse horizontal whitespace
+        text = re.sub(r"[ \t]+", " ", text)
+        # Collapse vertical whitespace
+        text = re.sub(r"\n{3,}", "\n\n", text)
+        # Remove lines that are purely whitespace
+        lines = [line.strip() for line in text.splitlines()]
+        text = "\n".join(line for line in lines if line)
+        return text.strip()
 
 
 def evaluate_text_quality(text: str) -> Dict[str, float]:
@@ -143,16 +383,180 @@ def evaluate_text_quality(text: str) -> Dict[str, float]:
     }
 
 
+# ───────────────────────────────────────────────────────────────────────────
+#  OCR backends
+# ───────────────────────────────────────────────────────────────────────────
+
+class OCRBackend:
+    """Turns a rendered page image into text.
+
+    Backends are created once per process by :func:`get_ocr_backend` and
+    reused for every page.
+    """
+
+    name = "base"
+
+    @classmethod
+    def available(cls) -> bool:
+        return False
+
+    def image_to_string(self, img: "Image.Image") -> str:
+        raise NotImplementedError
+
+    def image_to_data(self, img: "Image.Image") -> Tuple[str, Optional[float]]:
+        """Text plus mean word confidence (0–100; ``None`` if no words)."""
+        raise NotImplementedError
+
+
+class PytesseractBackend(OCRBackend):
+    """``pytesseract``: spawns the ``tesseract`` binary (and reloads its
+    traineddata) for every page.  Always works where Tesseract is on PATH."""
+
+    name = "pytesseract"
+
+    @classmethod
+    def available(cls) -> bool:
+        return _load_pytesseract() is not None
+
+    def image_to_string(self, img: "Image.Image") -> str:
+        return _load_pytesseract().image_to_string(img)
+
+    def image_to_data(self, img: "Image.Image") -> Tuple[str, Optional[float]]:
+        pytesseract = _load_pytesseract()
+        return _assemble_words(pytesseract.image_to_data(img, output_type=pytesseract.Output.DICT))
+
+
+class TesserocrBackend(OCRBackend):
+    """``tesserocr``: the Tesseract C++ API in-process.
+
+    The model is loaded once per thread (``PyTessBaseAPI`` is not
+    thread-safe) and reused, so no process start-up or traineddata reload
+    per page.
+    """
+
+    name = "tesserocr"
+
+    def __init__(self):
+        self._local = threading.local()
+
+    @classmethod
+    def available(cls) -> bool:
+        try:
+            import tesserocr  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def _api(self):
+        api = getattr(self._local, "api", None)
+        if api is None:
+            import tesserocr
+            api = tesserocr.PyTessBaseAPI()
+            self._local.api = api
+        return api
+
+    def image_to_string(self, img: "Image.Image") -> str:
+        api = self._api()
+        api.SetImage(img)
+        return api.GetUTF8Text()
+
+    def image_to_data(self, img: "Image.Image") -> Tuple[str, Optional[float]]:
+        api = self._api()
+        api.SetImage(img)
+        text = api.GetUTF8Text()
+        confidences = api.AllWordConfidences()
+        return text, (sum(confidences) / len(confidences) if confidences else None)
+
+
+def _assemble_words(data: Dict[str, list]) -> Tuple[str, Optional[float]]:
+    """Rebuild page text from ``pytesseract.image_to_data`` rows.
+
+    Words are joined per line and paragraphs separated by a blank line, as
+    ``image_to_string`` lays them out; returns the mean word confidence too.
+    """
+    lines: Dict[Tuple[int, int, int], List[str]] = {}
+    confidences: List[float] = []
+    rows = zip(data["text"], data["conf"], data["block_num"], data["par_num"], data["line_num"])
+    for word, conf, block, par, line in rows:
+        conf = float(conf)
+        if conf < 0 or not word.strip():
+            continue
+        lines.setdefault((block, par, line), []).append(word)
+        confidences.append(conf)
+
+    out: List[str] = []
+    previous = None
+    for (block, par, _), words in lines.items():
+        if previous is not None and previous != (block, par):
+            out.append("")
+        out.append(" ".join(words))
+        previous = (block, par)
+    return "\n".join(out), (sum(confidences) / len(confidences) if confidences else None)
+
+
+OCR_BACKENDS = {
+    PytesseractBackend.name: PytesseractBackend,
+    TesserocrBackend.name: TesserocrBackend,
+}
+
+_ocr_backends: Dict[str, Optional[OCRBackend]] = {}
+_OCR_BACKEND_LOCK = threading.Lock()
+
+
+def get_ocr_backend(name: Optional[str] = None) -> Optional[OCRBackend]:
+    """The process-wide backend for *name*, or ``None`` if Tesseract is missing.
+
+    *name* is ``"pytesseract"``, ``"tesserocr"`` or ``"auto"`` (tesserocr
+    when installed); ``None`` reads ``LEXISCAN_OCR_BACKEND`` (default
+    ``auto``).  An unavailable choice falls back to pytesseract.
+    """
+    name = name or os.environ.get("LEXISCAN_OCR_BACKEND", "auto")
+    if name != "auto" and name not in OCR_BACKENDS:
+        raise ValueError(f"Unknown OCR backend {name!r}; expected 'auto' or one of {sorted(OCR_BACKENDS)}.")
+
+    with _OCR_BACKEND_LOCK:
+        if name not in _ocr_backends:
+            if name == "auto":
+                preferred = TesserocrBackend if TesserocrBackend.available() else PytesseractBackend
+            else:
+                preferred = OCR_BACKENDS[name]
+                if not preferred.available():
+                    logger.warning(f"OCR backend {name!r} is not installed; falling back to pytesseract.")
+                    preferred = PytesseractBackend
+
+            backend = preferred() if preferred.available() else None
+            if backend is not None:
+                logger.info(f"OCR backend: {backend.name}")
+            _ocr_backends[name] = backend
+        return _ocr_backends[name]
+
+
 # ───────────────────────────────────────────────────────────────────────────
 #  OCRProcessor class (backward-compatible with existing code)
 # ───────────────────────────────────────────────────────────────────────────
 
 class OCRProcessor:
-    """High-level class wrapping the three public helper functions."""
+    """High-level class wrapping the three public helper functions.
+
+    Pass a :class:`utils.cache.ResultCache` to skip OCR for PDFs that have
+    already been processed with the same DPI / ``force_ocr`` settings.
+    """
 
-    def __init__(self, dpi: int = 300, force_ocr: bool = False):
+    def __init__(
+        self,
+        dpi: int = 300,
+        force_ocr: bool = False,
+        cache: Optional[ResultCache] = None,
+        page_workers: int = 1,
+        backend: Optional[str] = None,
+        adaptive: Optional[AdaptiveDPI] = None,
+    ):
         self.dpi = dpi
         self.force_ocr = force_ocr
+        self.cache = cache
+        self.page_workers = page_workers
+        self.backend = backend
+        self.adaptive = adaptive
         self.logger = configure_logger("LexiScanAuto.OCRProcessor")
 
     def process_pdf(self, pdf_path: str) -> Tuple[str, dict]:
@@ -163,10 +567,23 @@ class OCRProcessor:
         tuple[str, dict]
             ``(clean_text, quality_metrics)``
         """
+        cache_key = None
+        if self.cache is not None:
+            cache_key = make_cache_key(
+                pdf_path, stage="ocr", dpi=self.dpi, force_ocr=self.force_ocr,
+                adaptive_dpi=self.adaptive, backend=getattr(get_ocr_backend(self.backend), "name", None),
+            )
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                self.logger.info(f"OCR cache hit for: {pdf_path}")
+                cleaned, metrics = cached
+                return cleaned, metrics
+
         self.logger.info(f"Starting text extraction for: {pdf_path}")
 
         raw_text = extract_text_from_pdf(
             pdf_path, dpi=self.dpi, force_ocr=self.force_ocr,
+            page_workers=self.page_workers, backend=self.backend, adaptive=self.adaptive,
         )
         self.logger.info("Extraction completed. Cleaning text...")
 
@@ -177,6 +594,8 @@ class OCRProcessor:
             f"Processing complete. Text length: {metrics['text_length']}, "
             f"Noise ratio: {metrics['noise_ratio']}"
         )
+        if cache_key is not None:
+            self.cache.put(cache_key, [cleaned, metrics])
         return cleaned, metrics
 
 
@@ -184,26 +603,402 @@ class OCRProcessor:
 #  Internal helpers
 # ───────────────────────────────────────────────────────────────────────────
 
-def _ocr_page(page: "fitz.Page", dpi: int = 300) -> str:
-    """Rasterise a single ``fitz.Page`` and run Tesseract on it."""
-    if not (_TESSERACT_AVAILABLE and _PDF2IMAGE_AVAILABLE):
-        logger.warning(
-            "Tesseract / pdf2image not installed — cannot OCR scanned page."
-        )
-        return ""
+def _needs_ocr(page_text: str) -> bool:
+    """If page yielded < 30 characters of text, treat as scanned."""
+    return len(page_text.strip()) < _MIN_NATIVE_CHARS
+
+
+def _open_document(source: Union[str, bytes]) -> "fitz.Document":
+    """Open a PDF from a path or from in-memory bytes."""
+    import fitz  # PyMuPDF
+
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        if not source:
+            raise ValueError("Empty PDF payload.")
+        return fitz.open(stream=bytes(source), filetype="pdf")
 
+    if not os.path.isfile(source):
+        raise FileNotFoundError(f"PDF not found: {source}")
+    return fitz.open(source)
+
+
+def _iter_document_pages(
+    doc: "fitz.Document",
+    dpi: int,
+    force_ocr: bool,
+    backend: Optional[str] = None,
+    adaptive: Optional[AdaptiveDPI] = None,
+) -> Iterator[PageText]:
+    """Walk every page of an open document, falling back to OCR per page."""
     try:
-        # Render page to a pixmap, save as temp PNG, then OCR
-        pix = page.get_pixmap(dpi=dpi)
-        from PIL import Image
-        import io
-
-        img = Image.open(io.BytesIO(pix.tobytes("png")))
-        text = pytesseract.image_to_string(img)
-        return text
+        page_count = len(doc)
+        DOCUMENT_PAGES.observe(page_count)
+        for page_idx in range(page_count):
+            with time_stage("pdf_text"):
+                page = doc.load_page(page_idx)
+                page_text = page.get_text("text") if not force_ocr else ""
+
+            ocr_used = force_ocr or _needs_ocr(page_text)
+            result = None
+            if ocr_used:
+                OCR_FALLBACK_PAGES.inc()
+                with time_stage("ocr_page"):
+                    result = _ocr_page(page, dpi, backend, adaptive)
+                page_text = result.text or page_text
+
+            yield _page_text(page_idx, page_count, page_text, ocr_used, result)
+    finally:
+        doc.close()
+
+
+def render_page_image(page: "fitz.Page", dpi: int = 300) -> "Image.Image":
+    """Rasterise *page* to an 8-bit grayscale ``PIL.Image`` without copying.
+
+    MuPDF renders straight to one byte per pixel (Tesseract binarises
+    grayscale anyway) and the image is a read-only view over the pixmap's
+    sample buffer, so no RGB pixmap, PNG encode/decode or second bitmap is
+    ever allocated.
+    """
+    import fitz  # PyMuPDF
+    from PIL import Image
+
+    pix = page.get_pixmap(dpi=dpi, colorspace=fitz.csGRAY, alpha=False)
+    img = Image.frombuffer("L", (pix.width, pix.height), pix.samples_mv, "raw", "L", pix.stride, 1)
+    # ``samples_mv`` does not own the pixmap memory; tie its lifetime to img
+    img.pixmap = pix
+    # pytesseract hands images to the tesseract binary through a temp file
+    # in ``img.format``; raw PGM is a plain write, unlike the default PNG.
+    img.format = "PPM"
+    return img
+
+
+def _page_text(
+    page_idx: int,
+    page_count: int,
+    text: str,
+    ocr_used: bool,
+    result: Optional[PageOCR],
+) -> PageText:
+    """Count a finished page in the metrics and wrap it as a ``PageText``."""
+    PAGES_PROCESSED.inc()
+    logger.debug(f"Page {page_idx + 1}/{page_count}: {len(text)} chars")
+    if result is None:
+        return PageText(page_idx, page_count, text, ocr_used)
+
+    if result.cached is not None:
+        PAGE_CACHE_EVENTS.inc(event="hits" if result.cached else "misses")
+    OCR_PAGE_DPI.inc(dpi=str(result.dpi))
+    if result.confidence is not None:
+        OCR_PAGE_CONFIDENCE.observe(result.confidence, dpi=str(result.dpi))
+    return PageText(page_idx, page_count, text, ocr_used, result.dpi, result.confidence)
+
+
+def _ocr_page(
+    page: "fitz.Page",
+    dpi: int = 300,
+    backend: Optional[str] = None,
+    adaptive: Optional[AdaptiveDPI] = None,
+) -> PageOCR:
+    """Rasterise a single ``fitz.Page`` and run Tesseract on it.
+
+    With *adaptive*, the page is OCR'd at ``adaptive.first_dpi`` and only
+    re-rendered at *dpi* when the mean word confidence is too low; the
+    higher-resolution pass wins unless it turns out less confident.
+
+    Results are looked up in / stored to the page cache (see
+    :func:`set_page_cache`); failed OCR is never cached.
+    """
+    ocr = get_ocr_backend(backend)
+    if ocr is None:
+        logger.warning("Tesseract not installed — cannot OCR scanned page.")
+        return PageOCR("", dpi)
+
+    cache, cache_key = _get_page_cache(), None
+    if cache is not None:
+        try:
+            cache_key = make_cache_key(
+                page_fingerprint(page).encode(), stage="ocr_page",
+                backend=ocr.name, dpi=dpi, adaptive_dpi=adaptive,
+            )
+            cached = cache.get(cache_key)
+        except Exception as exc:
+            logger.warning(f"Page cache lookup failed: {exc}")
+            cache_key = cached = None
+        if cached is not None:
+            return PageOCR(*cached, cached=True)
+
+    try:
+        result = _recognise_page(ocr, page, dpi, adaptive)
     except Exception as exc:
         logger.error(f"OCR failed for page: {exc}")
-        return ""
+        return PageOCR("", dpi)
+
+    if cache_key is None:
+        return result
+    cache.put(cache_key, [result.text, result.dpi, result.confidence])
+    return result._replace(cached=False)
+
+
+def _recognise_page(
+    ocr: OCRBackend,
+    page: "fitz.Page",
+    dpi: int,
+    adaptive: Optional[AdaptiveDPI],
+) -> PageOCR:
+    """Run *ocr* on *page* at *dpi*, or adaptively (see :func:`_ocr_page`)."""
+    if adaptive is None or adaptive.first_dpi >= dpi:
+        with _get_cpu_budget():
+            text = ocr.image_to_string(render_page_image(page, dpi))
+        return PageOCR(text, dpi)
+
+    with _get_cpu_budget():
+        text, confidence = ocr.image_to_data(render_page_image(page, adaptive.first_dpi))
+    first = PageOCR(text, adaptive.first_dpi, confidence)
+    if first.confidence is not None and first.confidence >= adaptive.min_confidence:
+        return first
+
+    with _get_cpu_budget():
+        text, confidence = ocr.image_to_data(render_page_image(page, dpi))
+    logger.debug(
+        f"Page confidence {first.confidence} at {first.dpi} dpi → {confidence} at {dpi} dpi"
+    )
+    if first.confidence is not None and (confidence is None or confidence < first.confidence):
+        return first
+    return PageOCR(text, dpi, confidence)
+
+
+# ───────────────────────────────────────────────────────────────────────────
+#  Page-level OCR cache
+# ───────────────────────────────────────────────────────────────────────────
+
+def page_fingerprint(page: "fitz.Page") -> str:
+    """SHA-256 of what *page* draws, independent of the file it lives in.
+
+    Hashes the page size, rotation and content stream, the bytes and
+    object dictionaries of every image and form XObject it uses (by
+    content, since xref numbers differ between files) and its font names.
+    No rendering is needed.
+    """
+    doc = page.parent
+    digest = hashlib.sha256()
+    digest.update(f"{tuple(page.rect)}|{page.rotation}".encode())
+    digest.update(page.read_contents())
+
+    xrefs = [xref for xref, *_ in page.get_xobjects()]
+    for image in page.get_images(full=True):
+        xrefs.extend(xref for xref in image[:2] if xref)  # image and its soft mask
+    for xref in xrefs:
+        # Indirect references ("12 0 R") are file-specific; drop the numbers
+        digest.update(_XREF_RE.sub(b"R", doc.xref_object(xref, compressed=True).encode()))
+        digest.update(doc.xref_stream_raw(xref) or b"")
+
+    for font in page.get_fonts():
+        digest.update(font[3].encode())  # base font name
+    return digest.hexdigest()
+
+
+def set_page_cache(cache: Optional[ResultCache]) -> None:
+    """Install the page OCR cache of this process (``None`` disables it)."""
+    global _page_cache
+    _page_cache = cache if cache is not None else False
+
+
+def _get_page_cache() -> Optional[ResultCache]:
+    """The page cache, built from ``LEXISCAN_PAGE_CACHE_*`` on first use.
+
+    Opt-in: disabled unless ``LEXISCAN_PAGE_CACHE_PATH`` names the SQLite
+    file, which is resolved to an absolute path.  Every process (pool and
+    page workers alike) keeps its own memory tier in front of that file.
+    """
+    global _page_cache
+    if _page_cache is None:
+        path = os.environ.get("LEXISCAN_PAGE_CACHE_PATH")
+        max_entries = int(os.environ.get("LEXISCAN_PAGE_CACHE_MAX_ENTRIES", "1024"))
+        max_disk = os.environ.get("LEXISCAN_PAGE_CACHE_MAX_DISK_ENTRIES", "100000")
+        _page_cache = ResultCache(
+            max_entries=max_entries,
+            db_path=os.path.abspath(path),
+            max_disk_entries=int(max_disk) if max_disk else None,
+        ) if path and max_entries > 0 else False
+    return _page_cache or None
+
+
+def page_cache_stats() -> Optional[Dict[str, int]]:
+    """Hit / miss / eviction counters of this process's page cache."""
+    cache = _get_page_cache()
+    return cache.stats() if cache is not None else None
+
+
+# ───────────────────────────────────────────────────────────────────────────
+#  Parallel page OCR
+# ───────────────────────────────────────────────────────────────────────────
+
+def make_cpu_budget(slots: Optional[int] = None):
+    """A semaphore of *slots* (default: CPU count) usable across processes."""
+    return multiprocessing.get_context("spawn").BoundedSemaphore(slots or os.cpu_count() or 1)
+
+
+def set_cpu_budget(budget) -> None:
+    """Install the semaphore every Tesseract call in this process acquires.
+
+    The API creates one budget and hands it to all pool workers and job
+    workers, which pass it on to their page workers.  Under ``api.serve``
+    the master creates it before forking, so the limit holds machine-wide.
+    """
+    global _cpu_budget
+    _cpu_budget = budget
+
+
+def installed_cpu_budget():
+    """The budget :func:`set_cpu_budget` installed, or ``None`` (never creates one)."""
+    return _cpu_budget
+
+
+def _get_cpu_budget():
+    global _cpu_budget
+    if _cpu_budget is None:
+        _cpu_budget = make_cpu_budget()
+    return _cpu_budget
+
+
+def _page_pool(workers: int) -> ProcessPoolExecutor:
+    """Long-lived page-worker pool of *workers* processes (created once)."""
+    with _PAGE_POOL_LOCK:
+        pool = _page_pools.get(workers)
+        if pool is None:
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context(_PAGE_POOL_CONTEXT),
+                initializer=set_cpu_budget,
+                initargs=(_get_cpu_budget(),),
+            )
+            _page_pools[workers] = pool
+        return pool
+
+
+def _ocr_page_chunk(
+    source: Union[str, bytes],
+    page_indices: List[int],
+    dpi: int,
+    backend: Optional[str] = None,
+    adaptive: Optional[AdaptiveDPI] = None,
+) -> List[Tuple[int, PageOCR, float]]:
+    """Page-worker task: open *source* and OCR *page_indices*.
+
+    Returns ``(page_index, result, seconds)`` per page.
+    """
+    doc = _open_document(source)
+    try:
+        results = []
+        for idx in page_indices:
+            start = time.perf_counter()
+            result = _ocr_page(doc.load_page(idx), dpi, backend, adaptive)
+            results.append((idx, result, time.perf_counter() - start))
+        return results
+    finally:
+        doc.close()
+
+
+def _submit_page_ocr(
+    source: Union[str, bytes],
+    page_indices: List[int],
+    dpi: int,
+    workers: int,
+    backend: Optional[str] = None,
+    adaptive: Optional[AdaptiveDPI] = None,
+) -> Dict[int, "Future"]:
+    """Spread *page_indices* over the page pool; maps each page to its task.
+
+    Pages are sent in contiguous chunks (about four per worker) so early
+    pages finish first.  A bytes *source* is pickled once per chunk, so it
+    is split into one chunk per worker instead.
+    """
+    pool = _page_pool(workers)
+    chunks = workers * 4 if isinstance(source, str) else workers
+    size = max(1, math.ceil(len(page_indices) / chunks))
+    futures: Dict[int, Future] = {}
+    for offset in range(0, len(page_indices), size):
+        chunk = page_indices[offset:offset + size]
+        future = pool.submit(_ocr_page_chunk, source, chunk, dpi, backend, adaptive)
+        futures.update((idx, future) for idx in chunk)
+    return futures
+
+
+def _iter_pages_parallel(
+    doc: "fitz.Document",
+    source: Union[str, bytes],
+    dpi: int,
+    force_ocr: bool,
+    page_workers: int,
+    backend: Optional[str] = None,
+    adaptive: Optional[AdaptiveDPI] = None,
+) -> Iterator[PageText]:
+    """:func:`_iter_document_pages` with scanned pages OCR'd by the page pool.
+
+    An in-memory payload above the upload spill threshold is written once
+    to a temporary file in the spill dir (see :func:`spill_settings`), and
+    page workers open that path; smaller payloads are sent as bytes.
+    """
+    futures: Dict[int, Future] = {}
+    spilled: Optional[str] = None
+    try:
+        page_count = len(doc)
+        DOCUMENT_PAGES.observe(page_count)
+        native: List[str] = []
+        for page_idx in range(page_count):
+            with time_stage("pdf_text"):
+                native.append(doc.load_page(page_idx).get_text("text") if not force_ocr else "")
+
+        scanned = [idx for idx, text in enumerate(native) if force_ocr or _needs_ocr(text)]
+        if len(scanned) > 1:
+            try:
+                if not isinstance(source, str):
+                    source = read_pdf_source(io.BytesIO(source), *spill_settings())
+                    spilled = source if isinstance(source, str) else None
+                futures = _submit_page_ocr(source, scanned, dpi, page_workers, backend, adaptive)
+            except Exception as exc:  # e.g. a broken pool: fall back to serial OCR
+                logger.warning(f"Page pool unavailable ({exc}); OCR'ing in-process.")
+                with _PAGE_POOL_LOCK:
+                    _page_pools.pop(page_workers, None)
+
+        for page_idx in range(page_count):
+            page_text = native[page_idx]
+            ocr_used = force_ocr or _needs_ocr(page_text)
+            result = None
+            if ocr_used:
+                OCR_FALLBACK_PAGES.inc()
+                result = _collect_page_ocr(doc, page_idx, dpi, futures.get(page_idx), backend, adaptive)
+                page_text = result.text or page_text
+
+            yield _page_text(page_idx, page_count, page_text, ocr_used, result)
+    finally:
+        for future in futures.values():
+            future.cancel()
+        doc.close()
+        if spilled is not None:
+            discard_pdf_source(spilled)
+
+
+def _collect_page_ocr(
+    doc: "fitz.Document",
+    page_idx: int,
+    dpi: int,
+    future: Optional["Future"],
+    backend: Optional[str] = None,
+    adaptive: Optional[AdaptiveDPI] = None,
+) -> PageOCR:
+    """OCR result of one scanned page from its page-pool task (or OCR it here)."""
+    if future is not None:
+        try:
+            for idx, result, seconds in future.result():
+                if idx == page_idx:
+                    STAGE_SECONDS.observe(seconds, stage="ocr_page")
+                    return result
+        except Exception as exc:
+            logger.warning(f"Page worker failed ({exc}); OCR'ing page {page_idx + 1} in-process.")
+
+    with time_stage("ocr_page"):
+        return _ocr_page(doc.load_page(page_idx), dpi, backend, adaptive)
 
 
 # ───────────────────────────────────────────────────────────────────────────
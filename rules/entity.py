@@ -0,0 +1,106 @@
+"""
+LexiScan Auto — Entity Record
+===============================
+The compact record entities travel in from ``NERInference`` through the
+rule layer to ``group_entities``.
+
+``Entity`` uses ``__slots__`` (no per-instance ``__dict__``), so a document
+with thousands of entities costs four pointers per entity rather than a
+hash table each, and the rules update ``value`` in place instead of
+rebuilding dicts.
+
+It also reads and writes like the legacy ``{"entity", "value",
+"start_char", "end_char"}`` dict (``ent["value"]``, ``ent.get(...)``,
+equality with such a dict), and :meth:`Entity.to_dict` produces exactly
+that shape for public / JSON output.
+"""
+
+from typing import Any, Dict, Iterator, Mapping, Optional, Union
+
+# Public dict key → slot name
+_FIELDS = {
+    "entity": "label",
+    "value": "value",
+    "start_char": "start_char",
+    "end_char": "end_char",
+}
+
+
+class Entity:
+    """A labelled span of a document."""
+
+    __slots__ = ("label", "value", "start_char", "end_char")
+
+    def __init__(
+        self,
+        label: str,
+        value: str,
+        start_char: Optional[int] = None,
+        end_char: Optional[int] = None,
+    ):
+        self.label = label
+        self.value = value
+        self.start_char = start_char
+        self.end_char = end_char
+
+    # ── Conversion ──────────────────────────────────────────────────
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "Entity":
+        return cls(
+            data.get("entity", ""),
+            data.get("value", ""),
+            data.get("start_char"),
+            data.get("end_char"),
+        )
+
+    @classmethod
+    def coerce(cls, entity: Union["Entity", Mapping[str, Any]]) -> "Entity":
+        """Return *entity* itself if it is an ``Entity``, else convert the dict."""
+        return entity if isinstance(entity, cls) else cls.from_dict(entity)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "entity": self.label,
+            "value": self.value,
+            "start_char": self.start_char,
+            "end_char": self.end_char,
+        }
+
+    # ── Mapping compatibility ───────────────────────────────────────
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, _FIELDS[key])
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        try:
+            setattr(self, _FIELDS[key], value)
+        except KeyError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        slot = _FIELDS.get(key)
+        return getattr(self, slot) if slot else default
+
+    def keys(self) -> Iterator[str]:
+        return iter(_FIELDS)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Entity):
+            return (
+                self.label == other.label and self.value == other.value
+                and self.start_char == other.start_char and self.end_char == other.end_char
+            )
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    __hash__ = None  # mutable
+
+    def __repr__(self) -> str:
+        return (
+            f"Entity({self.label!r}, {self.value!r}, {self.start_char!r}, {self.end_char!r})"
+        )
@@ -0,0 +1,132 @@
+"""
+LexiScan Auto — Deterministic Pre-NER Matchers
+================================================
+High-precision pattern matching that runs **before** the statistical
+models.  One compiled regular expression finds, in a single left-to-right
+scan:
+
+* **DATE** — the written and numeric formats from ``rules.validators``.
+* **AMOUNT** — currency symbol / ISO code + number, or number + code.
+* **JURISDICTION** — a gazetteer of US states and common countries
+  (ambiguous names such as *Washington* or *Georgia* only after
+  ``"State of"``).
+
+``NERInference`` pre-sets these spans on the ``Doc`` so the NER models
+predict around them, and gives them priority when merging predictions.
+"""
+
+import re
+from typing import List, NamedTuple
+
+from utils.metrics import time_stage
+
+
+class MatchSpan(NamedTuple):
+    """A matched entity; mirrors the ``spacy.tokens.Span`` attributes we read."""
+
+    label_: str
+    text: str
+    start_char: int
+    end_char: int
+
+
+# ───────────────────────────────────────────────────────────────────────────
+#  Patterns
+# ───────────────────────────────────────────────────────────────────────────
+
+_MONTHS = (
+    r"(?:January|February|March|April|May|June|July|August|September|October|November|December"
+    r"|Jan|Feb|Mar|Apr|Jun|Jul|Aug|Sept?|Oct|Nov|Dec)\.?"
+)
+_DAY = r"\d{1,2}(?:st|nd|rd|th)?"
+
+_DATE = "|".join([
+    rf"{_MONTHS}\s+{_DAY},?\s+\d{{4}}",          # October 12, 2023 / Oct 12 2023
+    rf"{_DAY}\s+(?:day\s+of\s+)?{_MONTHS},?\s+\d{{4}}",  # 12 October 2023 / 12th day of October, 2023
+    r"\d{1,2}/\d{1,2}/\d{4}",                    # 10/12/2023
+    r"\d{4}-\d{2}-\d{2}",                        # 2023-10-12
+    r"\d{1,2}-\d{1,2}-\d{4}",                    # 12-10-2023
+    r"\d{1,2}\.\d{1,2}\.\d{4}",                  # 12.10.2023
+])
+
+_CURRENCY_CODES = r"(?:USD|EUR|GBP|INR|CAD|AUD|JPY)"
+_NUMBER = r"\d{1,3}(?:[,.]\d{3})+(?:[.,]\d+)?|\d+(?:\.\d+)?"
+# "$1.5 million"; ``normalize_amount`` scales the number by it
+_SCALE = r"(?:\s?(?:million|billion))?"
+
+_AMOUNT = "|".join([
+    rf"[£€$¥₹₦]\s?(?:{_NUMBER}){_SCALE}",
+    rf"{_CURRENCY_CODES}\s?(?:{_NUMBER}){_SCALE}",
+    rf"(?:{_NUMBER}){_SCALE}\s?{_CURRENCY_CODES}",
+])
+
+US_STATES = (
+    "Alabama", "Alaska", "Arizona", "Arkansas", "California", "Colorado",
+    "Connecticut", "Delaware", "Florida", "Hawaii", "Idaho", "Illinois",
+    "Indiana", "Iowa", "Kansas", "Kentucky", "Louisiana", "Maine", "Maryland",
+    "Massachusetts", "Michigan", "Minnesota", "Mississippi", "Missouri",
+    "Montana", "Nebraska", "Nevada", "New Hampshire", "New Jersey",
+    "New Mexico", "New York", "North Carolina", "North Dakota", "Ohio",
+    "Oklahoma", "Oregon", "Pennsylvania", "Rhode Island", "South Carolina",
+    "South Dakota", "Tennessee", "Texas", "Utah", "Vermont", "Virginia",
+    "West Virginia", "Wisconsin", "Wyoming", "District of Columbia",
+)
+
+COUNTRIES = (
+    "United States", "United States of America", "United Kingdom", "England",
+    "Wales", "Scotland", "Northern Ireland", "Ireland", "Canada", "Mexico",
+    "Brazil", "Argentina", "Chile", "France", "Germany", "Italy", "Spain",
+    "Portugal", "Netherlands", "Belgium", "Luxembourg", "Switzerland",
+    "Austria", "Sweden", "Norway", "Denmark", "Finland", "Poland",
+    "Czech Republic", "Greece", "Turkey", "Israel", "United Arab Emirates",
+    "Saudi Arabia", "Qatar", "Egypt", "Nigeria", "Kenya", "South Africa",
+    "India", "Pakistan", "Bangladesh", "Sri Lanka", "Singapore", "Malaysia",
+    "Indonesia", "Philippines", "Thailand", "Vietnam", "China", "Hong Kong",
+    "Japan", "South Korea", "Australia", "New Zealand",
+)
+
+# Also common given / city names: only accepted after "State of"
+_AMBIGUOUS_PLACES = ("Washington", "Georgia")
+
+
+def _alternation(names) -> str:
+    # Longest first so "West Virginia" wins over "Virginia"
+    return "|".join(re.escape(name) for name in sorted(names, key=len, reverse=True))
+
+
+_JURISDICTION = (
+    rf"(?P<JURISDICTION>{_alternation(US_STATES + COUNTRIES)})"
+    rf"|(?:State|Commonwealth)\s+of\s+(?P<JURISDICTION_QUALIFIED>{_alternation(_AMBIGUOUS_PLACES)})"
+)
+
+_MATCHER = re.compile(
+    rf"(?<![\w$£€¥₹₦])(?:(?P<DATE>{_DATE})|(?P<AMOUNT>{_AMOUNT})|{_JURISDICTION})(?![\w]|[.,]\d)",
+    re.IGNORECASE,
+)
+_GAZETTEER_GROUPS = ("JURISDICTION", "JURISDICTION_QUALIFIED")
+_GAZETTEER_NAMES = frozenset(US_STATES + COUNTRIES + _AMBIGUOUS_PLACES)
+
+
+# ───────────────────────────────────────────────────────────────────────────
+#  Public API
+# ───────────────────────────────────────────────────────────────────────────
+
+def find_entities(text: str) -> List[MatchSpan]:
+    """Return the non-overlapping DATE / AMOUNT / JURISDICTION matches in *text*.
+
+    Gazetteer names must appear with their canonical capitalisation (or
+    in all caps), so *"maine"* or *"turkey"* in running text is not a
+    jurisdiction.
+    """
+    spans: List[MatchSpan] = []
+    with time_stage("matchers"):
+        for match in _MATCHER.finditer(text):
+            group = match.lastgroup
+            if group in _GAZETTEER_GROUPS:
+                value = match.group(group)
+                if value not in _GAZETTEER_NAMES and not value.isupper():
+                    continue
+                spans.append(MatchSpan("JURISDICTION", value, match.start(group), match.end(group)))
+            else:
+                spans.append(MatchSpan(group, match.group(), match.start(), match.end()))
+    return spans
@@ -9,64 +9,147 @@ predicted entity spans.  This layer:
 * Sanitises entity predictions (removes noise, punctuation-only spans).
 * Validates date logic (termination ≥ effective).
 
-All functions are pure (no side-effects) and individually testable.
+``normalize_date`` and ``normalize_amount`` are pure.  The entity-list
+functions take ``{"entity", "value", "start_char", "end_char"}`` dicts,
+rewrite their ``"value"`` in place and return the (kept) dicts; each is
+individually testable.
+
+Dates and amounts are normalised by precompiled patterns behind a bounded
+LRU memo, since a contract repeats the same few values many times.
+
+``apply_all_rules`` runs the rules registered on :data:`RULES`, a
+:class:`RuleEngine` that fuses them into a single pass over the entities.
+New business rules are added with ``RULES.register(...)``.
+
+Internally the rules run over compact ``rules.entity.Entity`` records;
+``NERInference`` hands those straight to :func:`apply_rules_to_records`, and
+the dict functions convert at the boundary.
 """
 
+import os
 import re
 import string
+import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import (
+    Any, Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Set, Tuple, Union,
+)
 
+from rules.entity import Entity
 from utils.logger import configure_logger
+from utils.metrics import RULE_SECONDS, time_stage
 
 logger = configure_logger("LexiScanAuto.Rules")
 
+EntityLike = Union[Entity, Mapping[str, Any]]
+
+# ───────────────────────────────────────────────────────────────────────────
+#  Dict boundary
+# ───────────────────────────────────────────────────────────────────────────
+
+def _run_on_dicts(
+    entities: Sequence[EntityLike],
+    run: Callable[[List[Entity]], List[Entity]],
+) -> List[EntityLike]:
+    """Apply *run* (records → kept records) to entity dicts.
+
+    Rewritten values are written back into the caller's dicts, and the
+    dicts whose records *run* kept are returned, in order.
+    """
+    records = [Entity.coerce(ent) for ent in entities]
+    kept = {id(rec) for rec in run(records)}
+    result = []
+    for ent, rec in zip(entities, records):
+        if id(rec) not in kept:
+            continue
+        if ent.get("value") != rec.value:
+            ent["value"] = rec.value
+        result.append(ent)
+    return result
+
+
 # ───────────────────────────────────────────────────────────────────────────
 #  Date normalisation
 # ───────────────────────────────────────────────────────────────────────────
 
-# Common date patterns found in legal contracts
-_DATE_PATTERNS: List[Tuple[str, str]] = [
-    # Month DD, YYYY  — "October 12, 2023"
-    (r"(?:January|February|March|April|May|June|July|August|September|"
-     r"October|November|December)\s+\d{1,2},?\s+\d{4}", "%B %d, %Y"),
-    # Mon DD YYYY     — "Oct 12 2023"
-    (r"(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},?\s+\d{4}",
-     "%b %d %Y"),
-    # Mon DD, YYYY    — "Oct 12, 2023"
-    (r"(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},\s+\d{4}",
-     "%b %d, %Y"),
-    # DD/MM/YYYY or MM/DD/YYYY — "12/10/2023"
-    (r"\d{1,2}/\d{1,2}/\d{4}", "%m/%d/%Y"),
-    # YYYY-MM-DD      — already ISO
-    (r"\d{4}-\d{2}-\d{2}", "%Y-%m-%d"),
-    # DD-MM-YYYY
-    (r"\d{1,2}-\d{1,2}-\d{4}", "%d-%m-%Y"),
-    # DD.MM.YYYY
-    (r"\d{1,2}\.\d{1,2}\.\d{4}", "%d.%m.%Y"),
-]
+# Month names and abbreviations → month number
+_MONTH_NUMBERS: Dict[str, int] = {}
+for _number, _name in enumerate(
+    ("january", "february", "march", "april", "may", "june", "july",
+     "august", "september", "october", "november", "december"),
+    start=1,
+):
+    _MONTH_NUMBERS[_name] = _number
+    _MONTH_NUMBERS[_name[:3]] = _number
+_MONTH_NUMBERS["sept"] = 9
+
+_MONTH = "|".join(sorted(_MONTH_NUMBERS, key=len, reverse=True))
+
+# Every date format found in legal contracts, in one alternation; the named
+# groups say which fields matched, so the date is built directly from them.
+_DATE_RE = re.compile(
+    # Month DD, YYYY   — "October 12, 2023" / "Oct 12th 2023"
+    rf"(?P<m1>{_MONTH})\.?\s+(?P<d1>\d{{1,2}})(?:st|nd|rd|th)?,?\s+(?P<y1>\d{{4}})"
+    # DD Month YYYY    — "12 October 2023" / "12th day of October, 2023"
+    rf"|(?P<d2>\d{{1,2}})(?:st|nd|rd|th)?\s+(?:day\s+of\s+)?(?P<m2>{_MONTH})\.?,?\s+(?P<y2>\d{{4}})"
+    # MM/DD/YYYY       — "10/12/2023"
+    r"|(?P<m3>\d{1,2})/(?P<d3>\d{1,2})/(?P<y3>\d{4})"
+    # YYYY-MM-DD       — already ISO
+    r"|(?P<y4>\d{4})-(?P<m4>\d{2})-(?P<d4>\d{2})"
+    # DD-MM-YYYY / DD.MM.YYYY
+    r"|(?P<d5>\d{1,2})(?P<sep>[-.])(?P<m5>\d{1,2})(?P=sep)(?P<y5>\d{4})",
+    re.IGNORECASE,
+)
+
+# Distinct raw strings remembered by the parse memo; contracts repeat the
+# same few dates many times.
+_MEMO_SIZE = 4096
+
+_dateutil_parser = None
+# Fills the fields a fallback-parsed date lacks ("October 2023"), instead of
+# dateutil's default of today, so memoised results never depend on the day.
+_FALLBACK_DEFAULT = datetime(1900, 1, 1)
+
+
+def _fallback_parse(raw: str) -> Optional[datetime]:
+    """Last resort — ``dateutil`` (imported once; skipped if unavailable)."""
+    global _dateutil_parser
+    if _dateutil_parser is None:
+        try:
+            from dateutil import parser as dateutil_parser
+            _dateutil_parser = dateutil_parser
+        except ImportError:
+            _dateutil_parser = False
+    if not _dateutil_parser:
+        return None
+    try:
+        return _dateutil_parser.parse(raw, dayfirst=False, default=_FALLBACK_DEFAULT)
+    except (ValueError, OverflowError):
+        return None
 
 
+@lru_cache(maxsize=_MEMO_SIZE)
 def _try_parse_date(raw: str) -> Optional[datetime]:
     """Attempt to parse *raw* into a ``datetime`` using known patterns."""
-    raw = raw.strip().replace(",", ", ").replace("  ", " ")
-    # Remove ordinal suffixes: 12th, 1st, 2nd, 3rd
-    raw = re.sub(r"(\d+)(st|nd|rd|th)", r"\1", raw)
-
-    for pattern, fmt in _DATE_PATTERNS:
-        match = re.search(pattern, raw, re.IGNORECASE)
-        if match:
-            try:
-                return datetime.strptime(match.group(), fmt)
-            except ValueError:
-                continue
-
-    # Last resort — dateutil
-    try:
-        from dateutil import parser as dateutil_parser
-        return dateutil_parser.parse(raw, dayfirst=False)
-    except Exception:
-        return None
+    match = _DATE_RE.search(raw)
+    if match:
+        fields = match.groupdict()
+        for year, month, day in (("y1", "m1", "d1"), ("y2", "m2", "d2")):
+            if fields[year]:
+                month_number = _MONTH_NUMBERS[fields[month].lower()]
+                break
+        else:
+            for year, month, day in (("y3", "m3", "d3"), ("y4", "m4", "d4"), ("y5", "m5", "d5")):
+                if fields[year]:
+                    month_number = int(fields[month])
+                    break
+        try:
+            return datetime(int(fields[year]), month_number, int(fields[day]))
+        except ValueError:
+            pass
+
+    return _fallback_parse(" ".join(raw.replace(",", ", ").split()))
 
 
 def normalize_date(raw: str) -> str:
@@ -87,6 +170,31 @@ def normalize_date(raw: str) -> str:
     return raw.strip()
 
 
+def _normalise_date_rule(ent: Entity, state: Dict[str, Any]) -> bool:
+    """Rewrite a DATE to ISO-8601 and remember effective / termination dates."""
+    raw = ent.value
+    dt = _try_parse_date(raw)
+    ent.value = dt.strftime("%Y-%m-%d") if dt else raw.strip()
+
+    low = raw.lower()
+    if "effective" in low or "commence" in low or "start" in low:
+        state["effective"] = dt
+    elif "terminat" in low or "expir" in low or "end" in low:
+        state["termination"] = dt
+    return True
+
+
+def _check_date_order(state: Dict[str, Any]) -> None:
+    """Business rule: *termination date* must not precede *effective date*."""
+    effective = state.get("effective")
+    termination = state.get("termination")
+    if effective and termination and termination < effective:
+        logger.warning(
+            f"Logical date violation: termination ({termination.date()}) "
+            f"precedes effective ({effective.date()})."
+        )
+
+
 def validate_dates(
     entities: List[Dict[str, Any]],
 ) -> List[Dict[str, Any]]:
@@ -96,32 +204,15 @@ def validate_dates(
     If both named dates are present we log a warning (but still keep the
     entities — the caller decides whether to drop them).
     """
-    effective: Optional[datetime] = None
-    termination: Optional[datetime] = None
-
-    for ent in entities:
-        if ent.get("entity") != "DATE":
-            continue
+    def run(records: List[Entity]) -> List[Entity]:
+        state: Dict[str, Any] = {}
+        for ent in records:
+            if ent.label == "DATE":
+                _normalise_date_rule(ent, state)
+        _check_date_order(state)
+        return records
 
-        raw = ent["value"]
-        iso = normalize_date(raw)
-        ent["value"] = iso
-
-        low = raw.lower()
-        dt = _try_parse_date(iso)
-
-        if "effective" in low or "commence" in low or "start" in low:
-            effective = dt
-        elif "terminat" in low or "expir" in low or "end" in low:
-            termination = dt
-
-    if effective and termination and termination < effective:
-        logger.warning(
-            f"Logical date violation: termination ({termination.date()}) "
-            f"precedes effective ({effective.date()})."
-        )
-
-    return entities
+    return _run_on_dicts(entities, run)
 
 
 # ───────────────────────────────────────────────────────────────────────────
@@ -129,9 +220,15 @@ def validate_dates(
 # ───────────────────────────────────────────────────────────────────────────
 
 _CURRENCY_SYMBOLS = re.compile(r"[£€$¥₹₦]")
+_CURRENCY_CODES = re.compile(r"\b(?:USD|EUR|GBP|INR|CAD|AUD|JPY)\b", re.IGNORECASE)
+_EUROPEAN_FORMAT = re.compile(r"\d\.\d{3},\d{2}$")
 _THOUSANDS_SEP = re.compile(r"(?<=\d),(?=\d{3})")
+_NON_NUMERIC = re.compile(r"[^\d.]")
+_SCALE_WORDS = re.compile(r"\b(million|billion)\b", re.IGNORECASE)
+_SCALES = {"million": 10 ** 6, "billion": 10 ** 9}
 
 
+@lru_cache(maxsize=_MEMO_SIZE)
 def normalize_amount(raw: str) -> str:
     """Convert a currency string to a clean numeric value.
 
@@ -143,26 +240,34 @@ def normalize_amount(raw: str) -> str:
     '1234567.89'
     >>> normalize_amount("€ 2.500,00")  # European format
     '2500.00'
+    >>> normalize_amount("$1.5 million")
+    '1500000'
     """
     text = raw.strip()
     # Strip currency symbols and currency codes
     text = _CURRENCY_SYMBOLS.sub("", text)
-    text = re.sub(r"\b(?:USD|EUR|GBP|INR|CAD|AUD|JPY)\b", "", text, flags=re.IGNORECASE)
+    text = _CURRENCY_CODES.sub("", text)
+    scale = _SCALE_WORDS.search(text)
+    if scale:
+        text = _SCALE_WORDS.sub("", text)
     text = text.strip()
 
     # Detect European format: "2.500,00" → period as thousands, comma as decimal
-    if re.search(r"\d\.\d{3},\d{2}$", text):
+    if _EUROPEAN_FORMAT.search(text):
         text = text.replace(".", "").replace(",", ".")
     else:
         # Standard format: strip commas
         text = _THOUSANDS_SEP.sub("", text)
 
     # Remove any remaining non-numeric characters except the decimal point
-    text = re.sub(r"[^\d.]", "", text)
+    text = _NON_NUMERIC.sub("", text)
 
     # Validate that we have a sensible number
     try:
         value = float(text)
+        if scale:
+            value *= _SCALES[scale.group(1).lower()]
+            return str(int(value)) if value.is_integer() else f"{value:.2f}"
         # Return with 2 decimal places if it has a decimal, else as integer-like
         if "." in text:
             return f"{value:.2f}"
@@ -171,14 +276,22 @@ def normalize_amount(raw: str) -> str:
         return raw.strip()
 
 
+def _normalise_amount_rule(ent: Entity, state: Dict[str, Any]) -> bool:
+    ent.value = normalize_amount(ent.value)
+    return True
+
+
 def normalize_amounts(
     entities: List[Dict[str, Any]],
 ) -> List[Dict[str, Any]]:
     """Normalise every AMOUNT entity value."""
-    for ent in entities:
-        if ent.get("entity") == "AMOUNT":
-            ent["value"] = normalize_amount(ent["value"])
-    return entities
+    def run(records: List[Entity]) -> List[Entity]:
+        for ent in records:
+            if ent.label == "AMOUNT":
+                _normalise_amount_rule(ent, {})
+        return records
+
+    return _run_on_dicts(entities, run)
 
 
 # ───────────────────────────────────────────────────────────────────────────
@@ -209,58 +322,169 @@ def sanitize_entities(
     * Punctuation-only spans (e.g. ``")"``).
     * Whitespace-only spans.
     """
-    clean = []
-    for ent in entities:
-        if _is_noise(ent.get("value", "")):
-            logger.debug(f"Sanitised out noisy entity: {ent}")
-            continue
-        # Strip leading/trailing whitespace from all values
-        ent["value"] = ent["value"].strip()
-        clean.append(ent)
-    return clean
+    return _run_on_dicts(
+        entities, lambda records: [ent for ent in records if _sanitize_rule(ent, {})],
+    )
+
+
+def _sanitize_rule(ent: Entity, state: Dict[str, Any]) -> bool:
+    if _is_noise(ent.value or ""):
+        logger.debug(f"Sanitised out noisy entity: {ent}")
+        return False
+    # Strip leading/trailing whitespace from all values
+    ent.value = ent.value.strip()
+    return True
+
+
+# ───────────────────────────────────────────────────────────────────────────
+#  Rule engine
+# ───────────────────────────────────────────────────────────────────────────
+
+# ``rule(entity, state) -> keep``: may rewrite ``entity.value`` in place and
+# record document-level facts in ``state``; returning ``False`` drops the
+# entity and skips its remaining rules.
+EntityRule = Callable[[Entity, Dict[str, Any]], bool]
+# ``check(state)``: runs once after every entity has been through the rules.
+DocumentCheck = Callable[[Dict[str, Any]], None]
+
+
+class RuleEngine:
+    """Registered post-processing rules fused into a single pass.
+
+    Each entity runs through the chain of rules registered for its label,
+    in registration order, before the next entity is looked at, so adding a
+    rule adds no pass over the data.  Document-level checks run once at the
+    end over the shared ``state``.
+
+    Parameters
+    ----------
+    timed : bool
+        Accumulate the time spent in each rule and add it to the
+        ``lexiscan_rule_seconds_total{rule}`` counter after every run.
+    """
+
+    def __init__(self, timed: bool = False):
+        self.timed = timed
+        self._rules: List[Tuple[str, Optional[FrozenSet[str]], EntityRule]] = []
+        self._checks: List[Tuple[str, DocumentCheck]] = []
+        self._chains: Dict[str, Tuple[Tuple[str, EntityRule], ...]] = {}
+
+    def register(
+        self,
+        name: str,
+        rule: EntityRule,
+        labels: Optional[Iterable[str]] = None,
+    ) -> EntityRule:
+        """Append *rule*, applied to entities whose label is in *labels* (all if ``None``)."""
+        self._rules.append((name, frozenset(labels) if labels is not None else None, rule))
+        self._chains = {}
+        return rule
+
+    def register_check(self, name: str, check: DocumentCheck) -> DocumentCheck:
+        """Append a document-level *check* run after all entity rules."""
+        self._checks.append((name, check))
+        return check
+
+    @property
+    def rule_names(self) -> List[str]:
+        return [name for name, _, _ in self._rules] + [name for name, _ in self._checks]
+
+    def _chain(self, label: str) -> Tuple[Tuple[str, EntityRule], ...]:
+        chain = self._chains.get(label)
+        if chain is None:
+            chain = tuple(
+                (name, rule) for name, labels, rule in self._rules
+                if labels is None or label in labels
+            )
+            self._chains[label] = chain
+        return chain
+
+    def apply(self, entities: Sequence[EntityLike]) -> List[Entity]:
+        """Run every rule over *entities* in one pass; returns the kept entities."""
+        state: Dict[str, Any] = {}
+        kept: List[Entity] = []
+        timings: Optional[Dict[str, float]] = {} if self.timed else None
+
+        for ent in entities:
+            ent = Entity.coerce(ent)
+            for name, rule in self._chain(ent.label):
+                if timings is None:
+                    keep = rule(ent, state)
+                else:
+                    start = time.perf_counter()
+                    keep = rule(ent, state)
+                    timings[name] = timings.get(name, 0.0) + time.perf_counter() - start
+                if not keep:
+                    break
+            else:
+                kept.append(ent)
+
+        for name, check in self._checks:
+            start = time.perf_counter()
+            check(state)
+            if timings is not None:
+                timings[name] = timings.get(name, 0.0) + time.perf_counter() - start
+
+        if timings:
+            for name, seconds in timings.items():
+                RULE_SECONDS.inc(seconds, rule=name)
+        return kept
+
+
+RULES = RuleEngine(timed=os.environ.get("LEXISCAN_RULE_TIMING", "0") == "1")
+RULES.register("sanitize", _sanitize_rule)
+RULES.register("normalize_date", _normalise_date_rule, labels={"DATE"})
+RULES.register("normalize_amount", _normalise_amount_rule, labels={"AMOUNT"})
+RULES.register_check("date_order", _check_date_order)
 
 
 # ───────────────────────────────────────────────────────────────────────────
 #  Master pipeline
 # ───────────────────────────────────────────────────────────────────────────
 
+GROUP_LABELS = ("DATE", "PARTY", "AMOUNT", "JURISDICTION")
+
+
 def apply_all_rules(
     entities: List[Dict[str, Any]],
 ) -> List[Dict[str, Any]]:
     """Run the full post-processing pipeline on a list of entities.
 
-    Pipeline order:
+    The rules registered on :data:`RULES` run as one fused pass:
     1. Sanitise (remove noise).
     2. Normalise dates → ISO-8601.
     3. Normalise amounts → numeric.
     4. Validate date logic.
     """
-    entities = sanitize_entities(entities)
-    entities = validate_dates(entities)
-    entities = normalize_amounts(entities)
-    return entities
+    return _run_on_dicts(entities, apply_rules_to_records)
+
+
+def apply_rules_to_records(records: Sequence[Entity]) -> List[Entity]:
+    """:func:`apply_all_rules` over ``Entity`` records, updated in place."""
+    with time_stage("rules"):
+        return RULES.apply(records)
 
 
 def group_entities(
-    entities: List[Dict[str, Any]],
+    entities: Sequence[EntityLike],
 ) -> Dict[str, List[str]]:
     """Group validated entities by label into the final response format.
 
+    Values keep their first-seen order; duplicates are detected with a set
+    per label.
+
     Returns
     -------
     dict
         ``{"DATE": [...], "PARTY": [...], "AMOUNT": [...], "JURISDICTION": [...]}``
     """
-    grouped: Dict[str, List[str]] = {
-        "DATE": [],
-        "PARTY": [],
-        "AMOUNT": [],
-        "JURISDICTION": [],
-    }
+    grouped: Dict[str, List[str]] = {label: [] for label in GROUP_LABELS}
+    seen: Dict[str, Set[str]] = {label: set() for label in GROUP_LABELS}
     for ent in entities:
         label = ent.get("entity", "")
         value = ent.get("value", "")
-        if label in grouped and value and value not in grouped[label]:
+        if label in seen and value and value not in seen[label]:
+            seen[label].add(value)
             grouped[label].append(value)
     return grouped
 
@@ -1,12 +1,75 @@
 from fastapi.testclient import TestClient
+import asyncio
+import json
+import multiprocessing
 import os
+import signal
+import subprocess
+import sys
 import tempfile
+import threading
+import time
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
 import fitz
+import pytest
 
+import api.app as app_module
+import api.worker_pool as worker_pool
+import ocr.ocr_engine as ocr_engine
 from api.app import app
+from api.jobs import JobStore, _worker_id, process_next_job, start_worker_process, stop_workers
+from api.worker_pool import ExtractionPool, PoolSaturatedError, set_worker_engine
+from ocr.ocr_engine import extract_text_from_bytes
 
 client = TestClient(app)
 
+class FakeEngine:
+    """Stand-in NER engine: the first two words of every line are a PARTY."""
+
+    def extract_grouped(self, text):
+        return {"PARTY": [" ".join(line.split()[:2]) for line in text.splitlines() if line.strip()]}
+
+    def extract_grouped_many(self, texts):
+        return [self.extract_grouped(text) for text in texts]
+
+@pytest.fixture
+def fake_engine():
+    """Install a FakeEngine as the in-process worker engine."""
+    engine = FakeEngine()
+    set_worker_engine(engine)
+    yield engine
+    set_worker_engine(None)
+
+@pytest.fixture
+def make_pool():
+    """Build extraction pools (thread mode by default), shut down after the test."""
+    pools = []
+
+    def make(**kwargs):
+        pools.append(ExtractionPool(**{"mode": "thread", **kwargs}))
+        return pools[-1]
+
+    yield make
+    for pool in pools:
+        pool.shutdown()
+
+@pytest.fixture
+def pool(make_pool, fake_engine, monkeypatch):
+    """A thread pool running FakeEngine, installed as the API's pipeline pool."""
+    pool = make_pool(workers=2)
+    monkeypatch.setattr(app_module, "ner_engine", object())
+    monkeypatch.setattr(app_module, "pipeline_pool", pool)
+    return pool
+
+@pytest.fixture
+def release():
+    """Event that blocked pool tasks wait on; always set at teardown."""
+    event = threading.Event()
+    yield event
+    event.set()
+
 def create_dummy_pdf(path: str, text: str):
     doc = fitz.open()
     page = doc.new_page()
@@ -32,3 +95,367 @@ def test_extract_endpoint_invalid_file_type():
         os.remove(tf.name)
 
 # We skip a full /extract functional test without a loaded mock NER model since it's hard to mock global variables in the TestClient dynamically from here.
+
+def test_extraction_pool_rejects_when_saturated(make_pool, release):
+    pool = make_pool(workers=1, max_inflight=1, retry_after=7)
+
+    async def scenario():
+        blocked = asyncio.ensure_future(pool.run(release.wait))
+        await asyncio.sleep(0.05)
+        with pytest.raises(PoolSaturatedError) as excinfo:
+            await pool.run(lambda: None)
+        assert excinfo.value.retry_after == 7
+        release.set()
+        assert await blocked is True
+        assert pool.inflight == 0
+
+    asyncio.run(scenario())
+
+def test_extract_endpoint_busy_returns_retry_after(monkeypatch):
+    class SaturatedPool:
+        def stats(self):
+            return {}
+
+        async def run(self, fn, *args, cost=1.0):
+            raise PoolSaturatedError(retry_after=3)
+
+    monkeypatch.setattr(app_module, "ner_engine", object())
+    monkeypatch.setattr(app_module, "pipeline_pool", SaturatedPool())
+
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tf:
+        temp_path = tf.name
+    try:
+        create_dummy_pdf(temp_path, "Busy test")
+        with open(temp_path, "rb") as f:
+            response = client.post("/extract", files={"file": ("busy.pdf", f, "application/pdf")})
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "3"
+    finally:
+        os.remove(temp_path)
+
+def test_extraction_pool_schedules_cheap_documents_first(make_pool, release):
+    pool = make_pool(workers=1, max_inflight=4, cost_weight=0.05)
+    order = []
+
+    async def scenario():
+        blocked = asyncio.ensure_future(pool.run(release.wait))
+        await asyncio.sleep(0.05)
+        big = pool.submit(order.append, "big scan", cost=300.0)
+        small = pool.submit(order.append, "small digital", cost=2.0)
+        assert pool.stats()["pending"] == 2
+        release.set()
+        await asyncio.gather(blocked, big, small)
+        assert pool.inflight == 0
+
+    asyncio.run(scenario())
+    assert order == ["small digital", "big scan"]
+
+def test_extraction_pool_keeps_a_worker_for_small_tasks(make_pool, release):
+    pool = make_pool(workers=2, max_inflight=8, large_cost=100.0)
+
+    async def scenario():
+        scans = [pool.submit(release.wait, cost=300.0) for _ in range(3)]
+        await asyncio.sleep(0.05)
+        assert pool.stats()["running_large"] == 1
+        # Runs on the reserved worker while the big scans hold or await the other
+        small = pool.submit(lambda: "small digital", cost=2.0)
+        assert await asyncio.wait_for(small, timeout=5) == "small digital"
+        release.set()
+        await asyncio.gather(*scans)
+        assert pool.inflight == 0
+
+    asyncio.run(scenario())
+
+def test_extraction_pool_cleanup_waits_for_the_task(make_pool, release):
+    pool = make_pool(workers=1, max_inflight=4)
+    cleaned = []
+
+    async def scenario():
+        running = pool.submit(release.wait, cleanup=lambda: cleaned.append("running"))
+        queued = pool.submit(lambda: None, cleanup=lambda: cleaned.append("queued"))
+        await asyncio.sleep(0.05)
+        # The client goes away: both futures are cancelled
+        running.cancel()
+        queued.cancel()
+        await asyncio.sleep(0.05)
+        assert cleaned == []  # the running task may still be reading its input
+        release.set()
+        while len(cleaned) < 2:
+            await asyncio.sleep(0.01)
+        assert pool.inflight == 0
+
+    asyncio.run(scenario())
+    assert cleaned == ["running", "queued"]
+
+def _kill_current_process():
+    os.kill(os.getpid(), signal.SIGKILL)
+
+def test_extraction_pool_recovers_from_killed_worker(make_pool, monkeypatch):
+    # Forked workers inherit a stand-in engine instead of loading models
+    monkeypatch.setattr(worker_pool, "_worker_engine", object())
+    pool = make_pool(mode="process", workers=1)
+
+    async def scenario():
+        with pytest.raises(BrokenProcessPool):
+            await pool.run(_kill_current_process)
+        # Later requests run on a rebuilt pool instead of failing forever
+        assert await pool.run(os.getpid) != os.getpid()
+        assert pool.inflight == 0
+
+    asyncio.run(scenario())
+
+def test_extract_endpoint_rejects_over_cost_limit(pool):
+    pool.max_cost = 0.5
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tf:
+        temp_path = tf.name
+    try:
+        create_dummy_pdf(temp_path, "Cost limit test")
+        with open(temp_path, "rb") as f:
+            response = client.post("/extract", files={"file": ("big.pdf", f, "application/pdf")})
+        assert response.status_code == 413
+        assert pool.inflight == 0
+    finally:
+        os.remove(temp_path)
+
+def test_extract_batch_endpoint(pool):
+    paths = []
+    try:
+        for name in ("Alpha", "Beta"):
+            with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tf:
+                paths.append(tf.name)
+            create_dummy_pdf(paths[-1], f"{name} Holdings master services agreement")
+
+        handles = [open(p, "rb") for p in paths]
+        try:
+            files = [
+                ("files", (f"{i}.pdf", h, "application/pdf"))
+                for i, h in enumerate(handles)
+            ]
+            response = client.post("/extract/batch", files=files)
+        finally:
+            for h in handles:
+                h.close()
+
+        assert response.status_code == 200
+        body = response.json()
+        assert [r["filename"] for r in body] == ["0.pdf", "1.pdf"]
+        assert [r["entities"]["PARTY"] for r in body] == [["Alpha Holdings"], ["Beta Holdings"]]
+    finally:
+        for p in paths:
+            os.remove(p)
+
+def test_extraction_pool_batch_follow_up_keeps_its_slot(make_pool, release):
+    pool = make_pool(workers=3, max_inflight=2)
+    other = threading.Event()
+
+    async def scenario():
+        batch = asyncio.ensure_future(pool.run_batch(
+            lambda n: (n == 2 or release.wait()) and n * 10, [(1,), (2,)], then=sum,
+        ))
+        await asyncio.sleep(0.05)
+        # A request takes the slot the finished call gave back: pool is full
+        blocked = asyncio.ensure_future(pool.run(other.wait))
+        await asyncio.sleep(0.05)
+        assert pool.inflight == 2
+        release.set()
+        # ... yet the follow-up still runs, on the slot the batch kept
+        assert await batch == ([10, 20], 30)
+        other.set()
+        await blocked
+        assert pool.inflight == 0
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        other.set()
+
+def test_extract_text_endpoints_skip_ocr(pool):
+    response = client.post("/extract/text", json={
+        "text": "Acme   Corp agrees to pay.\n\n\n\nSigned.",
+        "filename": "export.docx",
+        "document_id": "doc-1",
+    })
+    assert response.status_code == 200
+    body = response.json()
+    assert body["document_id"] == "doc-1"
+    assert body["filename"] == "export.docx"
+    assert body["entities"] == {"PARTY": ["Acme Corp", "Signed."]}
+    assert body["metrics"]["word_count"] == 6
+
+    response = client.post("/extract/text/batch", json=[
+        {"text": "Alpha Holdings"}, {"text": "Beta Industries"},
+    ])
+    assert response.status_code == 200
+    assert [r["entities"]["PARTY"] for r in response.json()] == [["Alpha Holdings"], ["Beta Industries"]]
+
+def test_text_cost_limit_does_not_suggest_jobs(pool, monkeypatch):
+    pool.max_cost = 0.5
+    monkeypatch.setattr(app_module, "result_cache", None)
+    response = client.post("/extract/text/batch", json=[{"text": "Alpha Holdings"}])
+    assert response.status_code == 413
+    assert "/jobs" not in response.json()["detail"]
+
+def test_job_store_recovers_stale_jobs(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.sqlite"), stale_after=0.0, max_attempts=2)
+    job_id = store.submit("lease.pdf", b"%PDF-fake")
+
+    assert store.claim("worker-a")["job_id"] == job_id
+    assert store.get(job_id)["status"] == "running"
+
+    # worker-a died: the job is handed to the next worker that polls
+    assert store.claim("worker-b")["job_id"] == job_id
+    # ...and after max_attempts it is given up on
+    assert store.claim("worker-c") is None
+    assert store.get(job_id)["status"] == "failed"
+    store.close()
+
+def test_stop_workers_requeues_their_running_jobs(tmp_path):
+    db_path = str(tmp_path / "jobs.sqlite")
+    store = JobStore(db_path)
+    job_id = store.submit("lease.pdf", b"%PDF-fake")
+    proc = start_worker_process(time.sleep, (60,))
+    assert store.claim(_worker_id(proc.pid))["job_id"] == job_id
+
+    stop_workers([proc], db_path)
+
+    assert not proc.is_alive()
+    assert store.get(job_id)["status"] == "queued"
+    assert store.get(job_id)["attempts"] == 0  # a deliberate stop costs no attempt
+    store.close()
+
+class _WidthTesseract:
+    @staticmethod
+    def image_to_string(img):
+        return f"scan {img.width}"
+
+def _process_job_in_worker(db_path, results):
+    """Job-worker body: run one job with two page workers."""
+    os.environ["LEXISCAN_OCR_PAGE_WORKERS"] = "2"
+    os.environ["LEXISCAN_OCR_BACKEND"] = "pytesseract"
+    ocr_engine._load_pytesseract = lambda: _WidthTesseract
+    ocr_engine._PAGE_POOL_CONTEXT = "fork"
+    ocr_engine._page_cache = False
+    set_worker_engine(FakeEngine())
+
+    processed = process_next_job(JobStore(db_path), "test-worker")
+    # A failed page pool is dropped before falling back to serial OCR
+    results.put((processed, sorted(ocr_engine._page_pools)))
+    for pool in ocr_engine._page_pools.values():
+        pool.shutdown()
+
+def test_job_worker_can_run_parallel_page_ocr(tmp_path):
+    doc = fitz.open()
+    for width in (100, 200, 300):
+        doc.new_page(width=width, height=100)
+    payload = doc.tobytes()
+    doc.close()
+
+    db_path = str(tmp_path / "jobs.sqlite")
+    store = JobStore(db_path)
+    job_id = store.submit("scan.pdf", payload, dpi=72)
+
+    results = multiprocessing.Queue()
+    proc = start_worker_process(_process_job_in_worker, (db_path, results))
+    try:
+        assert results.get(timeout=60) == (True, [2])
+    finally:
+        proc.join(30)
+
+    job = store.get(job_id)
+    assert job["status"] == "done"
+    assert job["result"]["entities"]["PARTY"] == ["scan 100", "scan 200", "scan 300"]
+
+def test_jobs_endpoint_roundtrip(tmp_path, fake_engine, monkeypatch):
+    store = JobStore(str(tmp_path / "jobs.sqlite"))
+    monkeypatch.setattr(app_module, "job_store", store)
+
+    pdf_path = str(tmp_path / "contract.pdf")
+    create_dummy_pdf(pdf_path, "Acme Corp services agreement, long enough to skip OCR.")
+    try:
+        with open(pdf_path, "rb") as f:
+            response = client.post("/jobs", files={"file": ("contract.pdf", f, "application/pdf")})
+        assert response.status_code == 202
+        job_id = response.json()["job_id"]
+        assert response.json()["status"] == "queued"
+
+        worker_store = JobStore(store.db_path)
+        assert process_next_job(worker_store, "test-worker") is True
+        worker_store.close()
+
+        response = client.get(f"/jobs/{job_id}", params={"wait": 1})
+        body = response.json()
+        assert body["status"] == "done"
+        assert body["result"]["document_id"] == job_id
+        assert body["result"]["entities"]["PARTY"] == ["Acme Corp"]
+
+        assert client.get("/jobs/unknown").status_code == 404
+    finally:
+        store.close()
+
+def test_extract_stream_emits_pages_then_result(tmp_path, pool):
+    doc = fitz.open()
+    for text in ("Acme Corp master agreement page one text", "Second page of the agreement text"):
+        doc.new_page().insert_text((50, 50), text)
+    pdf_path = str(tmp_path / "two_pages.pdf")
+    doc.save(pdf_path)
+    doc.close()
+
+    with open(pdf_path, "rb") as f:
+        response = client.post(
+            "/extract/stream",
+            params={"page_entities": "true"},
+            files={"file": ("two_pages.pdf", f, "application/pdf")},
+        )
+    assert response.status_code == 200
+    events = [json.loads(line) for line in response.text.splitlines()]
+
+    pages = [e for e in events if e["event"] == "page"]
+    assert [(e["page"], e["total_pages"]) for e in pages] == [(1, 2), (2, 2)]
+    assert pages[0]["entities"]["PARTY"] == ["Acme Corp"]
+    assert pages[1]["entities"]["PARTY"] == ["Second page"]
+
+    final = events[-1]
+    assert final["event"] == "result"
+    assert final["filename"] == "two_pages.pdf"
+    assert final["entities"]["PARTY"] == ["Acme Corp", "Second page"]
+    assert set(final["metrics"]) == {"text_length", "word_count", "noise_ratio", "alpha_ratio"}
+
+def test_metrics_endpoint_reports_pipeline_stages():
+    doc = fitz.open()
+    doc.new_page().insert_text((50, 50), "Indemnification clause for the metrics test")
+    extract_text_from_bytes(doc.tobytes())
+    doc.close()
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert "# TYPE lexiscan_stage_duration_seconds histogram" in body
+    assert 'lexiscan_stage_duration_seconds_count{stage="pdf_text"}' in body
+    assert "lexiscan_pages_processed_total " in body
+
+def test_readiness_requires_warm_models(monkeypatch):
+    response = client.get("/ready")
+    assert response.status_code == 503
+    assert response.json()["ready"] is False
+
+    monkeypatch.setattr(app_module, "ner_engine", object())
+    monkeypatch.setattr(app_module, "pipeline_pool", object())
+    assert client.get("/ready").status_code == 503  # loaded, not yet warmed up
+
+    monkeypatch.setattr(app_module, "models_warm", True)
+    response = client.get("/ready")
+    assert response.status_code == 200
+    assert response.json()["ready"] is True
+
+
+def test_importing_api_does_not_load_heavy_dependencies():
+    code = (
+        "import sys, api.app, main; "
+        "print([m for m in ('spacy', 'fitz', 'pytesseract', 'PIL') if m in sys.modules])"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=Path(__file__).resolve().parent.parent,
+        capture_output=True, text=True, check=True,
+    ).stdout
+    assert out.strip().splitlines()[-1] == "[]"
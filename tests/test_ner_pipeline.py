@@ -1,4 +1,21 @@
-from rules.validators import apply_all_rules, group_entities, normalize_amount, normalize_date
+import inspect
+import json
+import pickle
+
+import pytest
+import spacy
+
+from ner.export import REPORT_NAME, export_serving_model
+from ner.inference import (
+    DEFAULT_MODEL_DIR, NERInference, SpanIndex, _window_bounds, load_pipeline, pipeline_excludes,
+)
+from rules.entity import Entity
+from rules.matchers import find_entities
+from rules.validators import (
+    RuleEngine, _try_parse_date, apply_all_rules, apply_rules_to_records, group_entities,
+    normalize_amount, normalize_amounts, normalize_date, sanitize_entities, validate_dates,
+)
+from utils.metrics import NER_FALLBACK, RULE_SECONDS
 
 def test_normalize_amount():
     assert normalize_amount("$50,000.00") == "50000.00"
@@ -10,6 +27,22 @@ def test_normalize_date():
     assert normalize_date("October 12, 2023") == "2023-10-12"
     assert normalize_date("10/12/2023") == "2023-10-12"
 
+def test_normalize_date_single_pass_formats_and_memo():
+    assert normalize_date("12.10.2023") == "2023-10-12"
+    assert normalize_date("12-10-2023") == "2023-10-12"
+    assert normalize_date("Sept 5th, 2023") == "2023-09-05"
+    assert normalize_date("12th day of October, 2023") == "2023-10-12"
+    assert normalize_date("effective as of Oct. 1, 2024") == "2024-10-01"
+    assert normalize_date(" 13/45/2023 ") == "13/45/2023"
+
+    hits = _try_parse_date.cache_info().hits
+    normalize_date("12.10.2023")
+    assert _try_parse_date.cache_info().hits == hits + 1
+
+def test_normalize_date_fallback_does_not_depend_on_today():
+    pytest.importorskip("dateutil")
+    assert normalize_date("October 2023") == "2023-10-01"
+
 def test_apply_all_rules():
     raw_entities = [
         {"entity": "DATE", "value": "Oct 12 2023", "start_char": 0, "end_char": 11},
@@ -47,3 +80,277 @@ def test_group_entities():
     assert "Acme Corp" in grouped["PARTY"]
     assert grouped["AMOUNT"] == ["50000.00"]
     assert grouped["JURISDICTION"] == ["New York"]
+
+def test_entity_record_is_slotted_and_dict_compatible():
+    ent = Entity("DATE", " Oct 12 2023 ", 0, 13)
+    assert not hasattr(ent, "__dict__")
+    assert ent["entity"] == ent.get("entity") == "DATE"
+    ent["value"] = ent.value.strip()
+    assert ent == {"entity": "DATE", "value": "Oct 12 2023", "start_char": 0, "end_char": 13}
+    assert pickle.loads(pickle.dumps(ent)) == ent
+
+    validated = apply_rules_to_records([ent, Entity("AMOUNT", "$5", 20, 22)])
+    assert [e.to_dict() for e in validated] == [
+        {"entity": "DATE", "value": "2023-10-12", "start_char": 0, "end_char": 13},
+        {"entity": "AMOUNT", "value": "5", "start_char": 20, "end_char": 22},
+    ]
+    assert validated[0] is ent
+
+def test_rule_functions_return_the_callers_dicts():
+    entities = [
+        {"entity": "DATE", "value": " Oct 12 2023 ", "start_char": 0, "end_char": 13},
+        {"entity": "PARTY", "value": ")", "start_char": 14, "end_char": 15},
+        {"entity": "AMOUNT", "value": "$5", "start_char": 20, "end_char": 22},
+    ]
+    validated = apply_all_rules(entities)
+    assert validated == [entities[0], entities[2]]
+    assert all(type(ent) is dict for ent in validated)
+    assert validated[0] is entities[0] and entities[0]["value"] == "2023-10-12"
+    json.dumps(validated)
+
+    amount = {"entity": "AMOUNT", "value": "USD 1,234.56"}
+    assert normalize_amounts([amount]) == [amount] and amount["value"] == "1234.56"
+    date = {"entity": "DATE", "value": "October 12, 2023"}
+    assert validate_dates([date])[0] is date and date["value"] == "2023-10-12"
+    assert sanitize_entities([{"entity": "PARTY", "value": "  "}]) == []
+
+def test_version_for_matches_engine_defaults():
+    init = inspect.signature(NERInference.__init__).parameters
+    for name, param in inspect.signature(NERInference.version_for).parameters.items():
+        assert param.default == init[name].default, name
+    assert NERInference.version_for(fallback_policy="per-label-missing", chunk_chars=0, use_matcher=False) \
+        == NERInference.version_for(use_matcher=False, chunk_chars=None) + "|fallback=per-label-missing"
+
+def test_rule_engine_fuses_rules_into_one_pass():
+    calls = []
+
+    def upper(ent, state):
+        calls.append(("upper", ent.value))
+        ent.value = ent.value.upper()
+        return True
+
+    def drop_short(ent, state):
+        calls.append(("drop_short", ent.value))
+        state["seen"] = state.get("seen", 0) + 1
+        return len(ent.value) > 2
+
+    engine = RuleEngine(timed=True)
+    engine.register("drop_short", drop_short)
+    engine.register("upper", upper, labels={"PARTY"})
+    engine.register_check("count", lambda state: calls.append(("count", state["seen"])))
+
+    kept = engine.apply([Entity("PARTY", "acme"), {"entity": "DATE", "value": "x"}, Entity("PARTY", "jo")])
+    assert kept == [Entity("PARTY", "ACME")]
+    # Entity by entity, rule by rule; a dropped entity skips its remaining rules
+    assert calls == [
+        ("drop_short", "acme"), ("upper", "acme"), ("drop_short", "x"), ("drop_short", "jo"), ("count", 3),
+    ]
+    assert 'lexiscan_rule_seconds_total{rule="upper"}' in "\n".join(RULE_SECONDS.render())
+
+
+def test_group_entities_dedups_in_first_seen_order():
+    values = [f"Party {i % 50}" for i in range(2000)]
+    grouped = group_entities([{"entity": "PARTY", "value": v} for v in values])
+    assert grouped["PARTY"] == [f"Party {i}" for i in range(50)]
+
+@pytest.fixture
+def ruler_engine():
+    """NERInference backed by a blank pipeline with a deterministic ruler."""
+    engine = NERInference(model_dir="__missing_model__")
+    nlp = spacy.blank("en")
+    ruler = nlp.add_pipe("entity_ruler")
+    ruler.add_patterns([
+        {"label": "PARTY", "pattern": "Acme Corp"},
+        {"label": "AMOUNT", "pattern": [{"TEXT": "$"}, {"LIKE_NUM": True}]},
+    ])
+    engine.custom_nlp = nlp
+    engine.base_nlp = None
+    return engine
+
+def test_extract_grouped_many_matches_single(ruler_engine):
+    engine = ruler_engine
+    texts = [
+        "Acme Corp shall pay $ 5,000 upon signature.",
+        "No entities here.",
+        "Payment of $ 12 by Acme Corp.",
+    ]
+
+    batched = engine.extract_grouped_many(texts, batch_size=2)
+
+    assert batched == [engine.extract_grouped(t) for t in texts]
+    assert batched[0]["PARTY"] == ["Acme Corp"]
+    assert batched[0]["AMOUNT"] == ["5000"]
+    assert batched[1]["PARTY"] == []
+
+def test_ner_profile_excludes_only_unneeded_components(tmp_path):
+    config = spacy.util.load_config(f"{DEFAULT_MODEL_DIR}/config.cfg", interpolate=False)
+    # The shipped NER embeds its own tok2vec, so nothing else is needed
+    assert pipeline_excludes(config, {"ner"}) == [
+        "tok2vec", "tagger", "parser", "senter", "attribute_ruler", "lemmatizer",
+    ]
+    # A component listening to the shared tok2vec keeps it
+    assert "tok2vec" not in pipeline_excludes(config, {"tagger"})
+
+    nlp = spacy.blank("en")
+    nlp.add_pipe("sentencizer")
+    nlp.add_pipe("entity_ruler", name="ner").add_patterns([{"label": "PARTY", "pattern": "Acme"}])
+    nlp.to_disk(tmp_path)
+
+    assert load_pipeline(tmp_path, "ner").pipe_names == ["ner"]
+    assert load_pipeline(tmp_path, "full").pipe_names == ["sentencizer", "ner"]
+
+
+def test_export_serving_model_keeps_only_ner(tmp_path):
+    nlp = spacy.blank("en")
+    nlp.add_pipe("sentencizer")
+    nlp.add_pipe("entity_ruler", name="ner").add_patterns([{"label": "PARTY", "pattern": "Acme Corp"}])
+    nlp("Strings interned by training runs that serving never needs.")
+    nlp.to_disk(tmp_path / "full")
+
+    texts = ["Acme Corp signed the lease.", "Nothing to see here."]
+    report = export_serving_model(str(tmp_path / "full"), str(tmp_path / "slim"), sample_texts=texts)
+
+    assert report["source"]["pipeline"] == ["sentencizer", "ner"]
+    assert report["export"]["pipeline"] == ["ner"]
+    assert report["export"]["pruned_strings"] > 0
+    assert report["export"]["size_bytes"] < report["source"]["size_bytes"]
+    assert report["identical_entities"]
+    assert json.loads((tmp_path / "slim" / REPORT_NAME).read_text()) == report
+
+    slim = spacy.load(tmp_path / "slim")
+    assert [(e.text, e.label_) for e in slim(texts[0]).ents] == [("Acme Corp", "PARTY")]
+
+def test_shared_doc_runs_both_models_on_one_tokenization(ruler_engine, monkeypatch):
+    engine = ruler_engine
+    base = spacy.blank("en")
+    base.add_pipe("entity_ruler").add_patterns([
+        {"label": "ORG", "pattern": "Acme Corp Ltd"},   # overlaps the custom PARTY
+        {"label": "PERSON", "pattern": "John Doe"},
+    ])
+    engine.base_nlp = base
+    assert engine._enable_doc_sharing()
+
+    def fail(text):
+        raise AssertionError("base model must not re-tokenize")
+    monkeypatch.setattr(base, "tokenizer", fail)
+
+    text = "Acme Corp Ltd and John Doe agree to pay $ 12."
+    raw = engine.extract_entities_raw(text)
+    assert [(e["entity"], e["value"]) for e in raw] == [
+        ("PARTY", "Acme Corp"), ("AMOUNT", "$ 12"), ("PARTY", "John Doe"),
+    ]
+    assert engine.extract_entities_raw_many([text, "Nothing."], batch_size=1) == [raw, []]
+
+def test_span_index_overlaps():
+    index = SpanIndex()
+    assert index.add(10, 20) and index.add(30, 40)
+    assert not index.add(15, 35)
+    assert index.overlaps(19, 21) and index.overlaps(0, 11) and index.overlaps(12, 13)
+    assert not index.overlaps(20, 30) and not index.overlaps(0, 10) and not index.overlaps(40, 50)
+
+@pytest.fixture
+def cascade_engine(ruler_engine):
+    """Factory for ruler-backed engines with a base model and a fallback policy."""
+    def make(policy, **kwargs):
+        engine = NERInference(model_dir="__missing_model__", fallback_policy=policy, **kwargs)
+        engine.custom_nlp = ruler_engine.custom_nlp
+        base = spacy.blank("en")
+        base.add_pipe("entity_ruler").add_patterns([
+            {"label": "PERSON", "pattern": "John Doe"},
+            {"label": "MONEY", "pattern": [{"TEXT": "$"}, {"LIKE_NUM": True}]},
+            {"label": "GPE", "pattern": "Texas"},
+            {"label": "GPE", "pattern": "Gotham"},
+        ])
+        engine.base_nlp = base
+        engine._enable_doc_sharing()
+        return engine
+    return make
+
+def test_cascade_per_label_missing_only_adds_missing_labels(cascade_engine):
+    engine = cascade_engine("per-label-missing")
+    NER_FALLBACK.drain()
+
+    raw = engine.extract_entities_raw("Acme Corp pays $ 12 to John Doe in Texas.")
+    # PARTY and AMOUNT came from the custom model; only JURISDICTION (and
+    # DATE) were missing, so John Doe is not taken from the base model.
+    assert [(e["entity"], e["value"]) for e in raw] == [
+        ("PARTY", "Acme Corp"), ("AMOUNT", "$ 12"), ("JURISDICTION", "Texas"),
+    ]
+    assert NER_FALLBACK.drain() == {("per-label-missing", "fired"): 1}
+
+def test_cascade_per_chunk_empty_runs_base_on_uncovered_chunks(cascade_engine):
+    engine = cascade_engine("per-chunk-empty", fallback_chunk_chars=40)
+    NER_FALLBACK.drain()
+
+    text = "Acme Corp signs for John Doe.\nWitnessed by John Doe in Gotham.\n"
+    raw = engine.extract_entities_raw(text)
+    assert [(e["entity"], e["value"], text[e["start_char"]:e["end_char"]]) for e in raw] == [
+        ("PARTY", "Acme Corp", "Acme Corp"),
+        ("PARTY", "John Doe", "John Doe"),
+        ("JURISDICTION", "Gotham", "Gotham"),
+    ]
+    assert raw[1]["start_char"] > text.index("\n")
+    assert NER_FALLBACK.drain() == {
+        ("per-chunk-empty", "skipped"): 1, ("per-chunk-empty", "fired"): 1,
+    }
+    assert engine.extract_entities_raw_many([text, text], batch_size=2) == [raw, raw]
+
+def test_chunked_inference_matches_whole_document(ruler_engine):
+    text = " ".join(
+        f"Clause {i}: Acme Corp shall pay $ {i}00 on demand." + ("\n" if i % 3 == 0 else "")
+        for i in range(40)
+    )
+    windows = _window_bounds(text, 120, 30)
+    assert len(windows) > 10
+    assert windows[0][2] == 0 and windows[-1][3] == len(text)
+    assert all(a[3] == b[2] for a, b in zip(windows, windows[1:]))
+    assert all(end - start <= 120 for start, end, _, _ in windows)
+
+    def key(entities):
+        return sorted((e["start_char"], e["end_char"], e["entity"], e["value"]) for e in entities)
+
+    engine = ruler_engine
+    engine.chunk_chars = None
+    expected = key(engine.extract_entities_raw(text))
+    assert len(expected) == 80
+    engine.chunk_chars, engine.chunk_overlap = 120, 30
+    assert key(engine.extract_entities_raw(text)) == expected
+    batched = engine.extract_entities_raw_many([text, "Acme Corp"], batch_size=4)
+    assert key(batched[0]) == expected
+    assert key(batched[1]) == [(0, 9, "PARTY", "Acme Corp")]
+
+def test_matchers_find_dates_amounts_and_jurisdictions():
+    text = (
+        "Effective October 12, 2023, Acme Corp pays $50,000.00 and USD 1,234.56 "
+        "under the laws of the State of New York; Washington may sign in texas."
+    )
+    assert [(m.label_, m.text) for m in find_entities(text)] == [
+        ("DATE", "October 12, 2023"),
+        ("AMOUNT", "$50,000.00"),
+        ("AMOUNT", "USD 1,234.56"),
+        ("JURISDICTION", "New York"),
+    ]
+    assert all(text[m.start_char:m.end_char] == m.text for m in find_entities(text))
+
+def test_matchers_keep_fractions_and_scale_words():
+    def amounts(text):
+        return [m.text for m in find_entities(text) if m.label_ == "AMOUNT"]
+
+    assert amounts("fee of $1.5 million") == ["$1.5 million"]
+    assert amounts("$1,250.5 monthly") == ["$1,250.5"]
+    assert amounts("USD 2.5 billion") == ["USD 2.5 billion"]
+    assert normalize_amount("$1.5 million") == "1500000"
+    assert normalize_amount("$5 million") == "5000000"
+    assert normalize_amount("USD 2.5 billion") == "2500000000"
+    assert normalize_amount("$1,250.5") == "1250.50"
+
+def test_matcher_spans_take_precedence_over_models(cascade_engine):
+    engine = cascade_engine("always")
+    text = "Acme Corp owes $ 12 on 10/12/2023 in Texas."
+    raw = engine.extract_entities_raw(text)
+    assert [(e["entity"], e["value"]) for e in raw] == [
+        ("PARTY", "Acme Corp"), ("AMOUNT", "$ 12"), ("DATE", "10/12/2023"), ("JURISDICTION", "Texas"),
+    ]
+
+    engine.use_matcher = False
+    assert ("DATE", "10/12/2023") not in [(e["entity"], e["value"]) for e in engine.extract_entities_raw(text)]
@@ -1,7 +1,17 @@
 import os
 import tempfile
 import fitz
-from ocr.ocr_engine import extract_text_from_pdf, clean_ocr_text, evaluate_text_quality
+import pytest
+from ocr.ocr_engine import (
+    clean_ocr_text,
+    discard_pdf_source,
+    estimate_pdf_cost,
+    evaluate_text_quality,
+    extract_text,
+    extract_text_from_bytes,
+    extract_text_from_pdf,
+    read_pdf_source,
+)
 
 def create_dummy_pdf(path: str, text: str):
     """Creates a basic text PDF for testing OCR extraction."""
@@ -38,3 +48,348 @@ def test_evaluate_text_quality():
     assert "text_length" in metrics
     assert metrics["text_length"] > 0
     assert metrics["noise_ratio"] > 0.0 # #&* added noise
+
+def create_dummy_pdf_bytes(text: str) -> bytes:
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((50, 50), text)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+def test_extract_text_from_bytes():
+    test_string = "Master Services Agreement"
+    text = extract_text_from_bytes(create_dummy_pdf_bytes(test_string))
+    assert test_string in text
+
+def test_estimate_pdf_cost_weights_scanned_pages():
+    doc = fitz.open()
+    doc.new_page().insert_text(
+        (50, 50), "This Agreement is made between Acme Corp and John Doe.",
+    )
+    doc.new_page()  # no native text: will need OCR
+    data = doc.tobytes()
+    doc.close()
+
+    estimate = estimate_pdf_cost(data, ocr_page_cost=10.0)
+    assert estimate.pages == 2
+    assert estimate.scanned_pages == 1
+    assert estimate.cost == 11.0
+
+def test_read_pdf_source_spills_above_threshold():
+    import io
+
+    data = create_dummy_pdf_bytes("Non-Disclosure Agreement between the parties")
+
+    in_memory = read_pdf_source(io.BytesIO(data), spill_threshold=len(data))
+    assert in_memory == data
+
+    spilled = read_pdf_source(io.BytesIO(data), spill_threshold=len(data) - 1)
+    try:
+        assert isinstance(spilled, str) and os.path.isfile(spilled)
+        assert extract_text(spilled) == extract_text(in_memory)
+    finally:
+        discard_pdf_source(spilled)
+    assert not os.path.exists(spilled)
+
+def test_result_cache_lru_and_disk_tier(tmp_path):
+    from utils.cache import ResultCache, make_cache_key
+
+    db_path = str(tmp_path / "cache.sqlite")
+    data = create_dummy_pdf_bytes("Lease Agreement")
+    key = make_cache_key(data, model="v1", dpi=300, force_ocr=False)
+
+    assert key != make_cache_key(data, model="v2", dpi=300, force_ocr=False)
+    assert key != make_cache_key(data, model="v1", dpi=150, force_ocr=False)
+
+    cache = ResultCache(max_entries=1, db_path=db_path)
+    assert cache.get(key) is None
+    cache.put(key, {"entities": {"PARTY": ["Acme Corp"]}})
+    cache.put("other", {"entities": {}})  # evicts *key* from memory
+    assert cache.stats()["evictions"] == 1
+    assert cache.get(key) == {"entities": {"PARTY": ["Acme Corp"]}}
+    cache.close()
+
+    reopened = ResultCache(max_entries=4, db_path=db_path)
+    assert reopened.get(key) == {"entities": {"PARTY": ["Acme Corp"]}}
+    stats = reopened.stats()
+    assert stats["hits"] == 1 and stats["disk_hits"] == 1 and stats["misses"] == 0
+    reopened.close()
+
+def test_ocr_processor_uses_cache(tmp_path, monkeypatch):
+    import ocr.ocr_engine as ocr_engine
+    from ocr.ocr_engine import OCRProcessor
+    from utils.cache import ResultCache
+
+    pdf_path = str(tmp_path / "doc.pdf")
+    create_dummy_pdf(pdf_path, "Employment Agreement for the position")
+
+    processor = OCRProcessor(cache=ResultCache())
+    first = processor.process_pdf(pdf_path)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("OCR should not run on a cache hit")
+
+    monkeypatch.setattr(ocr_engine, "extract_text_from_pdf", fail)
+    assert processor.process_pdf(pdf_path) == first
+    assert processor.cache.stats()["hits"] == 1
+
+    # Another OCR backend may read the same scan differently: new cache entry
+    class OtherBackend:
+        name = "tesserocr"
+
+    monkeypatch.undo()
+    monkeypatch.setattr(ocr_engine, "get_ocr_backend", lambda name=None: OtherBackend())
+    processor.process_pdf(pdf_path)
+    assert processor.cache.stats()["misses"] == 2
+
+def test_metrics_registry_drain_and_merge():
+    from utils.metrics import MetricsRegistry
+
+    worker = MetricsRegistry()
+    latency = worker.histogram("stage_seconds", "Stage latency.", ("stage",), buckets=(0.1, 1.0))
+    pages = worker.counter("pages_total", "Pages.")
+    latency.observe(0.05, stage="ocr")
+    latency.observe(0.5, stage="ocr")
+    pages.inc(3)
+
+    parent = MetricsRegistry()
+    parent.histogram("stage_seconds", "Stage latency.", ("stage",), buckets=(0.1, 1.0))
+    parent.counter("pages_total", "Pages.")
+    parent.merge(worker.drain())
+    parent.merge(worker.drain())  # already drained: no double counting
+
+    text = parent.render()
+    assert 'stage_seconds_bucket{stage="ocr",le="0.1"} 1' in text
+    assert 'stage_seconds_bucket{stage="ocr",le="+Inf"} 2' in text
+    assert 'stage_seconds_count{stage="ocr"} 2' in text
+    assert "pages_total 3" in text
+
+def test_parallel_page_ocr_reassembles_pages_in_order(monkeypatch, tmp_path):
+    import ocr.ocr_engine as ocr_engine
+
+    class FakeTesseract:
+        @staticmethod
+        def image_to_string(img):
+            return f"scanned page of width {img.width}"
+
+    # Forked page workers inherit the fake Tesseract
+    monkeypatch.setattr(ocr_engine, "_load_pytesseract", lambda: FakeTesseract)
+    monkeypatch.setenv("LEXISCAN_OCR_BACKEND", "pytesseract")
+    monkeypatch.setattr(ocr_engine, "_ocr_backends", {})
+    monkeypatch.setattr(ocr_engine, "_PAGE_POOL_CONTEXT", "fork")
+    monkeypatch.setattr(ocr_engine, "_page_pools", {})
+    monkeypatch.setattr(ocr_engine, "_page_cache", False)
+
+    doc = fitz.open()
+    for width in (100, 200, 300):
+        doc.new_page(width=width, height=100)
+    doc.insert_page(1, text="This page has plenty of native text to skip OCR entirely.")
+    data = doc.tobytes()
+    doc.close()
+
+    # Small payloads go to the page workers as bytes; larger ones are
+    # spilled once into LEXISCAN_SPILL_DIR and workers get the path
+    submitted = []
+    submit = ocr_engine._submit_page_ocr
+    monkeypatch.setattr(
+        ocr_engine, "_submit_page_ocr",
+        lambda source, *args: submitted.append(source) or submit(source, *args),
+    )
+
+    try:
+        serial = list(ocr_engine.iter_pdf_pages(data, dpi=72))
+        parallel = list(ocr_engine.iter_pdf_pages(data, dpi=72, page_workers=2))
+        monkeypatch.setenv("LEXISCAN_SPILL_THRESHOLD_MB", "0")
+        monkeypatch.setenv("LEXISCAN_SPILL_DIR", str(tmp_path))
+        spilled = list(ocr_engine.iter_pdf_pages(data, dpi=72, page_workers=2))
+    finally:
+        for pool in ocr_engine._page_pools.values():
+            pool.shutdown()
+
+    assert submitted[0] == data
+    assert isinstance(submitted[1], str) and os.path.dirname(submitted[1]) == str(tmp_path)
+    assert not os.path.exists(submitted[1])
+    assert parallel == spilled == serial
+    assert [page.ocr_used for page in parallel] == [True, False, True, True]
+    assert [page.text for page in parallel if page.ocr_used] == [
+        "scanned page of width 100", "scanned page of width 200", "scanned page of width 300",
+    ]
+
+def test_ocr_backend_selection_falls_back_to_pytesseract(monkeypatch):
+    import ocr.ocr_engine as ocr_engine
+
+    class FakeTesserocr(ocr_engine.OCRBackend):
+        name = "tesserocr"
+        created = 0
+
+        @classmethod
+        def available(cls):
+            return True
+
+        def __init__(self):
+            FakeTesserocr.created += 1
+
+        def image_to_string(self, img):
+            return "in-process"
+
+    monkeypatch.setattr(ocr_engine, "_ocr_backends", {})
+    monkeypatch.setattr(ocr_engine, "_load_pytesseract", lambda: object())
+    monkeypatch.setattr(ocr_engine, "_page_cache", False)
+    monkeypatch.setattr(ocr_engine.TesserocrBackend, "available", classmethod(lambda cls: False))
+
+    # Requested but not installed: pytesseract instead
+    assert isinstance(ocr_engine.get_ocr_backend("tesserocr"), ocr_engine.PytesseractBackend)
+    monkeypatch.setenv("LEXISCAN_OCR_BACKEND", "auto")
+    assert isinstance(ocr_engine.get_ocr_backend(), ocr_engine.PytesseractBackend)
+    with pytest.raises(ValueError):
+        ocr_engine.get_ocr_backend("easyocr")
+
+    # Installed: auto prefers it, and the engine is created once per process
+    monkeypatch.setattr(ocr_engine, "_ocr_backends", {})
+    monkeypatch.setitem(ocr_engine.OCR_BACKENDS, "tesserocr", FakeTesserocr)
+    monkeypatch.setattr(ocr_engine, "TesserocrBackend", FakeTesserocr)
+    doc = fitz.open()
+    doc.new_page(width=100, height=100)
+    page = doc.load_page(0)
+    assert ocr_engine._ocr_page(page, dpi=72).text == "in-process"
+    assert ocr_engine._ocr_page(page, dpi=72).text == "in-process"
+    assert FakeTesserocr.created == 1
+    doc.close()
+
+    # No Tesseract at all
+    monkeypatch.setattr(ocr_engine, "_ocr_backends", {})
+    monkeypatch.setattr(ocr_engine, "_load_pytesseract", lambda: None)
+    assert ocr_engine.get_ocr_backend("pytesseract") is None
+
+def test_adaptive_dpi_escalates_only_low_confidence_pages(monkeypatch):
+    import ocr.ocr_engine as ocr_engine
+    from utils.metrics import OCR_PAGE_CONFIDENCE, OCR_PAGE_DPI
+
+    # Confidence by rendered width: page 1 reads well at 72 dpi, page 2 needs 144
+    confidence = {100: 90.0, 200: 40.0, 400: 85.0}
+
+    class FakeBackend(ocr_engine.OCRBackend):
+        def image_to_data(self, img):
+            return f"width {img.width}", confidence[img.width]
+
+    monkeypatch.setattr(ocr_engine, "get_ocr_backend", lambda name=None: FakeBackend())
+    monkeypatch.setattr(ocr_engine, "_page_cache", False)
+
+    doc = fitz.open()
+    for width in (100, 200):
+        doc.new_page(width=width, height=100)
+    data = doc.tobytes()
+    doc.close()
+
+    OCR_PAGE_DPI.drain()
+    OCR_PAGE_CONFIDENCE.drain()
+    adaptive = ocr_engine.AdaptiveDPI(first_dpi=72, min_confidence=80.0)
+    pages = list(ocr_engine.iter_pdf_pages(data, dpi=144, adaptive=adaptive))
+
+    assert [(p.text, p.dpi, p.confidence) for p in pages] == [
+        ("width 100", 72, 90.0), ("width 400", 144, 85.0),
+    ]
+    assert OCR_PAGE_DPI.drain() == {("72",): 1, ("144",): 1}
+    assert set(OCR_PAGE_CONFIDENCE.drain()) == {("72",), ("144",)}
+
+def test_assemble_words_rebuilds_lines_and_mean_confidence():
+    from ocr.ocr_engine import _assemble_words
+
+    data = {
+        "text": ["", "Governing", "Law.", "", "New", "York", ""],
+        "conf": ["-1", "90", "80", "-1", "70", "60", "-1"],
+        "block_num": [1, 1, 1, 1, 2, 2, 2],
+        "par_num": [1, 1, 1, 1, 1, 1, 1],
+        "line_num": [0, 1, 1, 0, 1, 1, 0],
+    }
+    assert _assemble_words(data) == ("Governing Law.\n\nNew York", 75.0)
+    assert _assemble_words({key: [] for key in data}) == ("", None)
+
+def _scanned_pdf(image_png, padding_pages=0):
+    """A one-image 'scan', optionally after unrelated pages (shifting xrefs)."""
+    doc = fitz.open()
+    for i in range(padding_pages):
+        doc.new_page().insert_text((72, 72), f"Cover page {i}: this page carries native text.")
+    page = doc.new_page(width=200, height=100)
+    page.insert_image(page.rect, stream=image_png)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+def _png(color):
+    pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 20, 10), False)
+    pix.set_rect(pix.irect, color)
+    return pix.tobytes("png")
+
+def test_page_fingerprint_ignores_file_but_not_content():
+    from ocr.ocr_engine import page_fingerprint
+
+    def fingerprint(data):
+        doc = fitz.open(stream=data, filetype="pdf")
+        try:
+            return page_fingerprint(doc[-1])
+        finally:
+            doc.close()
+
+    gray, red = _png((128, 128, 128)), _png((255, 0, 0))
+    assert fingerprint(_scanned_pdf(gray)) == fingerprint(_scanned_pdf(gray, padding_pages=2))
+    assert fingerprint(_scanned_pdf(gray)) != fingerprint(_scanned_pdf(red))
+
+def test_page_cache_skips_tesseract_for_repeated_pages(monkeypatch, tmp_path):
+    import ocr.ocr_engine as ocr_engine
+    from utils.cache import ResultCache
+    from utils.metrics import PAGE_CACHE_EVENTS
+
+    calls = []
+
+    class FakeBackend(ocr_engine.OCRBackend):
+        name = "fake"
+
+        def image_to_string(self, img):
+            calls.append(img.size)
+            return "EXHIBIT A — standard terms"
+
+    monkeypatch.setattr(ocr_engine, "get_ocr_backend", lambda name=None: FakeBackend())
+    ocr_engine.set_page_cache(ResultCache(max_entries=8, db_path=str(tmp_path / "pages.sqlite")))
+    try:
+        gray = _png((128, 128, 128))
+        PAGE_CACHE_EVENTS.drain()
+        first = list(ocr_engine.iter_pdf_pages(_scanned_pdf(gray), dpi=72))
+        other_pdf = list(ocr_engine.iter_pdf_pages(_scanned_pdf(gray, padding_pages=1), dpi=72))
+        higher_dpi = list(ocr_engine.iter_pdf_pages(_scanned_pdf(gray), dpi=144))
+
+        assert first[0].text == other_pdf[-1].text == higher_dpi[0].text == "EXHIBIT A — standard terms"
+        assert calls == [(200, 100), (400, 200)]  # the second PDF never reached Tesseract
+        assert PAGE_CACHE_EVENTS.drain() == {("misses",): 2, ("hits",): 1}
+        assert ocr_engine.page_cache_stats()["hits"] == 1
+    finally:
+        monkeypatch.setattr(ocr_engine, "_page_cache", None)
+
+def test_page_cache_is_opt_in_and_rooted_at_an_absolute_path(monkeypatch, tmp_path):
+    import ocr.ocr_engine as ocr_engine
+
+    monkeypatch.delenv("LEXISCAN_PAGE_CACHE_PATH", raising=False)
+    monkeypatch.setattr(ocr_engine, "_page_cache", None)
+    assert ocr_engine._get_page_cache() is None
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("LEXISCAN_PAGE_CACHE_PATH", os.path.join("cache", "pages.sqlite"))
+    monkeypatch.setattr(ocr_engine, "_page_cache", None)
+    cache = ocr_engine._get_page_cache()
+    assert cache.db_path == str(tmp_path / "cache" / "pages.sqlite")
+    assert os.path.exists(cache.db_path)
+
+def test_render_page_image_is_grayscale_view_that_outlives_gc():
+    import gc
+    from ocr.ocr_engine import render_page_image
+
+    doc = fitz.open()
+    doc.new_page(width=200, height=100).insert_text((20, 50), "Exhibit A")
+    img = render_page_image(doc.load_page(0), dpi=144)
+    doc.close()
+    gc.collect()
+
+    assert img.mode == "L" and img.size == (400, 200)
+    assert img.format == "PPM"
+    assert min(img.tobytes()) < 128 < max(img.tobytes())  # ink on white
@@ -0,0 +1,220 @@
+"""
+LexiScan Auto — Content-Addressed Result Cache
+================================================
+Two-tier cache for extraction results keyed by the SHA-256 of the PDF bytes
+plus every setting that influences the output (model version, OCR DPI,
+``force_ocr`` …).
+
+* **Memory tier** — a bounded LRU (``OrderedDict``) in front of
+* **Disk tier** — an optional SQLite file that survives restarts and is
+  shared by every process pointing at the same path.
+
+Values must be JSON-serialisable.  If the SQLite file cannot be created
+(read-only filesystem, missing permissions) the cache degrades gracefully to
+memory-only instead of failing the request.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Union
+
+from utils.logger import configure_logger
+
+logger = configure_logger("LexiScanAuto.Cache")
+
+_HASH_CHUNK = 1024 * 1024  # 1 MB
+
+
+def make_cache_key(source: Union[str, bytes], **settings: Any) -> str:
+    """Build a cache key from PDF content and output-affecting settings.
+
+    Parameters
+    ----------
+    source : bytes | str
+        Raw PDF bytes, or a path to the PDF (hashed in streaming fashion).
+    **settings
+        Anything that changes the result, e.g. ``model="…", dpi=300``.
+
+    Returns
+    -------
+    str
+        ``"<sha256>|key=value|…"`` with settings in sorted order.
+    """
+    digest = hashlib.sha256()
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        digest.update(source)
+    else:
+        with open(source, "rb") as fh:
+            for chunk in iter(lambda: fh.read(_HASH_CHUNK), b""):
+                digest.update(chunk)
+
+    parts = [digest.hexdigest()]
+    parts.extend(f"{name}={settings[name]}" for name in sorted(settings))
+    return "|".join(parts)
+
+
+class ResultCache:
+    """Bounded in-memory LRU backed by an optional SQLite store.
+
+    Parameters
+    ----------
+    max_entries : int
+        Capacity of the in-memory LRU.
+    db_path : str, optional
+        SQLite file for the persistent tier.  ``None`` keeps memory only.
+    max_disk_entries : int, optional
+        Capacity of the persistent tier; least-recently-used rows are
+        evicted beyond it.  ``None`` leaves it unbounded.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        db_path: Optional[str] = None,
+        max_disk_entries: Optional[int] = None,
+    ):
+        self.max_entries = max(1, max_entries)
+        self.max_disk_entries = max_disk_entries
+        self.db_path = db_path
+
+        self._memory: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_evictions = 0
+
+        if db_path:
+            self._conn = self._open_db(db_path)
+
+    @classmethod
+    def from_env(cls) -> "ResultCache":
+        """Build a cache from ``LEXISCAN_CACHE_*`` environment variables.
+
+        ``LEXISCAN_CACHE_PATH`` set to an empty string disables the disk tier.
+        """
+        max_disk = os.environ.get("LEXISCAN_CACHE_MAX_DISK_ENTRIES")
+        return cls(
+            max_entries=int(os.environ.get("LEXISCAN_CACHE_MAX_ENTRIES", "256")),
+            db_path=os.environ.get(
+                "LEXISCAN_CACHE_PATH", os.path.join("data", "cache", "results.sqlite"),
+            ) or None,
+            max_disk_entries=int(max_disk) if max_disk else None,
+        )
+
+    # ── Persistent tier ──────────────────────────────────────────────
+
+    def _open_db(self, db_path: str) -> Optional[sqlite3.Connection]:
+        try:
+            parent = os.path.dirname(db_path)
+            if parent:
+                os.makedirs(parent, exist_ok=True)
+            conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " accessed REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_results_accessed ON results (accessed)")
+            conn.commit()
+            return conn
+        except (OSError, sqlite3.Error) as exc:
+            # Gracefully degrade — the memory tier still works
+            logger.warning(f"Could not open cache database {db_path}: {exc}; using memory only.")
+            return None
+
+    def _disk_get(self, key: str) -> Optional[Any]:
+        row = self._conn.execute(
+            "SELECT value FROM results WHERE key = ?", (key,),
+        ).fetchone()
+        if row is None:
+            return None
+        self._conn.execute(
+            "UPDATE results SET accessed = ? WHERE key = ?", (time.time(), key),
+        )
+        self._conn.commit()
+        return json.loads(row[0])
+
+    def _disk_put(self, key: str, value: Any) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO results (key, value, accessed) VALUES (?, ?, ?)",
+            (key, json.dumps(value), time.time()),
+        )
+        if self.max_disk_entries is not None:
+            cur = self._conn.execute(
+                "DELETE FROM results WHERE key IN ("
+                " SELECT key FROM results ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+                (self.max_disk_entries,),
+            )
+            self.disk_evictions += max(cur.rowcount, 0)
+        self._conn.commit()
+
+    # ── Public API ───────────────────────────────────────────────────
+
+    def _remember(self, key: str, value: Any) -> None:
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for *key*, or ``None`` on a miss."""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return self._memory[key]
+
+            if self._conn is not None:
+                try:
+                    value = self._disk_get(key)
+                except sqlite3.Error as exc:
+                    logger.warning(f"Cache read failed: {exc}")
+                    value = None
+                if value is not None:
+                    self._remember(key, value)
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return value
+
+            self.misses += 1
+            return None
+
+    def put(self, key: str, value: Any) -> None:
+        """Store *value* (JSON-serialisable) under *key* in both tiers."""
+        with self._lock:
+            self._remember(key, value)
+            if self._conn is not None:
+                try:
+                    self._disk_put(key, value)
+                except sqlite3.Error as exc:
+                    logger.warning(f"Cache write failed: {exc}")
+
+    def stats(self) -> Dict[str, int]:
+        """Hit / miss / eviction counters and current sizes."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "disk_evictions": self.disk_evictions,
+                "memory_entries": len(self._memory),
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
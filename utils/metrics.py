@@ -0,0 +1,293 @@
+"""
+LexiScan Auto — Pipeline Metrics
+==================================
+Minimal, dependency-free Prometheus instrumentation for the extraction
+pipeline.  Every module records into the single process-wide ``REGISTRY``
+through the metric objects declared at the bottom of this file, and the API
+renders it in the Prometheus text exposition format at ``GET /metrics``.
+
+Worker processes cannot write into the API's memory, so the worker pool
+ships each task's counter / histogram increments back with the result
+(``REGISTRY.drain()`` in the worker → ``REGISTRY.merge()`` in the API).
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+
+# Latency buckets (seconds) spanning sub-millisecond rules to multi-minute OCR
+LATENCY_BUCKETS = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0,
+)
+SIZE_BUCKETS = tuple(1024 * 2 ** i for i in range(0, 17, 2))  # 1 KB … 64 MB
+PAGE_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+CONFIDENCE_BUCKETS = (20, 40, 50, 60, 70, 80, 90, 95)
+
+
+def _format_labels(labelnames: Sequence[str], values: LabelValues, extra: str = "") -> str:
+    pairs = [f'{name}="{value}"' for name, value in zip(labelnames, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = ""
+    additive = True
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    """Monotonically increasing value per label set."""
+
+    kind = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def set(self, value: float, **labels: str) -> None:
+        """Mirror a total that is counted elsewhere (e.g. cache stats)."""
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return self._header() + [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+    def drain(self) -> Dict[LabelValues, float]:
+        with self._lock:
+            values, self._values = self._values, {}
+        return values
+
+    def merge(self, values: Dict[LabelValues, float]) -> None:
+        with self._lock:
+            for key, value in values.items():
+                self._values[key] = self._values.get(key, 0) + value
+
+
+class Gauge(Counter):
+    """Point-in-time value, set by the owner (never merged across processes)."""
+
+    kind = "gauge"
+    additive = False
+
+
+class Histogram(_Metric):
+    """Cumulative-bucket histogram per label set."""
+
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        # label values → [per-bucket counts..., sum, count]
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                series = self._values[key] = [0] * len(self.buckets) + [0.0, 0]
+            for idx, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[idx] += 1
+                    break
+            series[-2] += value
+            series[-1] += 1
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """Observe the wall-clock duration of the ``with`` block."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, list(series)) for key, series in self._values.items())
+        lines = self._header()
+        for key, series in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}"
+                )
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(series[-2])}")
+            lines.append(f"{self.name}_count{labels} {series[-1]}")
+        return lines
+
+    def drain(self) -> Dict[LabelValues, List[float]]:
+        with self._lock:
+            values, self._values = self._values, {}
+        return values
+
+    def merge(self, values: Dict[LabelValues, List[float]]) -> None:
+        with self._lock:
+            for key, incoming in values.items():
+                series = self._values.get(key)
+                if series is None:
+                    self._values[key] = list(incoming)
+                else:
+                    self._values[key] = [a + b for a, b in zip(series, incoming)]
+
+
+class MetricsRegistry:
+    """Named collection of metrics rendered together."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered.")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def drain(self) -> Dict[str, dict]:
+        """Take and zero all additive series — used inside pool workers."""
+        return {
+            name: metric.drain()
+            for name, metric in self._metrics.items()
+            if metric.additive
+        }
+
+    def merge(self, snapshot: Dict[str, dict]) -> None:
+        """Add a worker's drained series into this registry."""
+        for name, values in snapshot.items():
+            metric = self._metrics.get(name)
+            if metric is not None and values:
+                metric.merge(values)
+
+    def reset(self) -> None:
+        for metric in self._metrics.values():
+            metric.drain()
+
+
+REGISTRY = MetricsRegistry()
+
+# ── Pipeline metrics ─────────────────────────────────────────────────────
+
+STAGE_SECONDS = REGISTRY.histogram(
+    "lexiscan_stage_duration_seconds",
+    "Latency of individual pipeline stages.",
+    ("stage",),
+)
+PAGES_PROCESSED = REGISTRY.counter(
+    "lexiscan_pages_processed_total",
+    "PDF pages processed by the text extractor.",
+)
+OCR_FALLBACK_PAGES = REGISTRY.counter(
+    "lexiscan_ocr_fallback_pages_total",
+    "Pages with too little native text that fell back to Tesseract.",
+)
+OCR_PAGE_DPI = REGISTRY.counter(
+    "lexiscan_ocr_page_dpi_total",
+    "OCR'd pages by the resolution their text was taken from.",
+    ("dpi",),
+)
+OCR_PAGE_CONFIDENCE = REGISTRY.histogram(
+    "lexiscan_ocr_page_confidence",
+    "Mean Tesseract word confidence (0-100) of OCR'd pages, by chosen DPI (adaptive DPI).",
+    ("dpi",),
+    buckets=CONFIDENCE_BUCKETS,
+)
+PAGE_CACHE_EVENTS = REGISTRY.counter(
+    "lexiscan_page_cache_events_total",
+    "Page-level OCR cache hits and misses.",
+    ("event",),
+)
+DOCUMENT_BYTES = REGISTRY.histogram(
+    "lexiscan_document_size_bytes",
+    "Size of submitted PDF documents.",
+    buckets=SIZE_BUCKETS,
+)
+DOCUMENT_PAGES = REGISTRY.histogram(
+    "lexiscan_document_pages",
+    "Page count of processed PDF documents.",
+    buckets=PAGE_BUCKETS,
+)
+QUEUE_DEPTH = REGISTRY.gauge(
+    "lexiscan_queue_depth",
+    "Work waiting or running, by queue.",
+    ("queue",),
+)
+CACHE_EVENTS = REGISTRY.counter(
+    "lexiscan_cache_events_total",
+    "Extraction result cache hits, misses and evictions.",
+    ("event",),
+)
+NER_FALLBACK = REGISTRY.counter(
+    "lexiscan_ner_fallback_total",
+    "Documents or chunks checked by the en_core_web_sm fallback, by outcome.",
+    ("policy", "outcome"),
+)
+
+RULE_SECONDS = REGISTRY.counter(
+    "lexiscan_rule_seconds_total",
+    "Time spent in each post-processing rule (LEXISCAN_RULE_TIMING=1).",
+    ("rule",),
+)
+
+
+def time_stage(stage: str):
+    """Context manager recording the duration of *stage*."""
+    return STAGE_SECONDS.time(stage=stage)